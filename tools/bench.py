@@ -0,0 +1,370 @@
+"""
+Time the site build on a fixed corpus and check every locale page against
+page-weight budgets, so a regression (say a new 900 KB banner) fails before
+deploy instead of after.
+
+Timings (milliseconds, best of `--repeat` runs, outputs go to a scratch dir):
+  * translate: `PageTemplate.render` for every locale page (the rules only);
+  * render: `translate_pages.render_site(force=True)`, the full page build
+    with image markup, font subsets and critical CSS;
+  * images.decode / images.composite / images.encode / images.variants: the
+    convert_images.py stages for every file of `--corpus` (open + load,
+    flatten over the background, JPEG encode, WebP width ladder);
+  * compress: `compress_site.build_asset` for every deployable text file.
+
+Page metrics, for every locale page in `--pages-dir`, as a browser with a
+VIEWPORT_WIDTH-wide window would load it (noscript fallbacks ignored). URLs
+resolve against `--pages-dir`, so a built bundle is measured with its own
+files:
+  * html_bytes: the page itself;
+  * image_bytes / image_max_bytes: every image the page loads and the
+    largest one. `<picture>` takes its first `<source>` (the best format),
+    `srcset` the smallest candidate covering the slot from `sizes`; images
+    the inline script builds from IMG_CONFIG count when their container
+    is empty in the markup, screenshots deferred to `data-src` until the
+    visitor interacts (image_markup.GALLERY_LOADER) do not;
+  * requests: the page plus every distinct stylesheet, script, icon, font
+    and image URL it fetches (external URLs count, with 0 bytes);
+  * lcp_bytes: the critical path (HTML and render-blocking local CSS, see
+    critical_css.critical_path) plus the banner image, the LCP element of
+    every locale page.
+
+`--output` writes timings and metrics as JSON; `--compare` prints the change
+against an earlier file. Budgets are BUDGETS below, overridden per key by
+`--budgets FILE` (`{"pages": {metric: limit}, "timings": {stage: ms}}`).
+Any page or stage over its budget is listed and the exit status is 1; so is
+any local image a page loads that is missing from `--pages-dir`.
+
+Usage:
+  python tools/bench.py [--site-dir .] [--pages-dir DIR] [--corpus images/en] [--repeat 3]
+                        [--output bench.json] [--compare old.json] [--budgets budgets.json] [--no-timings]
+
+Options:
+  --site-dir      Directory holding lovemarble.html, css/ and images/, for the timings (default: .)
+  --pages-dir     Directory holding the locale pages to measure and their assets (default: --site-dir)
+  --corpus        Image folder timed by the images.* stages (default: images/en)
+  --repeat        Runs per timed stage; the fastest is kept (default: 3)
+  --output        Write the results as JSON to this path
+  --compare       Print the change against an earlier --output file
+  --budgets       JSON file overriding BUDGETS
+  --no-timings    Only measure the pages and check their budgets
+"""
+
+import argparse
+import html
+import json
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+import compress_site
+import convert_images
+import critical_css
+import image_markup
+import locales
+import site_assets
+import translate_pages
+
+VIEWPORT_WIDTH = 1440
+# Limits per locale page; a banner of 900 KB blows lcp_bytes and image_max_bytes
+BUDGETS = {
+    'pages': {
+        'html_bytes': 60_000,
+        'image_bytes': 2_500_000,
+        'image_max_bytes': 400_000,
+        'requests': 25,
+        'lcp_bytes': 450_000,
+    },
+    'timings': {},
+}
+
+PICTURE_RE = re.compile(r'<picture\b[^>]*>(.*?)</picture>', re.S)
+IMG_RE = re.compile(r'<img\b[^>]*>')
+SOURCE_RE = re.compile(r'<source\b[^>]*>')
+LINK_RE = re.compile(r'<link\b[^>]*>')
+SCRIPT_SRC_RE = re.compile(r'<script\b[^>]*\ssrc="([^"]+)"')
+FONT_URL_RE = re.compile(r'url\(([^)]+\.woff2)\)')
+
+
+def _attr(tag: str, name: str):
+    m = re.search(r'\s' + name + r'="([^"]*)"', tag)
+    return html.unescape(m.group(1)) if m else None
+
+
+def _slot_width(sizes) -> int:
+    """CSS width `sizes` gives at VIEWPORT_WIDTH: its last (default) entry when in px."""
+    last = (sizes or '').split(',')[-1].strip()
+    return int(last[:-2]) if re.fullmatch(r'\d+px', last) else VIEWPORT_WIDTH
+
+
+def _pick(srcset: str, sizes) -> str:
+    """The srcset candidate a 1x screen loads for the slot `sizes` describes."""
+    candidates = []
+    for entry in srcset.split(','):
+        parts = entry.split()
+        if parts:
+            width = int(parts[1][:-1]) if len(parts) > 1 and parts[1].endswith('w') else 0
+            candidates.append((width, parts[0]))
+    slot = _slot_width(sizes)
+    covering = sorted(c for c in candidates if c[0] >= slot)
+    return (covering[0] if covering else max(candidates))[1]
+
+
+def _img_url(tag: str, sources=()) -> str:
+    for source in sources:
+        srcset = _attr(source, 'srcset')
+        if srcset:
+            return _pick(srcset, _attr(source, 'sizes'))
+    srcset = _attr(tag, 'srcset')
+    return _pick(srcset, _attr(tag, 'sizes')) if srcset else _attr(tag, 'src')
+
+
+def page_images(text: str):
+    """[(url, is_lcp)] for the images the page loads, in document order."""
+    images = []
+    pictured = set()
+    for m in PICTURE_RE.finditer(text):
+        img = IMG_RE.search(m.group(1))
+        if img:
+            pictured.add(m.start(1) + img.start())
+            images.append((m.start(), _img_url(img.group(0), SOURCE_RE.findall(m.group(1))), img.group(0)))
+    for m in IMG_RE.finditer(text):
+        if m.start() not in pictured:
+            images.append((m.start(), _img_url(m.group(0)), m.group(0)))
+    images.sort(key=lambda i: i[0])
+    out = [(url, 'fetchpriority="high"' in tag) for _, url, tag in images if url and not url.startswith('data:')]
+
+    # Pages whose containers are empty build these from IMG_CONFIG at runtime
+    config = site_assets.img_config(text)
+    area = image_markup.BANNER_AREA_RE.search(text)
+    if config and area and '<img' not in area.group(2):
+        names = ([config['banner']] if config['banner'] else []) + config['screenshots']
+        out += [(config['folder'] + name, i == 0 and bool(config['banner'])) for i, name in enumerate(names)]
+    return out
+
+
+def _local_size(url: str, pages_dir: Path):
+    """Bytes of a site URL's file under `pages_dir`; 0 for external URLs, None when the file is missing."""
+    if url.startswith(('http://', 'https://', '//')) and not url.startswith(site_assets.SITE_URL):
+        return 0
+    path = pages_dir / site_assets.site_path(url)
+    return path.stat().st_size if path.is_file() else None
+
+
+def page_metrics(text: str, pages_dir: Path, missing: list = None) -> dict:
+    """Metrics of one page, its URLs resolved against `pages_dir`.
+
+    Local image URLs without a file are appended to `missing` and count 0 bytes.
+    """
+    text = critical_css.NOSCRIPT_RE.sub('', text)
+    urls = set()
+    for tag in LINK_RE.findall(text):
+        rel = _attr(tag, 'rel') or ''
+        href = _attr(tag, 'href')
+        if href and (rel in ('stylesheet', 'icon') or (rel == 'preload' and _attr(tag, 'as') in ('style', 'font'))):
+            urls.add(href)
+    urls.update(html.unescape(u) for u in SCRIPT_SRC_RE.findall(text))
+    urls.update(u.strip('\'"') for u in FONT_URL_RE.findall(text))
+
+    images = page_images(text)
+    sizes = {url: _local_size(url, pages_dir) for url, _ in images}
+    for url in sorted(url for url, size in sizes.items() if size is None):
+        if missing is not None:
+            missing.append(url)
+        sizes[url] = 0
+    lcp = next((url for url, is_lcp in images if is_lcp), images[0][0] if images else None)
+    critical, _ = critical_css.critical_path(text, pages_dir)
+    return {
+        'html_bytes': len(text.encode('utf-8')),
+        'image_bytes': sum(sizes.values()),
+        'image_max_bytes': max(sizes.values(), default=0),
+        'requests': 1 + len(urls | set(sizes)),
+        'lcp_bytes': critical + (sizes[lcp] if lcp else 0),
+    }
+
+
+def measure_pages(pages_dir: Path):
+    """({page: metrics}, {page: [unresolved local image URLs]}) for every locale page in `pages_dir`."""
+    pages = {}
+    unresolved = {}
+    for loc in locales.LOCALES:
+        path = pages_dir / loc.page
+        if path.exists():
+            missing = []
+            pages[loc.page] = page_metrics(path.read_text(encoding='utf-8'), pages_dir, missing)
+            if missing:
+                unresolved[loc.page] = missing
+    return pages, unresolved
+
+
+def _best(fn, repeat: int) -> float:
+    """Fastest of `repeat` calls of `fn`, in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 2)
+
+
+def time_images(corpus: Path, scratch: Path, repeat: int) -> dict:
+    """Best time per convert_images stage, summed over the corpus files."""
+    options = convert_images.EncodeOptions(widths=convert_images.DEFAULT_WIDTHS, formats=('webp',))
+    stages = {'images.decode': 0.0, 'images.composite': 0.0, 'images.encode': 0.0, 'images.variants': 0.0}
+    files = sorted(p for p in corpus.iterdir() if p.suffix.lower() in ('.png', '.jpg', '.jpeg'))
+    for source in files:
+        target = scratch / (source.stem + '.jpg')
+        img = None
+
+        def decode():
+            nonlocal img
+            img = Image.open(source)
+            img.load()
+
+        stages['images.decode'] += _best(decode, repeat)
+        rgb = None
+
+        def composite():
+            nonlocal rgb
+            rgb = convert_images.flatten(img, options)
+
+        stages['images.composite'] += _best(composite, repeat)
+        result = convert_images.ConvertResult(source, target)
+        stages['images.encode'] += _best(lambda: convert_images.encode_jpeg(rgb, target, options, result), repeat)
+        stages['images.variants'] += _best(lambda: convert_images.write_variants(rgb, target, options), repeat)
+    return {stage: round(ms, 2) for stage, ms in stages.items()}
+
+
+def run_timings(site_dir: Path, corpus: Path, repeat: int) -> dict:
+    template_path = site_dir / translate_pages.TEMPLATE
+    template = translate_pages.PageTemplate(template_path.read_text(encoding='utf-8'))
+    pages = translate_pages.site_pages()
+
+    def translate():
+        for name, key in pages:
+            if key is not None:
+                template.render(translate_pages.page_context(name, key))
+
+    timings = {'translate': _best(translate, repeat)}
+    scratch = Path(tempfile.mkdtemp(prefix='bench-'))
+    try:
+        timings['render'] = _best(lambda: translate_pages.render_site(scratch / 'pages', template_path, force=True),
+                                  repeat)
+        if corpus.is_dir():
+            (scratch / 'images').mkdir()
+            timings.update(time_images(corpus, scratch / 'images', repeat))
+        tasks = [(site_dir / rel, scratch / 'dist' / rel, rel) for rel in compress_site.collect(site_dir)]
+
+        def compress():
+            # Start from an empty bundle each run so every file is rebuilt
+            shutil.rmtree(scratch / 'dist', ignore_errors=True)
+            for task in tasks:
+                compress_site.build_asset(*task)
+
+        timings['compress'] = _best(compress, repeat)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return timings
+
+
+def load_budgets(path) -> dict:
+    budgets = {section: dict(limits) for section, limits in BUDGETS.items()}
+    if path:
+        for section, limits in json.loads(Path(path).read_text(encoding='utf-8')).items():
+            budgets.setdefault(section, {}).update(limits)
+    return budgets
+
+
+def check_budgets(results: dict, budgets: dict):
+    """[(where, metric, value, limit)] for every budget exceeded."""
+    over = []
+    for name, metrics in results.get('pages', {}).items():
+        for metric, limit in budgets.get('pages', {}).items():
+            if metrics.get(metric, 0) > limit:
+                over.append((name, metric, metrics[metric], limit))
+    for stage, limit in budgets.get('timings', {}).items():
+        value = results.get('timings', {}).get(stage)
+        if value is not None and value > limit:
+            over.append(('timings', stage, value, limit))
+    return over
+
+
+def _change(old, new) -> str:
+    if not old:
+        return '-'
+    return f"{100 * (new - old) / old:+.1f}%"
+
+
+def print_results(results: dict):
+    if results.get('timings'):
+        print(f"{'stage':<20} {'ms':>10}")
+        for stage, ms in results['timings'].items():
+            print(f"{stage:<20} {ms:>10.1f}")
+        print()
+    metrics = list(BUDGETS['pages'])
+    print(f"{'page':<26}" + ''.join(f" {m:>15}" for m in metrics))
+    for name, values in results['pages'].items():
+        print(f"{name:<26}" + ''.join(f" {values[m]:>15}" for m in metrics))
+
+
+def print_compare(old: dict, new: dict):
+    print(f"\n{'compared to':<26} {'old':>12} {'new':>12} {'change':>8}")
+    for stage, ms in new.get('timings', {}).items():
+        if stage in old.get('timings', {}):
+            before = old['timings'][stage]
+            print(f"{stage:<26} {before:>12.1f} {ms:>12.1f} {_change(before, ms):>8}")
+    for name, values in new['pages'].items():
+        for metric, value in values.items():
+            before = old.get('pages', {}).get(name, {}).get(metric)
+            if before is not None and before != value:
+                print(f"{name + ' ' + metric:<26} {before:>12} {value:>12} {_change(before, value):>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the site build and check page-weight budgets.')
+    parser.add_argument('--site-dir', default='.', help='Directory with lovemarble.html, css/ and images/ (default: .)')
+    parser.add_argument('--pages-dir', help='Directory with the locale pages to measure and their assets (default: --site-dir)')
+    parser.add_argument('--corpus', help='Image folder timed by the images.* stages (default: images/en)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per timed stage, fastest kept (default: 3)')
+    parser.add_argument('--output', help='Write the results as JSON to this path')
+    parser.add_argument('--compare', help='Print the change against an earlier --output file')
+    parser.add_argument('--budgets', help='JSON file overriding the built-in budgets')
+    parser.add_argument('--no-timings', action='store_true', help='Only measure the pages and check budgets')
+    args = parser.parse_args()
+
+    site_dir = Path(args.site_dir)
+    pages_dir = Path(args.pages_dir) if args.pages_dir else site_dir
+    corpus = Path(args.corpus) if args.corpus else site_dir / 'images' / 'en'
+
+    pages, unresolved = measure_pages(pages_dir)
+    results = {'timings': {}, 'pages': pages}
+    if not args.no_timings:
+        results['timings'] = run_timings(site_dir, corpus, max(1, args.repeat))
+    print_results(results)
+    if args.compare:
+        print_compare(json.loads(Path(args.compare).read_text(encoding='utf-8')), results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+
+    over = check_budgets(results, load_budgets(args.budgets))
+    if unresolved:
+        print(f"\nImages not found in {pages_dir} (metrics would undercount):")
+        for name, urls in unresolved.items():
+            print(f"  {name}: {', '.join(urls)}")
+    if over:
+        print(f"\n{len(over)} budget(s) exceeded:")
+        for where, metric, value, limit in over:
+            print(f"  {where}: {metric} {value} > {limit}")
+    if over or unresolved:
+        sys.exit(1)
+    print(f"\nDone. {len(results['pages'])} pages within budget.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,540 @@
+"""
+Build the whole site into a clean deploy directory from one command.
+
+The build is a DAG of stages, each a thin wrapper around the existing tools:
+  * images-<folder> (one per folder under images/): the folder's JPEGs, or
+    the JPEGs converted from its PNGs, plus the WebP width ladder, LQIP
+    placeholders and images.json (convert_images.py);
+  * render: every locale page from lovemarble.html and TRANSLATIONS, with
+    hreflang, image markup, font subsets and critical CSS
+    (translate_pages.render_site); needs every images-* stage;
+  * sitemap: sitemap.xml and llms.txt from LOCALES (locales.py), `<lastmod>`
+    carried forward per hash of the rendered page in
+    `--cache-dir`/sitemap-state.json (keep it between CI runs, or every
+    page gets the build date); needs render;
+  * fingerprint: content-hashed assets and the pages, site files and
+    images.json rewritten to point at them (fingerprint_assets.py); needs
+    render, sitemap and every images-* stage;
+  * compress: minified text assets with `.br`/`.gz` siblings
+    (compress_site.py); needs fingerprint.
+
+Every stage's output is cached in `--cache-dir` under a key hashing the
+stage's code (its run function and the modules it calls), its options, the
+content of its source files (sha256, reused while size and mtime are
+unchanged) and the keys of the stages it depends on. A stage whose key is
+already in the cache is not run; a stage that does run starts from a copy of
+its previous output, so the tools' own manifests still skip unchanged
+pages, images and font subsets. Stages whose dependencies are done run at
+the same time; their image encodes and page renders share one pool of
+`--jobs` processes, and compression (the last stage, alone) uses its own. The newest `--keep` entries
+of each stage are kept.
+
+`--out-dir` is then synced with the fingerprint and compress outputs (plus
+CNAME): changed files are copied, files the build no longer produces are
+deleted, and unchanged files are not touched. A rebuild with no changed
+input only stats the sources and the deploy directory: nothing is hashed,
+run or written.
+
+Usage:
+  python tools/build.py [--site-dir .] [--out-dir dist] [--cache-dir .build] [--jobs N] [--keep 2]
+                        [--force] [--dry-run] [--profile trace.json] [--cprofile PATH]
+
+Options:
+  --site-dir      Directory holding lovemarble.html, css/, fonts/src/ and images/ (default: .)
+  --out-dir       Deploy directory, emptied of anything the build does not produce (default: dist)
+  --cache-dir     Stage cache directory (default: .build)
+  --jobs          Worker processes (default: 0 = one per CPU)
+  --keep          Cache entries kept per stage, the current one included (default: 2)
+  --force         Run every stage, ignoring the cache
+  --dry-run       Print the stages, their keys and whether they are cached, then exit
+  --profile       Write a Chrome trace (chrome://tracing, ui.perfetto.dev) with a
+                  span per stage and the spans of the tools it runs
+  --cprofile      Also dump cProfile stats of the main process to this path
+
+Note: Requires Pillow (`pip install pillow`); font subsets and Brotli files
+are only produced when fontTools and brotli are installed (see
+subset_fonts.py and compress_site.py). With fontTools installed, the render
+stage fails when a font source under fonts/src/ is missing.
+"""
+
+import argparse
+import datetime
+import hashlib
+import inspect
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import PIL
+
+import compress_site
+import convert_images
+import critical_css
+import fingerprint_assets
+import image_markup
+import locales
+import site_assets
+import subset_fonts
+import tracing
+import translate_pages
+
+RECORD_NAME = '.stage.json'
+HASH_CACHE_NAME = 'hash-cache.json'
+SITEMAP_STATE_NAME = 'sitemap-state.json'
+# OS clutter that is never an input (images/ folders come from Windows and macOS)
+IGNORED_NAMES = {'Thumbs.db', 'desktop.ini', '.DS_Store'}
+# Deployed as they are, next to the fingerprinted files
+EXTRA_FILES = ('CNAME',)
+FONT_URL_RE = re.compile(r'fonts/([^"\'()\s]+\.woff2)')
+RENDERED_PAGES = {loc.page for loc in locales.LOCALES}
+STATIC_PAGES = [name for _, _, name in locales.SITE_PAGES if name not in RENDERED_PAGES]
+
+
+class StageError(Exception):
+    pass
+
+
+@dataclass
+class Stage:
+    name: str
+    # run(ctx, stage, out) fills `out` with the stage's output and returns a short note
+    run: Callable
+    deps: tuple = ()
+    inputs: list = field(default_factory=list)   # site-relative source files
+    modules: tuple = ()                          # their source is part of the key
+    options: dict = field(default_factory=dict)
+
+
+def source_files(site_dir: Path, rel: str, recursive: bool = True):
+    """Site-relative paths of the files under `rel`, sorted; hidden files and OS clutter skipped."""
+    root = site_dir / rel
+    if not root.is_dir():
+        return []
+    found = root.rglob('*') if recursive else root.iterdir()
+    return sorted(p.relative_to(site_dir).as_posix() for p in found
+                  if p.is_file() and not p.name.startswith('.') and p.name not in IGNORED_NAMES
+                  and p.name not in (convert_images.FOLDER_MANIFEST_NAME, convert_images.MANIFEST_NAME))
+
+
+def _existing(site_dir: Path, names):
+    return [name for name in names if (site_dir / name).is_file()]
+
+
+def plan_stages(site_dir: Path):
+    """Every stage of the build, dependencies first."""
+    image_options = convert_images.EncodeOptions(widths=convert_images.DEFAULT_WIDTHS,
+                                                  formats=convert_images.supported_formats(['webp']),
+                                                  placeholders=True)
+    image_stages = []
+    images_dir = site_dir / 'images'
+    for child in sorted(images_dir.iterdir()) if images_dir.is_dir() else ():
+        if child.is_dir() and not child.name.startswith('.'):
+            image_stages.append(Stage(f'images-{child.name}', build_images, (),
+                                      source_files(site_dir, f'images/{child.name}'), (convert_images,),
+                                      {'folder': child.name, 'encode': image_options, 'pillow': PIL.__version__}))
+    image_deps = tuple(s.name for s in image_stages)
+    css = source_files(site_dir, 'css')
+    return image_stages + [
+        Stage('render', build_render, image_deps,
+              _existing(site_dir, [translate_pages.TEMPLATE]) + css + source_files(site_dir, subset_fonts.SOURCE_DIR),
+              (translate_pages, locales, image_markup, subset_fonts, critical_css, compress_site, site_assets),
+              {'fonttools': subset_fonts.ft_subset is not None}),
+        Stage('sitemap', build_sitemap, ('render',),
+              _existing(site_dir, STATIC_PAGES + ['llms.txt']), (locales,)),
+        Stage('fingerprint', build_fingerprint, image_deps + ('render', 'sitemap'),
+              css + source_files(site_dir, 'images', recursive=False)
+              + _existing(site_dir, STATIC_PAGES + ['robots.txt'] + list(EXTRA_FILES)),
+              (fingerprint_assets, site_assets)),
+        Stage('compress', build_compress, ('fingerprint',), [], (compress_site,),
+              {'brotli': compress_site.brotli is not None}),
+    ]
+
+
+class Context:
+    """What stages share: the paths, the process pool and the keys of the run."""
+
+    def __init__(self, site_dir: Path, cache_dir: Path, jobs: int):
+        self.site_dir = site_dir
+        self.cache_dir = cache_dir
+        self.jobs = jobs
+        self.keys = {}
+        self.date = datetime.date.today().isoformat()
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def entry(self, stage_name: str, key: str = None) -> Path:
+        return self.cache_dir / stage_name / (key or self.keys[stage_name])
+
+    def map(self, fn, *iterables):
+        """fn over the iterables in the shared process pool (in this thread with one job); results in order."""
+        if self.jobs <= 1:
+            return map(fn, *iterables)
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.jobs, initializer=tracing.init_worker,
+                                                 initargs=(tracing.enabled(),))
+        return self._pool.map(fn, *iterables)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+
+
+def _sha256(*parts) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def stage_key(stage: Stage, site_dir: Path, hashes: fingerprint_assets.HashCache, keys: dict) -> str:
+    parts = [stage.name, inspect.getsource(stage.run)]
+    parts += [Path(m.__file__).read_text(encoding='utf-8') for m in stage.modules]
+    parts.append(json.dumps(stage.options, sort_keys=True, default=repr))
+    parts += [f'{rel}:{hashes.digest(site_dir / rel, rel)}' for rel in stage.inputs]
+    parts += [f'{dep}:{keys[dep]}' for dep in stage.deps]
+    return _sha256(*parts)
+
+
+def _link(source: Path, target: Path):
+    """Hard-link `source` to `target` (copy across filesystems) for read-only use by a tool."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _copy_if_changed(source: Path, target: Path) -> bool:
+    """copy2 unless `target` has the same size and mtime; return whether it was copied."""
+    try:
+        src, dst = source.stat(), target.stat()
+        if src.st_size == dst.st_size and src.st_mtime_ns == dst.st_mtime_ns:
+            return False
+    except OSError:
+        pass
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source, target)
+    return True
+
+
+def output_files(root: Path):
+    """{relative path: file} of a stage output or deploy directory; hidden (bookkeeping) files skipped."""
+    files = {}
+    for folder, dirs, names in os.walk(root):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        for name in names:
+            if not name.startswith('.'):
+                path = Path(folder, name)
+                files[path.relative_to(root).as_posix()] = path
+    return files
+
+
+def converted_sources(entry: Path):
+    """Relative paths of the PNGs an images-* output converted (not deployed)."""
+    manifest = entry / 'images' / convert_images.MANIFEST_NAME
+    if not manifest.exists():
+        return set()
+    outputs = json.loads(manifest.read_text(encoding='utf-8')).get('outputs', {})
+    return {'images/' + e['source'] for key, e in outputs.items() if e['source'] != key}
+
+
+def _link_images(ctx: Context, stage: Stage, site: Path):
+    for dep in stage.deps:
+        if dep.startswith('images-'):
+            entry = ctx.entry(dep)
+            skip = converted_sources(entry)
+            for rel, path in output_files(entry).items():
+                if rel not in skip:
+                    _link(path, site / rel)
+
+
+def build_images(ctx: Context, stage: Stage, out: Path) -> str:
+    images_dir = out / 'images'
+    folder = images_dir / stage.options['folder']
+    folder.mkdir(parents=True, exist_ok=True)
+    sources = {Path(rel).name for rel in stage.inputs}
+    for rel in stage.inputs:
+        # Copies, not links: converting PNGs may overwrite a JPEG of the same name
+        _copy_if_changed(ctx.site_dir / rel, out / rel)
+
+    manifest = convert_images.BuildManifest(images_dir / convert_images.MANIFEST_NAME)
+    keep = set(sources) | {convert_images.FOLDER_MANIFEST_NAME}
+    for key, entry in manifest.entries.items():
+        if Path(entry['source']).name in sources:
+            keep.add(Path(key).name)
+            keep.update(v['src'] for v in entry.get('variants', []))
+    for p in folder.iterdir():
+        if p.is_file() and p.name not in keep:
+            p.unlink()
+    for target, _ in list(manifest.stale()):
+        target.unlink(missing_ok=True)
+        manifest.forget(target)
+
+    options = stage.options['encode']
+    settings = options.settings()
+    planner = (convert_images.plan_folder if any(p.suffix.lower() == '.png' for p in folder.iterdir())
+               else convert_images.plan_variants)
+    tasks = [(s, t) for s, t in planner(folder) if not manifest.is_fresh(s, t, settings)]
+    n = len(tasks)
+    results = ctx.map(convert_images.convert_image, [s for s, _ in tasks], [t for _, t in tasks],
+                      [False] * n, [options] * n)
+    for result in results:
+        tracing.merge(result.trace)
+        if result.error:
+            raise StageError(f"{result.source}: {result.error}")
+        manifest.record(result, settings, False)
+    manifest.save()
+    convert_images.write_folder_manifest(folder, manifest)
+    return f"{n} of {len(planner(folder))} images encoded"
+
+
+def build_render(ctx: Context, stage: Stage, out: Path) -> str:
+    missing = subset_fonts.missing_sources(ctx.site_dir)
+    if subset_fonts.ft_subset is not None and missing:
+        # Without them every page would silently keep Google Fonts
+        raise StageError(f"Missing font sources in {ctx.site_dir / subset_fonts.SOURCE_DIR}: {', '.join(missing)}")
+    # The tools read css/, fonts/src/ and images/ next to the template: give
+    # them a site of links to read. Font subsets go to out/fonts/, where the
+    # ones kept from the last build are reused.
+    site = out.with_name(out.name + '.site')
+    shutil.rmtree(site, ignore_errors=True)
+    for rel in stage.inputs:
+        _link(ctx.site_dir / rel, site / rel)
+    _link_images(ctx, stage, site)
+
+    results = translate_pages.render_site(out, site / translate_pages.TEMPLATE, ctx.jobs, pool_map=ctx.map)
+    used = set()
+    for name, _ in results:
+        used.update(FONT_URL_RE.findall((out / name).read_text(encoding='utf-8')))
+    for p in (out / subset_fonts.FONTS_DIR).glob('*.woff2'):
+        if p.name not in used:
+            p.unlink()
+    shutil.rmtree(site)
+    rebuilt = sum(status != 'fresh' for _, status in results)
+    return f"{rebuilt} of {len(results)} pages rendered, {len(used)} font subsets"
+
+
+def build_sitemap(ctx: Context, stage: Stage, out: Path) -> str:
+    pages = ctx.entry('render')
+    # Keyed by the rendered pages' hashes and kept outside the stage
+    # entries, so pruning or a new key does not reset every <lastmod>
+    state_path = ctx.cache_dir / SITEMAP_STATE_NAME
+    state = json.loads(state_path.read_text(encoding='utf-8')) if state_path.exists() else {}
+
+    hashes = {}
+    for _, _, name in locales.sitemap_pages():
+        path = pages / name if name in RENDERED_PAGES else ctx.site_dir / name
+        if path.exists():
+            hashes[name] = hashlib.sha256(path.read_bytes()).hexdigest()
+    state = locales.update_lastmod(state, hashes, ctx.date)
+    tmp = state_path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+    tmp.replace(state_path)
+    (out / 'sitemap.xml').write_text(locales.render_sitemap(state), encoding='utf-8')
+    llms = ctx.site_dir / 'llms.txt'
+    if llms.exists():
+        (out / 'llms.txt').write_text(locales.apply_llms(llms.read_text(encoding='utf-8')), encoding='utf-8')
+    return f"{len(hashes)} pages in the sitemap"
+
+
+def build_fingerprint(ctx: Context, stage: Stage, out: Path) -> str:
+    site = out.with_name(out.name + '.site')
+    shutil.rmtree(site, ignore_errors=True)
+    for rel in stage.inputs:
+        if rel not in EXTRA_FILES:
+            _link(ctx.site_dir / rel, site / rel)
+    _link_images(ctx, stage, site)
+    for dep in ('render', 'sitemap'):
+        for rel, path in output_files(ctx.entry(dep)).items():
+            _link(path, site / rel)
+
+    mapping, copied, rewritten, pruned = fingerprint_assets.fingerprint_site(site, site, out, prune=True)
+    produced = {p.name for p in site.glob('*.html')} | set(fingerprint_assets.SITE_FILES)
+    for p in out.iterdir():
+        if p.is_file() and p.suffix in ('.html', '.xml', '.txt') and p.name not in produced:
+            p.unlink()
+    for name in EXTRA_FILES:
+        if name in stage.inputs:
+            _copy_if_changed(ctx.site_dir / name, out / name)
+        else:
+            (out / name).unlink(missing_ok=True)
+    shutil.rmtree(site)
+    return f"{len(mapping)} assets ({copied} copied), {len(rewritten)} files rewritten, {len(pruned)} pruned"
+
+
+def build_compress(ctx: Context, stage: Stage, out: Path) -> str:
+    results = compress_site.compress_site(ctx.entry('fingerprint'), out, ctx.jobs)
+    expected = set()
+    for r in results:
+        expected.update((r.path, r.path + '.gz', r.path + '.br'))
+    for rel, path in output_files(out).items():
+        if rel not in expected:
+            path.unlink()
+    written = sum(r.written for r in results)
+    return f"{written} of {len(results)} files compressed"
+
+
+def cache_entries(stage_dir: Path):
+    """Complete entries of a stage's cache, newest first."""
+    if not stage_dir.is_dir():
+        return []
+    entries = [p for p in stage_dir.iterdir() if (p / RECORD_NAME).exists()]
+    return sorted(entries, key=lambda p: (p / RECORD_NAME).stat().st_mtime_ns, reverse=True)
+
+
+def run_stage(ctx: Context, stage: Stage) -> str:
+    """Run `stage` from a copy of its previous output and store the result under its key."""
+    key = ctx.keys[stage.name]
+    entry = ctx.entry(stage.name)
+    work = ctx.cache_dir / 'tmp' / f'{stage.name}-{key[:16]}'
+    shutil.rmtree(work, ignore_errors=True)
+    previous = next((p for p in cache_entries(entry.parent) if p != entry), None)
+    if previous is not None:
+        shutil.copytree(previous, work, copy_function=shutil.copy2)
+        (work / RECORD_NAME).unlink()
+    else:
+        work.mkdir(parents=True)
+    with tracing.span(stage.name, 'build'):
+        note = stage.run(ctx, stage, work)
+    record = {'stage': stage.name, 'key': key, 'deps': {d: ctx.keys[d] for d in stage.deps},
+              'inputs': stage.inputs, 'note': note}
+    (work / RECORD_NAME).write_text(json.dumps(record, indent=2) + '\n', encoding='utf-8')
+    shutil.rmtree(entry, ignore_errors=True)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(work, entry)
+    return note
+
+
+def run_stages(ctx: Context, stages, todo: set):
+    """Run the `todo` stages, each as soon as its dependencies are done; print one line per stage."""
+    pending = [s for s in stages if s.name in todo]
+    done = {s.name for s in stages if s.name not in todo}
+    failed = []
+    running = {}
+    # Stages mostly wait on the shared process pool; `jobs` of them keep it busy
+    with ThreadPoolExecutor(max_workers=max(1, min(len(pending), ctx.jobs))) as threads:
+        while pending or running:
+            if not failed:
+                for stage in [s for s in pending if all(d in done for d in s.deps)]:
+                    pending.remove(stage)
+                    running[threads.submit(run_stage, ctx, stage)] = (stage, time.perf_counter())
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, start = running.pop(future)
+                try:
+                    note = future.result()
+                except Exception as e:
+                    failed.append(stage.name)
+                    print(f"{stage.name:<16} failed: {e}", flush=True)
+                    continue
+                done.add(stage.name)
+                print(f"{stage.name:<16} built  {time.perf_counter() - start:7.2f} s  {note}", flush=True)
+    return failed
+
+
+def sync_dist(ctx: Context, out_dir: Path):
+    """Make `out_dir` hold exactly the deployable outputs; return (files, copied, removed)."""
+    wanted = output_files(ctx.entry('fingerprint'))
+    wanted.update(output_files(ctx.entry('compress')))
+    copied = sum(_copy_if_changed(path, out_dir / rel) for rel, path in wanted.items())
+    removed = 0
+    if out_dir.is_dir():
+        for folder, dirs, names in os.walk(out_dir, topdown=False):
+            for name in names:
+                path = Path(folder, name)
+                if path.relative_to(out_dir).as_posix() not in wanted:
+                    path.unlink()
+                    removed += 1
+            for name in dirs:
+                path = Path(folder, name)
+                if not any(path.iterdir()):
+                    path.rmdir()
+    return len(wanted), copied, removed
+
+
+def prune_cache(ctx: Context, stages, keep: int):
+    for stage in stages:
+        current = ctx.entry(stage.name)
+        old = [p for p in cache_entries(current.parent) if p != current]
+        for entry in old[max(0, keep - 1):]:
+            shutil.rmtree(entry)
+
+
+def build(site_dir: Path, out_dir: Path, cache_dir: Path, jobs: int, keep: int = 2, force: bool = False,
+          dry_run: bool = False) -> bool:
+    """Build the site into `out_dir`; return whether every stage succeeded."""
+    start = time.perf_counter()
+    ctx = Context(site_dir, cache_dir, jobs)
+    stages = plan_stages(site_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    hashes = fingerprint_assets.HashCache(cache_dir / HASH_CACHE_NAME)
+    with tracing.span('fingerprint inputs'):
+        for stage in stages:
+            ctx.keys[stage.name] = stage_key(stage, site_dir, hashes, ctx.keys)
+    hashes.save()
+    todo = {s.name for s in stages if force or not (ctx.entry(s.name) / RECORD_NAME).exists()}
+
+    if dry_run:
+        for stage in stages:
+            state = 'to build' if stage.name in todo else 'cached'
+            deps = f"  <- {', '.join(stage.deps)}" if stage.deps else ''
+            print(f"{stage.name:<16} {ctx.keys[stage.name][:12]}  {state}{deps}")
+        return True
+
+    try:
+        failed = run_stages(ctx, stages, todo)
+    finally:
+        ctx.close()
+    if failed:
+        print(f"Build failed in {', '.join(failed)}; {out_dir} left as it was.")
+        return False
+    with tracing.span('sync'):
+        files, copied, removed = sync_dist(ctx, out_dir)
+    prune_cache(ctx, stages, keep)
+    elapsed = time.perf_counter() - start
+    print(f"Done. {len(stages)} stages ({len(todo)} built, {len(stages) - len(todo)} cached), "
+          f"{files} files in {out_dir} ({copied} copied, {removed} removed) in {elapsed:.2f} s.")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the site into a clean deploy directory, reusing cached stages.')
+    parser.add_argument('--site-dir', default='.', help='Directory with lovemarble.html, css/ and images/ (default: .)')
+    parser.add_argument('--out-dir', default='dist', help='Deploy directory (default: dist)')
+    parser.add_argument('--cache-dir', default='.build', help='Stage cache directory (default: .build)')
+    parser.add_argument('--jobs', type=int, default=0, help='Worker processes (default: 0 = one per CPU)')
+    parser.add_argument('--keep', type=int, default=2, help='Cache entries kept per stage (default: 2)')
+    parser.add_argument('--force', action='store_true', help='Run every stage, ignoring the cache')
+    parser.add_argument('--dry-run', action='store_true', help='Print the stages and their cache state, then exit')
+    parser.add_argument('--profile', metavar='TRACE_JSON', help='Write a Chrome trace of the run to this path')
+    parser.add_argument('--cprofile', metavar='PATH', help='Also dump cProfile stats of the main process')
+    args = parser.parse_args()
+
+    site_dir, out_dir = Path(args.site_dir), Path(args.out_dir)
+    if not (site_dir / translate_pages.TEMPLATE).exists():
+        print(f"Template not found: {site_dir / translate_pages.TEMPLATE}")
+        sys.exit(1)
+    # out_dir is emptied of everything the build does not produce
+    if site_dir.resolve() == out_dir.resolve() or out_dir.resolve() in site_dir.resolve().parents:
+        parser.error('--out-dir must not be the site directory or contain it')
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    with tracing.profiling(args.profile, args.cprofile, 'build'):
+        ok = build(site_dir, out_dir, Path(args.cache_dir), jobs, max(1, args.keep), args.force, args.dry_run)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+"""
+Minify the site's text assets and write precompressed `.br`/`.gz` siblings so
+the edge can serve them without compressing on the fly. Run it after the
+locale build (`translate_pages.py --render`).
+
+Collected from `--site-dir`: `*.html`, `css/*.css`, `sitemap.xml`,
+`llms.txt` and `robots.txt`. Each file is copied to `--out-dir` under the
+same relative path, then:
+  * HTML is minified conservatively: comments are dropped (conditional
+    comments stay), runs of whitespace between and inside tags collapse to a
+    single space or newline, and `<pre>`, `<textarea>` and every `<script>`
+    (including inline JSON-LD) are kept byte for byte. Inline `<style>` is
+    minified as CSS.
+  * CSS loses comments and the whitespace around `{`, `}`, `;` and `,`;
+    strings are left alone.
+  * `.gz` (level 9) and `.br` (quality 11) siblings are written next to
+    every file. Brotli needs the optional `brotli` package; without it only
+    `.gz` is written.
+
+Outputs whose minified bytes and compressed siblings are already up to date
+are left untouched, so re-running on an unchanged site writes nothing.
+
+Usage:
+  python tools/compress_site.py [--site-dir .] [--out-dir dist] [--jobs N] [--report sizes.json]
+
+Options:
+  --site-dir      Directory holding the built pages (default: .)
+  --out-dir       Deploy bundle directory (default: dist)
+  --jobs          Number of worker processes (default: 1, 0 = one per CPU)
+  --report        Also write the size report as JSON to this path
+
+Note: Brotli output requires `pip install brotli`.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # .br siblings are skipped
+    brotli = None
+
+ASSET_PATTERNS = ('*.html', 'css/*.css', 'sitemap.xml', 'llms.txt', 'robots.txt')
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# A tag's attributes up to its closing `>`, which may also appear inside quotes
+ATTRS = r'''(?:"[^"]*"|'[^']*'|[^'">])*'''
+# Blocks whose content must survive byte for byte
+RAW_BLOCK_RE = re.compile(r'<(pre|textarea|script)\b' + ATTRS + r'>.*?</\1\s*>', re.S | re.I)
+STYLE_BLOCK_RE = re.compile(r'(<style\b' + ATTRS + r'>)(.*?)(</style\s*>)', re.S | re.I)
+COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.S)
+TAG_RE = re.compile(r'(<' + ATTRS + r'>)')
+QUOTED_OR_SPACE_RE = re.compile(r'("[^"]*"|\'[^\']*\')|\s+')
+CSS_STRING_RE = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'')
+CSS_STRING_OR_COMMENT_RE = re.compile(r'(' + CSS_STRING_RE.pattern + r')|/\*.*?\*/', re.S)
+
+
+def _collapse_text(text: str) -> str:
+    text = re.sub(r'\s*\n\s*', '\n', text)
+    return re.sub(r'[ \t\r\f]+', ' ', text)
+
+
+def _collapse_tag(tag: str) -> str:
+    # Attribute values are kept as written; only the gaps between them shrink
+    return QUOTED_OR_SPACE_RE.sub(lambda m: m.group(1) or ' ', tag)
+
+
+def _minify_css_code(code: str) -> str:
+    code = re.sub(r'\s+', ' ', code)
+    code = re.sub(r'\s*([{};,])\s*', r'\1', code)
+    return code.replace(';}', '}')
+
+
+def minify_css(css: str) -> str:
+    # Drop comments first so the code on both sides of them is joined below
+    css = CSS_STRING_OR_COMMENT_RE.sub(lambda m: m.group(1) or ' ', css)
+    out = []
+    pos = 0
+    for m in CSS_STRING_RE.finditer(css):
+        out.append(_minify_css_code(css[pos:m.start()]))
+        out.append(m.group(0))
+        pos = m.end()
+    out.append(_minify_css_code(css[pos:]))
+    return ''.join(out).strip()
+
+
+def _minify_markup(html: str) -> str:
+    html = COMMENT_RE.sub('', html)
+    html = STYLE_BLOCK_RE.sub(lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), html)
+    parts = TAG_RE.split(html)
+    for i, part in enumerate(parts):
+        parts[i] = _collapse_tag(part) if i % 2 else _collapse_text(part)
+    return ''.join(parts)
+
+
+def minify_html(html: str) -> str:
+    out = []
+    pos = 0
+    for m in RAW_BLOCK_RE.finditer(html):
+        out.append(_minify_markup(html[pos:m.start()]))
+        out.append(m.group(0))
+        pos = m.end()
+    out.append(_minify_markup(html[pos:]))
+    return ''.join(out).strip() + '\n'
+
+
+MINIFIERS = {'.html': minify_html, '.css': minify_css}
+
+
+@dataclass
+class AssetResult:
+    path: str
+    raw: int
+    minified: int
+    gzip: int
+    brotli: int = 0
+    written: bool = False
+
+
+def _siblings(target: Path):
+    out = [(target.with_name(target.name + '.gz'), lambda data: gzip.compress(data, GZIP_LEVEL, mtime=0))]
+    if brotli is not None:
+        out.append((target.with_name(target.name + '.br'), lambda data: brotli.compress(data, quality=BROTLI_QUALITY)))
+    return out
+
+
+def build_asset(source: Path, target: Path, rel: str) -> AssetResult:
+    """Minify `source` into `target` and write its compressed siblings."""
+    raw = source.read_bytes()
+    minify = MINIFIERS.get(source.suffix.lower())
+    data = minify(raw.decode('utf-8')).encode('utf-8') if minify else raw
+
+    written = not target.exists() or target.read_bytes() != data
+    if written:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+    mtime = target.stat().st_mtime_ns
+
+    sizes = {}
+    for sibling, compress in _siblings(target):
+        if written or not sibling.exists() or sibling.stat().st_mtime_ns < mtime:
+            sibling.write_bytes(compress(data))
+            written = True
+        sizes[sibling.suffix] = sibling.stat().st_size
+    return AssetResult(rel, len(raw), len(data), sizes['.gz'], sizes.get('.br', 0), written)
+
+
+def collect(site_dir: Path):
+    """Relative paths of the deployable text assets, sorted."""
+    found = set()
+    for pattern in ASSET_PATTERNS:
+        found.update(p.relative_to(site_dir).as_posix() for p in site_dir.glob(pattern) if p.is_file())
+    return sorted(found)
+
+
+def _run(tasks, jobs: int):
+    """Build (source, target, rel) tasks and yield results in task order."""
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield build_asset(*task)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        futures = [pool.submit(build_asset, *task) for task in tasks]
+        for future in futures:
+            yield future.result()
+
+
+def compress_site(site_dir: Path, out_dir: Path, jobs: int = 1):
+    tasks = [(site_dir / rel, out_dir / rel, rel) for rel in collect(site_dir)]
+    return list(_run(tasks, jobs))
+
+
+def print_report(results):
+    def pct(part, whole):
+        return f"{100 * part / whole:.1f}%" if whole else "-"
+
+    br_col = brotli is not None
+    print(f"{'file':<28} {'raw':>8} {'minified':>9} {'gzip':>8}" + (f" {'brotli':>8}" if br_col else ''))
+    for r in results:
+        line = f"{r.path:<28} {r.raw:>8} {r.minified:>9} {r.gzip:>8}"
+        if br_col:
+            line += f" {r.brotli:>8}"
+        print(line)
+    raw = sum(r.raw for r in results)
+    minified = sum(r.minified for r in results)
+    gz = sum(r.gzip for r in results)
+    line = f"{'total':<28} {raw:>8} {minified:>9} {gz:>8}"
+    if br_col:
+        br = sum(r.brotli for r in results)
+        line += f" {br:>8}"
+    print(line)
+    summary = f"Minified {pct(minified, raw)} of raw, gzip {pct(gz, raw)}"
+    if br_col:
+        summary += f", brotli {pct(br, raw)}"
+    print(summary + '.')
+    if not br_col:
+        print("brotli is not installed; skipped .br files (pip install brotli).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Minify and precompress the site's text assets.")
+    parser.add_argument('--site-dir', default='.', help='Directory with the built pages (default: .)')
+    parser.add_argument('--out-dir', default='dist', help='Deploy bundle directory (default: dist)')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--report', help='Write the size report as JSON to this path')
+    args = parser.parse_args()
+
+    site_dir = Path(args.site_dir)
+    out_dir = Path(args.out_dir)
+    if not site_dir.exists():
+        print(f"Site directory not found: {site_dir}")
+        return
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    results = compress_site(site_dir, out_dir, jobs)
+    print_report(results)
+    written = sum(r.written for r in results)
+    print(f"Done. {len(results)} files, {written} written, {len(results) - written} unchanged in {out_dir}.")
+    if args.report:
+        Path(args.report).write_text(json.dumps([asdict(r) for r in results], indent=2) + '\n', encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,28 +2,308 @@
 Convert PNG images in each language folder under `images/` to JPG and rename
 the first five images in each folder to `screen_01.jpg` ... `screen_05.jpg`.
 
+Outputs are tracked in `images/.convert-manifest.json` (source hash, encoder
+settings, output hash). Inputs whose size/mtime, settings and output are
+unchanged are skipped without being decoded; outputs whose source PNG has
+disappeared are reported as stale.
+
+With `--variants`, every output also gets a width ladder of WebP (and
+optionally AVIF) files next to the JPEG fallback, e.g. `screen_01-480.webp`,
+and each folder gets an `images.json` describing dimensions and byte sizes for
+`srcset`/`<picture>` markup. `--variants-only` derives the ladder from the
+existing JPGs when a folder has no PNG sources. `--placeholders` adds a tiny
+(20px wide) base64 WebP preview to every entry of `images.json`, so pages can
+paint a blurred placeholder in correctly sized boxes before the image arrives.
+
+JPEGs are written progressive with optimized Huffman tables. With
+`--target-ssim` and/or `--max-bytes` the quality is searched per image for the
+lowest setting whose SSIM against the composited source meets the target
+(capped at `--quality`), and the run ends with the bytes saved per locale
+relative to a fixed-quality encode.
+
+`--low-memory` is for very large captures on small CI runners: transparent
+sources are composited onto the background in row strips, opaque RGB
+sources are not copied, JPEGs used only for variants/placeholders are
+decoded at a reduced DCT scale (draft mode), and once the full-size JPEG is
+written the frame is integer-reduced to what the variants need. The run
+summary reports the peak RSS of the main process and the largest worker.
+The SSIM quality search still holds full-frame luma arrays.
+
 Usage:
-  python tools/convert_images.py [--images-dir images] [--remove-original] [--dry-run]
+  python tools/convert_images.py [--images-dir images] [--remove-original] [--dry-run] [--jobs N]
+                                 [--force] [--prune-stale]
+                                 [--variants] [--variants-only] [--widths 480,960,1440] [--formats webp,avif]
+                                 [--placeholders]
+                                 [--quality 95] [--target-ssim 0.985] [--max-bytes N] [--min-quality 40]
+                                 [--low-memory] [--profile trace.json] [--cprofile PATH]
 
 Options:
   --images-dir    Path to the images directory (default: images)
   --remove-original  Delete original PNG files after successful conversion
   --dry-run       Print actions without modifying files
+  --jobs          Number of worker processes (default: 1, 0 = one per CPU)
+  --force         Ignore the manifest and re-encode everything
+  --prune-stale   Delete stale outputs and drop them from the manifest
+  --variants      Emit resized WebP/AVIF variants and per-folder images.json
+  --variants-only Build variants from existing JPGs instead of converting PNGs
+  --widths        Comma-separated variant widths (default: 480,960,1440)
+  --formats       Comma-separated variant formats (default: webp; avif needs
+                  Pillow built with libavif or the `pillow-avif-plugin` package)
+  --placeholders  Store a ~20px base64 WebP preview per image in images.json
+  --quality       JPEG quality, or the upper bound of the search (default: 95)
+  --target-ssim   Search for the lowest quality reaching this SSIM (e.g. 0.985)
+  --max-bytes     Byte budget per JPEG; wins over --target-ssim when they conflict
+  --min-quality   Lower bound of the search (default: 40)
+  --low-memory    Bound memory per image for large captures (see below)
+  --profile       Write a Chrome trace (chrome://tracing, ui.perfetto.dev) with
+                  spans per locale folder, file and stage (hash, decode,
+                  composite, encode, variants) and byte/manifest counters
+  --cprofile      Also dump cProfile stats of the main process to this path
 
-Note: Requires Pillow. Install with `pip install pillow`.
+Note: Requires Pillow. Install with `pip install pillow`. The quality search
+also needs NumPy (`pip install numpy`).
 """
 
 import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import time
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from PIL import Image
+from PIL import Image, features
+
+import tracing
+
+try:
+    import pillow_avif  # noqa: F401  (registers the AVIF plugin on older Pillow)
+except ImportError:
+    pillow_avif = None
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS in the summary
+    resource = None
+
+MANIFEST_NAME = '.convert-manifest.json'
+FOLDER_MANIFEST_NAME = 'images.json'
+
+# Encoder settings; any change invalidates every manifest entry
+QUALITY = 95
+BACKGROUND = (255, 255, 255)
+DEFAULT_WIDTHS = (480, 960, 1440)
+VARIANT_QUALITY = {'webp': 80, 'avif': 55}
+MIME_TYPES = {'jpg': 'image/jpeg', 'webp': 'image/webp', 'avif': 'image/avif'}
+PLACEHOLDER_WIDTH = 20
+PLACEHOLDER_QUALITY = 40
+# Rows composited at a time in low-memory mode
+STRIP_ROWS = 256
+
+
+@dataclass(frozen=True)
+class EncodeOptions:
+    quality: int = QUALITY
+    background: tuple = BACKGROUND
+    widths: tuple = ()
+    formats: tuple = ()
+    target_ssim: float = 0.0
+    max_bytes: int = 0
+    min_quality: int = 40
+    placeholders: bool = False
+    low_memory: bool = False
+
+    @property
+    def searching(self) -> bool:
+        return bool(self.target_ssim or self.max_bytes)
+
+    @property
+    def derived_width(self) -> int:
+        """Largest width any derived output (variant, placeholder) needs; 0 if none."""
+        widths = list(self.widths) if self.formats else []
+        if self.placeholders:
+            widths.append(PLACEHOLDER_WIDTH)
+        return max(widths, default=0)
+
+    def settings(self) -> dict:
+        settings = {'quality': self.quality, 'background': list(self.background),
+                    'progressive': True, 'optimize': True}
+        if self.placeholders:
+            settings['placeholder'] = {'width': PLACEHOLDER_WIDTH, 'quality': PLACEHOLDER_QUALITY}
+        if self.searching:
+            settings['search'] = {'target_ssim': self.target_ssim, 'max_bytes': self.max_bytes,
+                                  'min_quality': self.min_quality}
+        if self.widths and self.formats:
+            settings['variants'] = {
+                'widths': list(self.widths),
+                'formats': {fmt: VARIANT_QUALITY[fmt] for fmt in self.formats},
+            }
+        if self.low_memory:
+            # Draft/reduced decoding changes the pixels variants are resized from
+            settings['low_memory'] = True
+        return settings
+
+
+def supported_formats(formats):
+    """Filter requested variant formats down to what this Pillow can encode."""
+    usable = []
+    for fmt in formats:
+        if fmt not in VARIANT_QUALITY:
+            print(f"Warning: unknown variant format {fmt!r}, skipping")
+        elif not features.check(fmt):
+            print(f"Warning: Pillow cannot encode {fmt.upper()} here, skipping")
+        else:
+            usable.append(fmt)
+    return tuple(usable)
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+            tracing.count('bytes_read', len(chunk))
+    return h.hexdigest()
+
 
+@dataclass
+class ConvertResult:
+    source: Path
+    target: Path
+    bytes_in: int = 0
+    bytes_out: int = 0
+    jpeg_bytes: int = 0
+    error: str = ''
+    warning: str = ''
+    source_sha256: str = ''
+    output_sha256: str = ''
+    width: int = 0
+    height: int = 0
+    variants: list = field(default_factory=list)
+    quality: int = 0
+    ssim: float = None
+    placeholder: str = ''
+    baseline_bytes: int = 0
+    over_budget: bool = False
+    # Trace events recorded by the worker (see tracing.collect)
+    trace: list = field(default_factory=list)
 
-def convert_folder(folder: Path, remove_original: bool, dry_run: bool):
+
+class BuildManifest:
+    """Persistent record of which source/settings produced each output.
+
+    Entries are keyed by the output path relative to the images directory.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.root = path.parent
+        self.entries = {}
+        if path.exists():
+            try:
+                self.entries = json.loads(path.read_text(encoding='utf-8')).get('outputs', {})
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring unreadable manifest {path}: {e}")
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def is_fresh(self, source: Path, target: Path, settings: dict) -> bool:
+        """True when `target` is known to be up to date, using only stat() calls.
+
+        If the source was touched but its bytes did not change, the hash is
+        checked once and the recorded stat refreshed.
+        """
+        entry = self.entries.get(self._key(target))
+        if not entry or entry.get('settings') != settings or entry.get('source') != self._key(source):
+            return False
+        try:
+            src_stat = source.stat()
+            out_stat = target.stat()
+        except OSError:
+            return False
+        if out_stat.st_size != entry['output_size'] or out_stat.st_mtime_ns != entry['output_mtime_ns']:
+            return False
+        for variant in entry.get('variants', []):
+            try:
+                if (target.parent / variant['src']).stat().st_size != variant['bytes']:
+                    return False
+            except OSError:
+                return False
+        if src_stat.st_size == entry['source_size'] and src_stat.st_mtime_ns == entry['source_mtime_ns']:
+            return True
+        if src_stat.st_size == entry['source_size'] and file_sha256(source) == entry['source_sha256']:
+            entry['source_mtime_ns'] = src_stat.st_mtime_ns
+            return True
+        return False
+
+    def record(self, result: ConvertResult, settings: dict, source_removed: bool):
+        src_stat = None if source_removed else result.source.stat()
+        out_stat = result.target.stat()
+        self.entries[self._key(result.target)] = {
+            'source': self._key(result.source),
+            'source_size': result.bytes_in,
+            'source_mtime_ns': src_stat.st_mtime_ns if src_stat else 0,
+            'source_sha256': result.source_sha256,
+            'source_removed': source_removed,
+            'settings': settings,
+            'output_size': out_stat.st_size,
+            'output_mtime_ns': out_stat.st_mtime_ns,
+            'output_sha256': result.output_sha256,
+            'width': result.width,
+            'height': result.height,
+            'quality': result.quality,
+            'variants': result.variants,
+            'placeholder': result.placeholder,
+        }
+
+    def stale(self):
+        """Yield (output, source) for entries whose source PNG no longer exists."""
+        for key, entry in sorted(self.entries.items()):
+            if entry.get('source_removed'):
+                continue
+            source = self.root / entry['source']
+            if not source.exists():
+                yield self.root / key, source
+
+    def forget(self, target: Path):
+        entry = self.entries.pop(self._key(target), None)
+        for variant in (entry or {}).get('variants', []):
+            (target.parent / variant['src']).unlink(missing_ok=True)
+
+    def folder_images(self, folder: Path) -> dict:
+        """Describe the outputs recorded for `folder`, keyed by file name."""
+        prefix = self._key(folder) + '/'
+        images = {}
+        for key, entry in sorted(self.entries.items()):
+            name = key[len(prefix):]
+            if not key.startswith(prefix) or '/' in name:
+                continue
+            images[name] = {
+                'width': entry.get('width', 0),
+                'height': entry.get('height', 0),
+                'bytes': entry['output_size'],
+                'type': MIME_TYPES['jpg'],
+                'variants': entry.get('variants', []),
+            }
+            if entry.get('placeholder'):
+                images[name]['placeholder'] = entry['placeholder']
+        return images
+
+    def save(self):
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'outputs': self.entries}, indent=2, sort_keys=True), encoding='utf-8')
+        tmp.replace(self.path)
+
+
+def plan_folder(folder: Path):
+    """Return the (source, target) pairs for every PNG in `folder`, in order."""
     png_files = sorted([p for p in folder.iterdir() if p.is_file() and p.suffix.lower() == '.png'])
-    if not png_files:
-        return 0
 
-    converted = 0
+    plan = []
     for idx, p in enumerate(png_files):
         # Determine target name:
         # - first five files -> screen_01.jpg ... screen_05.jpg
@@ -35,37 +315,244 @@ def convert_folder(folder: Path, remove_original: bool, dry_run: bool):
             target = folder / "banner.jpg"
         else:
             target = p.with_suffix('.jpg')
+        plan.append((p, target))
+    return plan
 
-        if dry_run:
-            print(f"DRY: {p} -> {target}")
-            converted += 1
-            continue
 
-        try:
-            with Image.open(p) as img:
-                # Handle alpha by compositing over white background
-                if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
-                    rgba = img.convert('RGBA')
-                    background = Image.new('RGB', rgba.size, (255, 255, 255))
-                    background.paste(rgba, mask=rgba.split()[3])
-                    rgb = background
-                else:
-                    rgb = img.convert('RGB')
+def plan_variants(folder: Path):
+    """Return (jpg, jpg) pairs for regenerating variants from existing outputs."""
+    jpg_files = sorted([p for p in folder.iterdir() if p.is_file() and p.suffix.lower() == '.jpg'])
+    return [(p, p) for p in jpg_files]
+
+
+def write_variants(rgb: Image.Image, target: Path, options: EncodeOptions, size: tuple = None):
+    """Write the width ladder for `rgb` next to `target` and describe each file.
+
+    `size` is the full image size when `rgb` was decoded or reduced to a
+    smaller one. Widths larger than the image are skipped rather than upscaled.
+    """
+    variants = []
+    width, height = size or rgb.size
+    for fmt in options.formats:
+        for w in options.widths:
+            if w >= width:
+                continue
+            h = max(1, round(height * w / width))
+            resized = rgb.resize((w, h), Image.LANCZOS)
+            out = target.with_name(f"{target.stem}-{w}.{fmt}")
+            resized.save(out, quality=VARIANT_QUALITY[fmt])
+            variants.append({
+                'src': out.name,
+                'width': w,
+                'height': h,
+                'format': fmt,
+                'type': MIME_TYPES[fmt],
+                'bytes': out.stat().st_size,
+            })
+    return variants
+
+
+def make_placeholder(rgb: Image.Image) -> str:
+    """Return a ~20px wide preview of `rgb` as a data URI (WebP, else JPEG)."""
+    width, height = rgb.size
+    size = (PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width)))
+    fmt = 'webp' if features.check('webp') else 'jpeg'
+    buf = io.BytesIO()
+    rgb.resize(size, Image.BOX).save(buf, format=fmt.upper(), quality=PLACEHOLDER_QUALITY)
+    return f"data:image/{fmt};base64," + base64.b64encode(buf.getvalue()).decode('ascii')
 
-                rgb.save(target, quality=95)
 
-            if remove_original:
-                try:
-                    p.unlink()
-                except Exception as e:
-                    print(f"Warning: failed to remove original {p}: {e}")
+def write_folder_manifest(folder: Path, manifest: BuildManifest):
+    """Write `images.json` for `folder`; untouched when the content is unchanged."""
+    images = manifest.folder_images(folder)
+    if not any(image['variants'] or image.get('placeholder') for image in images.values()):
+        return False
+    path = folder / FOLDER_MANIFEST_NAME
+    text = json.dumps({'folder': folder.name, 'images': images}, indent=2, sort_keys=True, ensure_ascii=False) + '\n'
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    path.write_text(text, encoding='utf-8')
+    return True
 
-            print(f"Converted: {p} -> {target}")
-            converted += 1
-        except Exception as e:
-            print(f"Error converting {p}: {e}")
 
-    return converted
+def encode_jpeg(rgb: Image.Image, target: Path, options: EncodeOptions, result: ConvertResult):
+    """Write `rgb` as a progressive, Huffman-optimized JPEG.
+
+    In search mode the chosen quality, its SSIM and the size of a fixed-quality
+    encode are recorded on `result` for the savings report, and a JPEG still
+    over `--max-bytes` at `--min-quality` is flagged as over budget.
+    """
+    if not options.searching:
+        rgb.save(target, quality=options.quality, optimize=True, progressive=True)
+        result.quality = options.quality
+        return
+
+    import image_quality
+
+    quality, data, score, result.baseline_bytes = image_quality.search_quality(
+        rgb, options.quality, options.min_quality, options.target_ssim, options.max_bytes)
+    result.quality, result.ssim = quality, score
+    result.over_budget = bool(options.max_bytes) and len(data) > options.max_bytes
+    target.write_bytes(data)
+
+
+def _composite_strips(img: Image.Image, background) -> Image.Image:
+    """Flatten `img` over `background` STRIP_ROWS rows at a time.
+
+    Only the RGB output and one RGBA strip are alive next to the decoded
+    source, instead of full-frame RGBA, background and alpha copies.
+    """
+    out = Image.new('RGB', img.size, background)
+    for top in range(0, img.height, STRIP_ROWS):
+        box = (0, top, img.width, min(top + STRIP_ROWS, img.height))
+        strip = img.crop(box).convert('RGBA')
+        out.paste(strip, box[:2], mask=strip.getchannel('A'))
+        del strip
+    return out
+
+
+def flatten(img: Image.Image, options: EncodeOptions) -> Image.Image:
+    """`img` as RGB, composited over the background when it has transparency.
+
+    In low-memory mode an RGB image is returned itself (loaded) instead of copied.
+    """
+    if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+        # Handle alpha by compositing over white background
+        if options.low_memory:
+            return _composite_strips(img, options.background)
+        rgba = img.convert('RGBA')
+        background = Image.new('RGB', rgba.size, options.background)
+        background.paste(rgba, mask=rgba.split()[3])
+        return background
+    if img.mode == 'RGB' and options.low_memory:
+        img.load()
+        return img
+    return img.convert('RGB')
+
+
+def load_rgb(source: Path, options: EncodeOptions, full_size: bool = True):
+    """Decode `source` as RGB composited over the background; return (rgb, original size).
+
+    In low-memory mode a JPEG that is only used for derived outputs
+    (`full_size=False`) is decoded at the smallest DCT scale still covering
+    `options.derived_width`, transparent images are composited in row strips,
+    and opaque RGB images are used as decoded instead of copied.
+    """
+    img = Image.open(source)
+    size = img.size
+    if options.low_memory and not full_size and options.derived_width and img.format == 'JPEG':
+        img.draft('RGB', (options.derived_width, max(1, size[1] * options.derived_width // size[0])))
+    with tracing.span('decode'):
+        img.load()
+    tracing.count('bytes_read', source.stat().st_size)
+    with tracing.span('composite'):
+        rgb = flatten(img, options)
+    if rgb is not img:
+        img.close()
+    return rgb, size
+
+
+def convert_image(source: Path, target: Path, remove_original: bool, options: EncodeOptions = EncodeOptions()) -> ConvertResult:
+    """Decode, composite and encode a single image. Never raises.
+
+    When `source` is `target` the JPEG is left alone and only its variants are
+    regenerated.
+    """
+    result = ConvertResult(source, target)
+    with tracing.span(source.name, 'file', locale=source.parent.name):
+        _convert(result, remove_original, options)
+    result.trace = tracing.collect()
+    return result
+
+
+def _convert(result: ConvertResult, remove_original: bool, options: EncodeOptions):
+    source, target = result.source, result.target
+    try:
+        result.bytes_in = source.stat().st_size
+        with tracing.span('hash'):
+            result.source_sha256 = file_sha256(source)
+        rgb, size = load_rgb(source, options, full_size=source != target)
+        if source != target:
+            with tracing.span('encode'):
+                encode_jpeg(rgb, target, options, result)
+            tracing.count('bytes_written', target.stat().st_size)
+        result.width, result.height = size
+        if options.low_memory and options.derived_width:
+            # The full frame is no longer needed: keep an integer-reduced copy
+            # that still covers the largest derived width
+            factor = rgb.width // options.derived_width
+            if factor >= 2:
+                rgb = rgb.reduce(factor)
+        if options.widths and options.formats:
+            with tracing.span('variants'):
+                result.variants = write_variants(rgb, target, options, size)
+            tracing.count('bytes_written', sum(v['bytes'] for v in result.variants))
+        if options.placeholders:
+            with tracing.span('placeholder'):
+                result.placeholder = make_placeholder(rgb)
+        del rgb
+        result.jpeg_bytes = target.stat().st_size
+        result.bytes_out = result.jpeg_bytes + sum(v['bytes'] for v in result.variants)
+        with tracing.span('hash'):
+            result.output_sha256 = file_sha256(target)
+
+        if remove_original and source != target:
+            try:
+                source.unlink()
+            except Exception as e:
+                result.warning = f"failed to remove original {source}: {e}"
+    except Exception as e:
+        result.error = str(e)
+
+
+def peak_rss():
+    """Peak resident set size in bytes of (this process, largest finished worker), or None."""
+    if resource is None:
+        return None
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale)
+
+
+def _report(result: ConvertResult):
+    if result.warning:
+        print(f"Warning: {result.warning}")
+    if result.over_budget:
+        print(f"Warning: {result.target} is {result.jpeg_bytes} bytes at q{result.quality}, "
+              f"over --max-bytes even at --min-quality")
+    if result.error:
+        print(f"Error converting {result.source}: {result.error}")
+    elif result.source == result.target:
+        print(f"Variants: {result.target} ({len(result.variants)} files)")
+    else:
+        suffix = f" (+{len(result.variants)} variants)" if result.variants else ''
+        if result.baseline_bytes:
+            score = f", ssim {result.ssim:.4f}" if result.ssim is not None else ''
+            suffix += f" [q{result.quality}{score}, {result.jpeg_bytes / 1024:.0f} KB]"
+        print(f"Converted: {result.source} -> {result.target}{suffix}")
+
+
+def _run(tasks, remove_original: bool, jobs: int, options: EncodeOptions = EncodeOptions()):
+    """Convert `tasks` and yield results in task order.
+
+    With more than one job the work is spread over a process pool; results are
+    still reported in the deterministic order of `tasks`.
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        for source, target in tasks:
+            result = convert_image(source, target, remove_original, options)
+            tracing.merge(result.trace)
+            yield result
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=tracing.init_worker,
+                             initargs=(tracing.enabled(),)) as pool:
+        futures = [pool.submit(convert_image, source, target, remove_original, options) for source, target in tasks]
+        for future in futures:
+            result = future.result()
+            tracing.merge(result.trace)
+            yield result
 
 
 def main():
@@ -73,22 +560,144 @@ def main():
     parser.add_argument('--images-dir', default='images', help='Images directory (default: images)')
     parser.add_argument('--remove-original', action='store_true', help='Remove original PNG files after conversion')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without changing files')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--force', action='store_true', help='Ignore the build manifest and re-encode everything')
+    parser.add_argument('--prune-stale', action='store_true', help='Delete outputs whose source PNG no longer exists')
+    parser.add_argument('--variants', action='store_true', help='Emit resized WebP/AVIF variants and images.json')
+    parser.add_argument('--variants-only', action='store_true', help='Build variants from existing JPGs only')
+    parser.add_argument('--widths', default=','.join(map(str, DEFAULT_WIDTHS)), help='Variant widths (default: 480,960,1440)')
+    parser.add_argument('--formats', default='webp', help='Variant formats, e.g. webp,avif (default: webp)')
+    parser.add_argument('--placeholders', action='store_true', help='Store tiny base64 previews in images.json')
+    parser.add_argument('--quality', type=int, default=QUALITY, help=f'JPEG quality or search upper bound (default: {QUALITY})')
+    parser.add_argument('--target-ssim', type=float, default=0.0, help='Lowest quality whose SSIM reaches this value')
+    parser.add_argument('--max-bytes', type=int, default=0, help='Per-JPEG byte budget for the quality search')
+    parser.add_argument('--min-quality', type=int, default=40, help='Lower bound of the quality search (default: 40)')
+    parser.add_argument('--low-memory', action='store_true',
+                        help='Bound per-image memory: reduced decoding, strip compositing, eager release')
+    parser.add_argument('--profile', metavar='TRACE_JSON', help='Write a Chrome trace of the run to this path')
+    parser.add_argument('--cprofile', metavar='PATH', help='Also dump cProfile stats of the main process')
 
     args = parser.parse_args()
+    with tracing.profiling(args.profile, args.cprofile, 'convert_images'):
+        _main(args)
+
+
+def _main(args):
     images_dir = Path(args.images_dir)
     if not images_dir.exists():
         print(f"Images directory not found: {images_dir}")
         return
 
-    total = 0
-    # Process language subfolders only (directories)
-    for child in sorted(images_dir.iterdir()):
-        if child.is_dir():
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    widths = formats = ()
+    if args.variants or args.variants_only:
+        widths = tuple(sorted({int(w) for w in args.widths.split(',') if w.strip()}))
+        formats = supported_formats([f.strip().lower() for f in args.formats.split(',') if f.strip()])
+    options = EncodeOptions(quality=args.quality, widths=widths, formats=formats, target_ssim=args.target_ssim,
+                            max_bytes=args.max_bytes, min_quality=min(args.min_quality, args.quality),
+                            placeholders=args.placeholders, low_memory=args.low_memory)
+    planner = plan_variants if args.variants_only else plan_folder
+
+    manifest = BuildManifest(images_dir / MANIFEST_NAME)
+    settings = options.settings()
+
+    # Plan every language subfolder up front so a single pool covers all of them.
+    # Outputs the manifest vouches for are dropped here, before any decoding.
+    plans = []
+    skipped = 0
+    with tracing.span('plan'):
+        for child in sorted(images_dir.iterdir()):
+            if child.is_dir():
+                todo = []
+                for source, target in planner(child):
+                    if not args.force and manifest.is_fresh(source, target, settings):
+                        skipped += 1
+                        tracing.count('manifest_hit')
+                    else:
+                        todo.append((source, target))
+                        tracing.count('manifest_miss')
+                plans.append((child, todo))
+
+    for target, source in list(manifest.stale()):
+        if args.prune_stale and not args.dry_run:
+            try:
+                target.unlink(missing_ok=True)
+                manifest.forget(target)
+                print(f"Pruned stale output: {target} (source {source} missing)")
+            except OSError as e:
+                print(f"Warning: failed to prune {target}: {e}")
+        else:
+            print(f"Stale: {target} (source {source} missing)")
+
+    if args.dry_run:
+        total = 0
+        for child, tasks in plans:
             print(f"Processing folder: {child}")
-            converted = convert_folder(child, args.remove_original, args.dry_run)
-            total += converted
+            for p, target in tasks:
+                print(f"DRY: {p} -> {target}")
+            total += len(tasks)
+        print(f"Done. Total images processed: {total}, unchanged: {skipped}")
+        return
+
+    tasks = [task for _, folder_tasks in plans for task in folder_tasks]
+
+    start = time.perf_counter()
+    total = errors = over_budget = bytes_in = bytes_out = 0
+    savings = {}
+    results = _run(tasks, args.remove_original, jobs, options)
+    for child, folder_tasks in plans:
+        print(f"Processing folder: {child}")
+        # With --jobs this is the wait for the folder's results; the work
+        # itself shows up as file spans on the worker tracks
+        with tracing.span(child.name, 'locale'):
+            for _ in folder_tasks:
+                result = next(results)
+                _report(result)
+                if result.error:
+                    errors += 1
+                    continue
+                total += 1
+                over_budget += result.over_budget
+                bytes_in += result.bytes_in
+                bytes_out += result.bytes_out
+                manifest.record(result, settings, args.remove_original)
+                if result.baseline_bytes:
+                    baseline, actual = savings.get(child.name, (0, 0))
+                    savings[child.name] = (baseline + result.baseline_bytes, actual + result.jpeg_bytes)
+    elapsed = time.perf_counter() - start
+    # Leave _run's `with ProcessPoolExecutor` so the workers are joined:
+    # RUSAGE_CHILDREN only counts reaped children
+    results.close()
+    with tracing.span('write manifests'):
+        manifest.save()
+        for child, _ in plans:
+            if write_folder_manifest(child, manifest):
+                print(f"Wrote {child / FOLDER_MANIFEST_NAME}")
+
+    if savings:
+        print(f"Bytes saved vs quality={options.quality} per locale:")
+        all_baseline = all_actual = 0
+        for name, (baseline, actual) in sorted(savings.items()):
+            all_baseline += baseline
+            all_actual += actual
+            print(f"  {name:<8} {baseline / 1024:9.0f} KB -> {actual / 1024:9.0f} KB  "
+                  f"saved {(baseline - actual) / 1024:8.0f} KB ({1 - actual / baseline:.0%})")
+        print(f"  {'total':<8} {all_baseline / 1024:9.0f} KB -> {all_actual / 1024:9.0f} KB  "
+              f"saved {(all_baseline - all_actual) / 1024:8.0f} KB ({1 - all_actual / all_baseline:.0%})")
 
-    print(f"Done. Total images processed: {total}")
+    print(f"Done. Total images processed: {total}, unchanged: {skipped}")
+    if over_budget:
+        print(f"Warning: {over_budget} JPEG(s) over --max-bytes {options.max_bytes} "
+              f"even at --min-quality {options.min_quality}")
+    if tasks:
+        rate = total / elapsed if elapsed > 0 else 0.0
+        print(f"Throughput: {rate:.2f} images/s over {elapsed:.2f}s with {jobs} job(s), "
+              f"{bytes_in / 1e6:.1f} MB in -> {bytes_out / 1e6:.1f} MB out, {errors} error(s)")
+        rss = peak_rss()
+        if rss:
+            workers = f", largest worker {rss[1] / 1e6:.0f} MB" if jobs > 1 else ''
+            print(f"Peak RSS: main process {rss[0] / 1e6:.0f} MB{workers}")
 
 
 if __name__ == '__main__':
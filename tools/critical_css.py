@@ -0,0 +1,272 @@
+"""
+Inline the CSS the above-the-fold part of a page needs and load the rest of
+the stylesheets without blocking render.
+
+The fold is the markup from `<body>` through the closing `</header>` (the nav
+bar and the hero with its banner). A rule of the page's local stylesheet is
+critical when every compound selector in one of its selectors can match an
+element of that fragment, judged by tag, class and id (pseudo-classes,
+pseudo-elements and attribute selectors are ignored, combinators are not
+checked). Classes the inline scripts add at runtime (`classList.add(...)`,
+`className = ...`) count as present. `:root`, `*`, `html` and `body` rules,
+`@font-face` and the `@keyframes` used by critical rules are always kept;
+`@media` blocks keep their critical rules.
+
+The critical rules are minified and inlined in a `<style data-critical>` block where the
+stylesheet was linked. Every stylesheet link (local and Google Fonts) becomes
+a `<link rel="preload" as="style">` that switches itself to a stylesheet on
+load, with a `<noscript>` fallback.
+
+`translate_pages.py --render` applies this to every page. The CLI reports,
+per page, the bytes on the critical path (HTML plus render-blocking local CSS)
+and the render-blocking requests, before and after; `--apply` rewrites the
+pages in place.
+
+Usage:
+  python tools/critical_css.py [--pages-dir .] [--site-dir .] [--apply]
+
+Options:
+  --pages-dir     Directory holding the *.html pages (default: .)
+  --site-dir      Directory the pages' relative stylesheet URLs resolve against (default: --pages-dir)
+  --apply         Rewrite the pages in place instead of only reporting
+"""
+
+import argparse
+import re
+from pathlib import Path
+
+from compress_site import minify_css
+import site_assets
+
+STYLESHEET_RE = re.compile(r'<link\b(?=[^>]*\brel="stylesheet")[^>]*\bhref="([^"]+)"[^>]*>')
+NOSCRIPT_RE = re.compile(r'<noscript>.*?</noscript>', re.S)
+FOLD_RE = re.compile(r'<body\b.*?</header>', re.S)
+TAG_NAME_RE = re.compile(r'<([a-zA-Z][\w-]*)')
+CLASS_ATTR_RE = re.compile(r'\bclass="([^"]*)"')
+ID_ATTR_RE = re.compile(r'\bid="([^"]*)"')
+SCRIPT_CLASS_RE = re.compile(r'classList\.(?:add|toggle)\(\s*[\'"]([\w-]+)|className\s*=\s*[\'"]([^\'"]+)')
+PSEUDO_RE = re.compile(r'::?[\w-]+(?:\([^)]*\))?|\[[^\]]*\]')
+COMBINATOR_RE = re.compile(r'\s*[>+~]\s*|\s+')
+ANIMATION_RE = re.compile(r'animation(?:-name)?\s*:\s*([^;}]+)')
+ALWAYS_SELECTORS = {':root', '*', 'html', 'body'}
+
+_parsed = {}
+
+
+def parse_css(css: str):
+    """Split a stylesheet into (prelude, body) pairs for its top-level blocks.
+
+    `body` is the declaration text for style rules and the raw inner text for
+    at-rules; statements such as `@import ...;` have a body of None.
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    blocks = []
+    pos = 0
+    n = len(css)
+    while pos < n:
+        brace = css.find('{', pos)
+        semi = css.find(';', pos)
+        if brace < 0 and semi < 0:
+            break
+        if semi >= 0 and (brace < 0 or semi < brace) and css[pos:semi].strip().startswith('@'):
+            blocks.append((css[pos:semi].strip(), None))
+            pos = semi + 1
+            continue
+        depth = 0
+        i = brace
+        quote = None
+        while i < n:
+            c = css[i]
+            if quote:
+                if c == '\\':
+                    i += 1
+                elif c == quote:
+                    quote = None
+            elif c in '"\'':
+                quote = c
+            elif c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            i += 1
+        blocks.append((css[pos:brace].strip(), css[brace + 1:i].strip()))
+        pos = i + 1
+    return blocks
+
+
+def used_names(fragment: str, scripts: str = ''):
+    """(tags, classes, ids) present in `fragment`, plus classes the scripts add."""
+    tags = {t.lower() for t in TAG_NAME_RE.findall(fragment)} | {'html', 'body'}
+    classes = {c for attr in CLASS_ATTR_RE.findall(fragment) for c in attr.split()}
+    for add, assign in SCRIPT_CLASS_RE.findall(scripts):
+        classes.update([add] if add else assign.split())
+    ids = set(ID_ATTR_RE.findall(fragment))
+    return tags, classes, ids
+
+
+def selector_matches(selector: str, tags, classes, ids) -> bool:
+    selector = selector.strip()
+    if selector in ALWAYS_SELECTORS:
+        return True
+    stripped = PSEUDO_RE.sub('', selector).strip()
+    if not stripped:
+        return True
+    for compound in COMBINATOR_RE.split(stripped):
+        if not compound or compound == '*':
+            continue
+        tag = re.match(r'[a-zA-Z][\w-]*', compound)
+        if tag and tag.group(0).lower() not in tags:
+            return False
+        if not set(re.findall(r'\.([\w-]+)', compound)) <= classes:
+            return False
+        if not set(re.findall(r'#([\w-]+)', compound)) <= ids:
+            return False
+    return True
+
+
+def critical_rules(blocks, used, keyframes=None):
+    """Serialize the critical part of `blocks`; collects animation names into `keyframes`."""
+    keyframes = set() if keyframes is None else keyframes
+    out = []
+    deferred_keyframes = []
+    for prelude, body in blocks:
+        if body is None:
+            if prelude.startswith('@import'):
+                out.append(prelude + ';')
+            continue
+        if prelude.startswith('@font-face'):
+            out.append(f'{prelude}{{{body}}}')
+        elif prelude.startswith('@keyframes') or prelude.startswith('@-webkit-keyframes'):
+            deferred_keyframes.append((prelude, body))
+        elif prelude.startswith('@media') or prelude.startswith('@supports'):
+            inner = critical_rules(parse_css(body), used, keyframes)
+            if inner:
+                out.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@'):
+            continue
+        elif any(selector_matches(s, *used) for s in prelude.split(',')):
+            out.append(f'{prelude}{{{body}}}')
+            for names in ANIMATION_RE.findall(body):
+                keyframes.update(re.findall(r'[\w-]+', names))
+    for prelude, body in deferred_keyframes:
+        if prelude.split()[-1] in keyframes:
+            out.append(f'{prelude}{{{body}}}')
+    return '\n'.join(out)
+
+
+def _stylesheet(path: Path):
+    """Parsed blocks and size of a local stylesheet, cached by mtime."""
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if key not in _parsed:
+        _parsed[key] = (parse_css(path.read_text(encoding='utf-8')), st.st_size)
+    return _parsed[key]
+
+
+def local_path(href: str, site_dir: Path):
+    """Filesystem path of a local stylesheet URL, or None for external ones."""
+    if href.startswith(('http://', 'https://', '//')) and not href.startswith(site_assets.SITE_URL):
+        return None
+    return site_dir / site_assets.site_path(href)
+
+
+def _deferred_link(tag: str) -> str:
+    preload = tag.replace('rel="stylesheet"', 'rel="preload" as="style" onload="this.onload=null;this.rel=\'stylesheet\'"')
+    return f'{preload}<noscript>{tag}</noscript>'
+
+
+def inline_critical(text: str, site_dir: Path) -> str:
+    """Inline the fold's rules from the page's local stylesheets and defer every stylesheet link.
+
+    Idempotent: pages that already carry a critical block are returned as is.
+    """
+    if '<style data-critical>' in text:
+        return text
+    links = list(STYLESHEET_RE.finditer(text))
+    if not links:
+        return text
+    fold = FOLD_RE.search(text)
+    scripts = ''.join(re.findall(r'<script\b[^>]*>(.*?)</script>', text, re.S))
+    used = used_names(fold.group(0) if fold else text, scripts)
+
+    critical = []
+    for m in links:
+        path = local_path(m.group(1), site_dir)
+        if path is not None and path.exists():
+            critical.append(minify_css(critical_rules(_stylesheet(path)[0], used)))
+    style = '<style data-critical>' + ''.join(critical) + '</style>\n    '
+
+    out = []
+    pos = 0
+    for i, m in enumerate(links):
+        out.append(text[pos:m.start()])
+        if i == 0:
+            out.append(style)
+        out.append(_deferred_link(m.group(0)))
+        pos = m.end()
+    out.append(text[pos:])
+    return ''.join(out)
+
+
+def critical_path(text: str, site_dir: Path):
+    """(bytes, blocking requests) a page needs before first render.
+
+    Bytes are the HTML plus every render-blocking local stylesheet; external
+    stylesheets (Google Fonts) count as requests only, their size is unknown
+    offline.
+    """
+    size = len(text.encode('utf-8'))
+    requests = 0
+    for m in STYLESHEET_RE.finditer(NOSCRIPT_RE.sub('', text)):
+        requests += 1
+        path = local_path(m.group(1), site_dir)
+        if path is not None and path.exists():
+            size += path.stat().st_size
+    return size, requests
+
+
+def stylesheets_fingerprint(text: str, site_dir: Path) -> str:
+    """Stat signature of the local stylesheets `inline_critical` reads for a page."""
+    parts = []
+    for m in STYLESHEET_RE.finditer(text):
+        path = local_path(m.group(1), site_dir)
+        if path is None:
+            continue
+        try:
+            st = path.stat()
+            parts.append(f'{m.group(1)}:{st.st_size}:{st.st_mtime_ns}')
+        except OSError:
+            parts.append(f'{m.group(1)}:-')
+    return '|'.join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inline critical CSS and defer stylesheets.')
+    parser.add_argument('--pages-dir', default='.', help='Directory with the *.html pages (default: .)')
+    parser.add_argument('--site-dir', help='Directory stylesheet URLs resolve against (default: --pages-dir)')
+    parser.add_argument('--apply', action='store_true', help='Rewrite the pages in place')
+    args = parser.parse_args()
+
+    pages_dir = Path(args.pages_dir)
+    site_dir = Path(args.site_dir) if args.site_dir else pages_dir
+    print(f"{'page':<26} {'before':>8} {'after':>8} {'saved':>8}  blocking requests")
+    total_before = total_after = 0
+    for page in sorted(pages_dir.glob('*.html')):
+        text = page.read_text(encoding='utf-8')
+        new = inline_critical(text, site_dir)
+        before, req_before = critical_path(text, site_dir)
+        after, req_after = critical_path(new, site_dir)
+        total_before += before
+        total_after += after
+        print(f"{page.name:<26} {before:>8} {after:>8} {before - after:>8}  {req_before} -> {req_after}")
+        if args.apply and new != text:
+            page.write_text(new, encoding='utf-8')
+    print(f"{'total':<26} {total_before:>8} {total_after:>8} {total_before - total_after:>8}")
+    if args.apply:
+        print('Done. Pages rewritten in place.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+"""
+Find identical and near-identical images across `images/` and its language
+folders, and optionally collapse them into a shared content-addressed store.
+
+Images are compared by their decoded pixels, not their file bytes, so a banner
+re-saved with different JPEG metadata still counts as a duplicate. A 64-bit
+difference hash (dHash) proposes near-identical candidates (e.g. the same
+banner re-encoded at another quality); a candidate pair is only accepted when
+the dimensions match and no pixel of their 256px-wide grayscale thumbnails
+differs by more than a small tolerance, so localized screenshots whose only
+change is translated text are never treated as duplicates.
+
+With `--apply`, every group of pixel-identical files is replaced by one copy
+at `images/shared/<pixel-hash>.<ext>` (the smallest file of the group), each
+moved file's site path is recorded in `images/shared/aliases.json`
+(site_assets.ALIASES_PATH) and the pages are rewritten:
+  * IMG_CONFIG names become relative to the page's folder
+    (`"../shared/<hash>.jpg"`), so `IMG_CONFIG.folder` keeps resolving;
+  * `images/...` URLs in attributes and og:/twitter: tags point at the store;
+  * `images.json` entries written by `convert_images.py --variants` are
+    re-keyed to the new IMG_CONFIG name.
+The English template (lovemarble.html) is not rewritten: every locale page
+is rendered from it with its own image folder, so `translate_pages.py
+--render` resolves each locale's names through aliases.json instead (see
+image_markup.py). Files that must keep their URL are copied into the store
+but left in place: everything the template references (it is also served
+as it is), and anything a page names through an absolute URL
+(og:/twitter:image), which shared link previews and other sites keep
+using; absolute URLs are not rewritten.
+Run it after `convert_images.py`: a later conversion recreates the per-locale
+copies, which the next dedupe pass collapses again.
+
+Usage:
+  python tools/dedupe_images.py [--images-dir images] [--site-dir .] [--near 4] [--jobs N]
+                                [--apply] [--collapse-near]
+
+Options:
+  --images-dir    Path to the images directory (default: images)
+  --site-dir      Directory holding the *.html pages to rewrite (default: .)
+  --near          Max dHash Hamming distance reported as near-identical (default: 4, -1 = off)
+  --jobs          Number of worker processes (default: 1, 0 = one per CPU)
+  --apply         Move duplicates into images/shared/ and rewrite references
+  --collapse-near Also collapse near-identical groups (keeps the smallest file's pixels)
+
+Note: Requires Pillow. Install with `pip install pillow`.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from PIL import Image, ImageChops
+
+from convert_images import FOLDER_MANIFEST_NAME
+import locales
+import site_assets
+
+SHARED_DIR = 'shared'
+ALIASES_NAME = posixpath.basename(site_assets.ALIASES_PATH)
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp', '.avif'}
+# Resized variants are derived from their JPEG and regenerated, never deduped
+VARIANT_RE = re.compile(r'-\d+\.(webp|avif)$')
+THUMB_WIDTH = 256
+# Re-encoding noise stays in single digits; changed text or artwork hits ~255
+NEAR_MAX_DIFF = 16
+
+
+def fingerprint(path: Path):
+    """Return (path, size, pixel_hash, dhash, thumbnail) for one image file.
+
+    The thumbnail is (image size, grayscale bytes) used to confirm near matches.
+    """
+    with Image.open(path) as img:
+        rgb = img.convert('RGB')
+    h = hashlib.sha256(f"{rgb.width}x{rgb.height}".encode())
+    h.update(rgb.tobytes())
+    gray = rgb.convert('L')
+    del rgb
+    px = gray.resize((9, 8), Image.LANCZOS).tobytes()
+    dhash = 0
+    for y in range(8):
+        for x in range(8):
+            dhash = (dhash << 1) | (px[y * 9 + x] > px[y * 9 + x + 1])
+    thumb_size = (THUMB_WIDTH, max(1, round(gray.height * THUMB_WIDTH / gray.width)))
+    thumb = (gray.size, gray.resize(thumb_size, Image.BOX).tobytes())
+    return path, path.stat().st_size, h.hexdigest(), dhash, thumb
+
+
+def _same_picture(a, b, near: int) -> bool:
+    if bin(a[3] ^ b[3]).count('1') > near or a[4][0] != b[4][0]:
+        return False
+    (width, height), _ = a[4]
+    size = (THUMB_WIDTH, max(1, round(height * THUMB_WIDTH / width)))
+    diff = ImageChops.difference(Image.frombytes('L', size, a[4][1]), Image.frombytes('L', size, b[4][1]))
+    return diff.getextrema()[1] <= NEAR_MAX_DIFF
+
+
+def scan(images_dir: Path):
+    files = []
+    for p in sorted(images_dir.rglob('*')):
+        if not p.is_file() or p.suffix.lower() not in IMAGE_SUFFIXES:
+            continue
+        if p.relative_to(images_dir).parts[0] == SHARED_DIR or VARIANT_RE.search(p.name):
+            continue
+        files.append(p)
+    return files
+
+
+def _fingerprints(files, jobs: int):
+    if jobs <= 1 or len(files) <= 1:
+        return [fingerprint(p) for p in files]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as pool:
+        return list(pool.map(fingerprint, files))
+
+
+def group_duplicates(prints, near: int):
+    """Return (exact_groups, near_groups) as lists of fingerprint lists."""
+    by_pixels = {}
+    for fp in prints:
+        by_pixels.setdefault(fp[2], []).append(fp)
+    exact = [sorted(g, key=lambda fp: (fp[1], str(fp[0]))) for g in by_pixels.values() if len(g) > 1]
+
+    near_groups = []
+    if near >= 0:
+        # One representative per pixel hash; union-find over confirmed pairs
+        reps = [g[0] for g in by_pixels.values()]
+        parent = list(range(len(reps)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i in range(len(reps)):
+            for j in range(i + 1, len(reps)):
+                if _same_picture(reps[i], reps[j], near):
+                    parent[find(i)] = find(j)
+        clusters = {}
+        for i, rep in enumerate(reps):
+            clusters.setdefault(find(i), []).extend(by_pixels[rep[2]])
+        near_groups = [sorted(g, key=lambda fp: (fp[1], str(fp[0])))
+                       for g in clusters.values() if len({fp[2] for fp in g}) > 1]
+    return exact, near_groups
+
+
+def referenced_paths(site_dir: Path):
+    """Site-relative image paths the pages actually load (what the CDN serves)."""
+    refs = set()
+    for page in sorted(site_dir.glob('*.html')):
+        text = page.read_text(encoding='utf-8')
+        site_assets.rewrite_asset_urls(text, lambda p: refs.add(p))
+        site_assets.rewrite_img_config(text, lambda base, p: refs.add(p))
+    return refs
+
+
+def pinned_paths(site_dir: Path):
+    """{site path: why} for the images that must stay where they are."""
+    pinned = {}
+    for page in sorted(site_dir.glob('*.html')):
+        text = page.read_text(encoding='utf-8')
+        for p in site_assets.absolute_asset_paths(text):
+            pinned.setdefault(p, f'absolute URL in {page.name}')
+        if page.name == locales.DEFAULT_LOCALE.page:
+            site_assets.rewrite_asset_urls(text, lambda p: pinned.setdefault(p, f'referenced by {page.name}'))
+            site_assets.rewrite_img_config(text, lambda base, p: pinned.setdefault(p, f'referenced by {page.name}'))
+    return pinned
+
+
+def collapse(groups, images_dir: Path, site_dir: Path, pinned=None):
+    """Move each group to the shared store; return {old site path: new site path}.
+
+    Files in `pinned` ({site path: why}) are aliased but not deleted.
+    """
+    pinned = pinned or {}
+    shared = images_dir / SHARED_DIR
+    shared.mkdir(exist_ok=True)
+    mapping = {}
+    for group in groups:
+        keep = group[0]
+        dest = shared / f"{keep[2][:16]}{keep[0].suffix.lower()}"
+        if not dest.exists():
+            shutil.copy2(keep[0], dest)
+        for path, *_ in group:
+            rel = path.resolve().relative_to(site_dir.resolve()).as_posix()
+            mapping[rel] = dest.resolve().relative_to(site_dir.resolve()).as_posix()
+            if rel in pinned:
+                print(f"Kept {path} ({pinned[rel]})")
+            else:
+                path.unlink()
+    return mapping
+
+
+def rewrite_references(site_dir: Path, images_dir: Path, mapping: dict):
+    aliases_path = images_dir / SHARED_DIR / ALIASES_NAME
+    aliases = json.loads(aliases_path.read_text(encoding='utf-8')) if aliases_path.exists() else {}
+    aliases.update(mapping)
+    aliases_path.write_text(json.dumps(aliases, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+    print(f"Wrote {aliases_path}")
+
+    for page in sorted(site_dir.glob('*.html')):
+        if page.name == locales.DEFAULT_LOCALE.page:
+            # The render template: its names are resolved per locale through aliases.json
+            continue
+        text = page.read_text(encoding='utf-8')
+        new = site_assets.rewrite_asset_urls(text, mapping.get, absolute=False)
+        new = site_assets.rewrite_img_config(new, lambda base, p: mapping.get(p))
+        if new != text:
+            page.write_text(new, encoding='utf-8')
+            print(f"Rewrote references in {page}")
+
+    for manifest_path in sorted(images_dir.glob(f'*/{FOLDER_MANIFEST_NAME}')):
+        data = json.loads(manifest_path.read_text(encoding='utf-8'))
+        folder = manifest_path.parent.resolve().relative_to(site_dir.resolve()).as_posix()
+        images = {}
+        for name, info in data.get('images', {}).items():
+            new = mapping.get(f"{folder}/{name}")
+            images[posixpath.relpath(new, folder) if new else name] = info
+        if images != data.get('images'):
+            data['images'] = images
+            manifest_path.write_text(json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + '\n',
+                                     encoding='utf-8')
+            print(f"Rewrote {manifest_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find and collapse duplicate images across language folders.")
+    parser.add_argument('--images-dir', default='images', help='Images directory (default: images)')
+    parser.add_argument('--site-dir', default='.', help='Directory with the *.html pages (default: .)')
+    parser.add_argument('--near', type=int, default=4, help='Max dHash distance for near-identical (default: 4, -1 = off)')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--apply', action='store_true', help='Collapse duplicates into images/shared/ and rewrite pages')
+    parser.add_argument('--collapse-near', action='store_true', help='Also collapse near-identical groups')
+
+    args = parser.parse_args()
+    images_dir = Path(args.images_dir)
+    site_dir = Path(args.site_dir)
+    if not images_dir.exists():
+        print(f"Images directory not found: {images_dir}")
+        return
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    files = scan(images_dir)
+    prints = _fingerprints(files, jobs)
+    exact, near = group_duplicates(prints, args.near)
+    refs = referenced_paths(site_dir)
+    pinned = pinned_paths(site_dir)
+
+    def site_rel(path: Path):
+        return path.resolve().relative_to(site_dir.resolve()).as_posix()
+
+    def savings(groups):
+        repo = cdn = 0
+        for group in groups:
+            for path, size, *_ in group[1:]:
+                if site_rel(path) in pinned:
+                    continue
+                repo += size
+                if site_rel(path) in refs:
+                    cdn += size
+        return repo, cdn
+
+    print(f"Scanned {len(files)} images in {images_dir}")
+    for group in exact:
+        print(f"Identical pixels ({group[0][2][:12]}):")
+        for path, size, *_ in group:
+            print(f"  {path} ({size / 1024:.0f} KB)")
+    for group in near:
+        print(f"Near-identical (dHash <= {args.near}, max thumbnail diff <= {NEAR_MAX_DIFF}):")
+        for path, size, _, dhash, _ in group:
+            print(f"  {path} ({size / 1024:.0f} KB, dhash {dhash:016x})")
+
+    repo, cdn = savings(exact)
+    print(f"Identical: {len(exact)} group(s), repo bytes saved {repo / 1e6:.2f} MB, "
+          f"CDN bytes saved {cdn / 1e6:.2f} MB (referenced by pages)")
+    if near:
+        near_repo, near_cdn = savings(near)
+        print(f"Near-identical: {len(near)} group(s), up to {near_repo / 1e6:.2f} MB repo / "
+              f"{near_cdn / 1e6:.2f} MB CDN with --collapse-near")
+
+    if not args.apply:
+        return
+
+    groups = exact
+    if args.collapse_near:
+        # Near groups already contain their exact duplicates
+        covered = {fp[0] for group in near for fp in group}
+        groups = near + [g for g in exact if g[0][0] not in covered]
+    if not groups:
+        print("Nothing to collapse.")
+        return
+    mapping = collapse(groups, images_dir, site_dir, pinned)
+    rewrite_references(site_dir, images_dir, mapping)
+    print(f"Collapsed {len(mapping)} file(s) into {images_dir / SHARED_DIR}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""
+Copy the site's static assets into a deploy directory under content-hashed
+names (`css/lovemarble.css` -> `css/lovemarble.3f2a1b9c.css`) and rewrite
+every reference to them, so the CDN can serve those files with
+`Cache-Control: public, max-age=31536000, immutable`.
+
+Assets are the files under `css/`, `fonts/` and `images/` (images.json and
+build manifests excluded); files already named `name.<hash>.ext`, like the
+font subsets from subset_fonts.py, keep their name. References are rewritten in:
+  * every `*.html` page of `--pages-dir` (relative attribute URLs,
+    `srcset`/`imagesrcset` entries and the preload link);
+  * the `IMG_CONFIG` blocks, whose names stay relative to `IMG_CONFIG.folder`;
+  * `sitemap.xml`, `llms.txt` and `robots.txt` from `--site-dir`;
+  * each folder's `images.json` (keys and variant `src` names).
+HTML keeps its own name: pages are the entry points and must stay revalidated.
+So do absolute `https://terriongames.com/...` URLs such as og:/twitter:image:
+link previews and other sites keep fetching them long after a deploy, so they
+are left as written and the files they name are also copied under their
+original name, which servers revalidate like the pages.
+
+`--out-dir` gets `asset-manifest.json` mapping each original site path to its
+fingerprinted path. Hashes are cached by size/mtime in
+`--out-dir/.fingerprint-cache.json`, and hashed files that already exist are
+not copied again, so re-running on an unchanged tree is cheap. Files are
+copied, never hard-linked: tools such as convert_images.py rewrite images in
+place, which would silently change an "immutable" file sharing the inode.
+
+Usage:
+  python tools/fingerprint_assets.py [--site-dir .] [--pages-dir DIR] [--out-dir dist] [--prune]
+
+Options:
+  --site-dir      Directory holding css/, images/ and the site files (default: .)
+  --pages-dir     Directory holding the built *.html pages (default: --site-dir)
+  --out-dir       Deploy directory to write into (default: dist)
+  --prune         Delete asset files in --out-dir that are no longer referenced
+"""
+
+import argparse
+import hashlib
+import json
+import posixpath
+import re
+import shutil
+from pathlib import Path
+
+from convert_images import FOLDER_MANIFEST_NAME, MANIFEST_NAME
+import site_assets
+
+ASSET_DIRS = ('css', 'fonts', 'images')
+ASSET_SUFFIXES = {'.css', '.jpg', '.jpeg', '.png', '.webp', '.avif', '.svg', '.ico', '.woff2'}
+SITE_FILES = ('sitemap.xml', 'llms.txt', 'robots.txt')
+HASH_LENGTH = 8
+# `name.<hash>.ext`: what servers may mark immutable
+HASHED_RE = re.compile(r'\.[0-9a-f]{%d}\.[A-Za-z0-9]+$' % HASH_LENGTH)
+ASSET_MANIFEST_NAME = 'asset-manifest.json'
+CACHE_NAME = '.fingerprint-cache.json'
+
+
+def hashed_path(rel: str, digest: str) -> str:
+    stem, suffix = posixpath.splitext(rel)
+    return f"{stem}.{digest[:HASH_LENGTH]}{suffix}"
+
+
+def asset_files(site_dir: Path):
+    """Site-relative paths of every fingerprintable asset, sorted."""
+    files = []
+    for name in ASSET_DIRS:
+        for p in sorted((site_dir / name).rglob('*')):
+            if p.is_file() and p.suffix.lower() in ASSET_SUFFIXES and p.name != MANIFEST_NAME:
+                files.append(p.relative_to(site_dir).as_posix())
+    return files
+
+
+class HashCache:
+    """sha256 per file, reused while the file's size and mtime are unchanged."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        if path.exists():
+            self.entries = json.loads(path.read_text(encoding='utf-8'))
+
+    def digest(self, file: Path, rel: str) -> str:
+        st = file.stat()
+        entry = self.entries.get(rel)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        h = hashlib.sha256()
+        with open(file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        self.entries[rel] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        self.dirty = True
+        return self.entries[rel][2]
+
+    def save(self):
+        if self.dirty:
+            self.path.write_text(json.dumps(self.entries, sort_keys=True), encoding='utf-8')
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return True
+
+
+def rewrite_text(text: str, mapping: dict) -> str:
+    text = site_assets.rewrite_asset_urls(text, mapping.get, absolute=False)
+    return site_assets.rewrite_img_config(text, lambda base, p: mapping.get(p))
+
+
+def rewrite_folder_manifest(data: dict, folder: str, mapping: dict) -> dict:
+    """images.json with keys and variant names pointing at the hashed files."""
+    def renamed(base, name):
+        new = mapping.get(posixpath.normpath(posixpath.join(base, name)))
+        return posixpath.relpath(new, base) if new else name
+
+    images = {}
+    for name, info in data.get('images', {}).items():
+        # Variant names are relative to their image's directory
+        base = posixpath.normpath(posixpath.join(folder, posixpath.dirname(name)))
+        variants = [dict(v, src=renamed(base, v['src'])) for v in info.get('variants', [])]
+        images[renamed(folder, name)] = dict(info, variants=variants)
+    return dict(data, images=images)
+
+
+def fingerprint_site(site_dir: Path, pages_dir: Path, out_dir: Path, prune: bool = False):
+    """Copy hashed assets and rewritten pages into `out_dir`.
+
+    Returns (mapping, copied, rewritten, pruned) where mapping is
+    {site path: hashed site path}.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    cache = HashCache(out_dir / CACHE_NAME)
+    mapping = {}
+    copied = 0
+    for rel in asset_files(site_dir):
+        source = site_dir / rel
+        # Font subsets are already named by a hash of their inputs
+        mapping[rel] = rel if HASHED_RE.search(rel) else hashed_path(rel, cache.digest(source, rel))
+        target = out_dir / mapping[rel]
+        if target.exists() and target.stat().st_size == source.stat().st_size:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+        copied += 1
+    cache.save()
+
+    rewritten = []
+    public = set()
+    sources = [(page.name, page) for page in sorted(pages_dir.glob('*.html'))]
+    sources += [(name, site_dir / name) for name in SITE_FILES if (site_dir / name).exists()]
+    for name, path in sources:
+        text = path.read_text(encoding='utf-8')
+        public |= site_assets.absolute_asset_paths(text)
+        if _write_if_changed(out_dir / name, rewrite_text(text, mapping)):
+            rewritten.append(name)
+    # Absolute URLs stay unhashed, so their files ship under both names
+    public &= mapping.keys()
+    for rel in sorted(public):
+        source, target = site_dir / rel, out_dir / rel
+        if target.exists() and target.read_bytes() == source.read_bytes():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+        copied += 1
+    for manifest in sorted((site_dir / 'images').glob(f'**/{FOLDER_MANIFEST_NAME}')):
+        folder = manifest.parent.relative_to(site_dir).as_posix()
+        data = rewrite_folder_manifest(json.loads(manifest.read_text(encoding='utf-8')), folder, mapping)
+        text = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + '\n'
+        if _write_if_changed(out_dir / folder / FOLDER_MANIFEST_NAME, text):
+            rewritten.append(f"{folder}/{FOLDER_MANIFEST_NAME}")
+
+    text = json.dumps(mapping, indent=2, sort_keys=True) + '\n'
+    if _write_if_changed(out_dir / ASSET_MANIFEST_NAME, text):
+        rewritten.append(ASSET_MANIFEST_NAME)
+
+    pruned = []
+    if prune:
+        current = set(mapping.values()) | public
+        for name in ASSET_DIRS:
+            for p in sorted((out_dir / name).rglob('*')):
+                rel = p.relative_to(out_dir).as_posix()
+                is_asset = HASHED_RE.search(p.name) or p.suffix.lower() in ASSET_SUFFIXES
+                if p.is_file() and is_asset and rel not in current:
+                    p.unlink()
+                    pruned.append(rel)
+    return mapping, copied, rewritten, pruned
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Copy assets under content-hashed names and rewrite references.')
+    parser.add_argument('--site-dir', default='.', help='Directory with css/, images/ and site files (default: .)')
+    parser.add_argument('--pages-dir', help='Directory with the built *.html pages (default: --site-dir)')
+    parser.add_argument('--out-dir', default='dist', help='Deploy directory (default: dist)')
+    parser.add_argument('--prune', action='store_true', help='Delete asset files no longer referenced')
+    args = parser.parse_args()
+
+    site_dir = Path(args.site_dir)
+    pages_dir = Path(args.pages_dir) if args.pages_dir else site_dir
+    out_dir = Path(args.out_dir)
+    mapping, copied, rewritten, pruned = fingerprint_site(site_dir, pages_dir, out_dir, args.prune)
+    for name in rewritten:
+        print(f"Rewrote {out_dir / name}")
+    for rel in pruned:
+        print(f"Pruned {out_dir / rel}")
+    print(f"Done. {len(mapping)} assets fingerprinted ({copied} copied), {len(rewritten)} files rewritten, "
+          f"manifest at {out_dir / ASSET_MANIFEST_NAME}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""
+Build-time `<img>`/`<picture>` markup for the pages' IMG_CONFIG images.
+
+The pages used to create the banner and gallery images from IMG_CONFIG with
+`document.createElement` after DOMContentLoaded, which hides them from the
+browser's preload scanner and delays LCP. `inject_images` writes the same
+elements into the HTML instead:
+  * the banner gets `fetchpriority="high"` and a matching
+    `<link rel="preload" as="image">` in `<head>`;
+  * only the first screenshot is fetched with the page (at low priority,
+    so it does not compete with the banner); the others carry their URLs
+    in `data-src`/`data-srcset` and are fetched by GALLERY_LOADER, a small
+    inline script that loads screenshots as they become visible and
+    prefetches the next one on the first scroll, swipe or arrow click;
+  * every image carries `width`/`height` and `decoding="async"`;
+  * when `convert_images.py --variants` wrote an `images.json` for the folder,
+    the WebP/AVIF width ladder becomes `<source srcset>` entries with
+    `sizes` matching css/lovemarble.css, and the LQIP placeholder (if any)
+    the image's background;
+  * names collapsed into images/shared/ by dedupe_images.py are resolved
+    through its aliases.json first, so each locale gets its own images.
+The inline script keeps building the images only when the containers are
+empty, so hand-maintained pages keep working.
+
+Used by `translate_pages.py --render`.
+"""
+import html
+import json
+import posixpath
+import re
+from pathlib import Path
+
+from PIL import Image
+
+from convert_images import FOLDER_MANIFEST_NAME
+import site_assets
+
+# Rendered widths, from css/lovemarble.css (#hero-banner-area, .screenshot-item)
+BANNER_SIZES = '(max-width: 840px) calc(100vw - 40px), 800px'
+SCREENSHOT_SIZES = '(max-width: 768px) 85vw, (max-width: 1400px) 45vw, 600px'
+# AVIF first: the browser takes the first <source> it supports
+FORMAT_ORDER = ('avif', 'webp')
+
+BANNER_AREA_RE = re.compile(r'(<div id="hero-banner-area"[^>]*>)(.*?)(</div>)', re.S)
+GALLERY_RE = re.compile(r'(<div id="screenshot-gallery"[^>]*>)((?:\s*<div class="screenshot-item"[^>]*>.*?</div>)*\s*)(</div>)',
+                        re.S)
+ALT_TEXT_RE = re.compile(r'<span class="alt-text">.*?</span>', re.S)
+PRELOAD_MARK = '<!-- banner preload -->'
+LOADER_RE = re.compile(r'\s*<script data-gallery-loader>.*?</script>', re.S)
+# Fetches deferred screenshots (data-src/data-srcset) once they are on screen,
+# and the one after the last visible screenshot as soon as the visitor
+# scrolls, swipes or clicks an arrow
+GALLERY_LOADER = """<script data-gallery-loader>
+(function () {
+    var gallery = document.getElementById('screenshot-gallery');
+    if (!gallery) return;
+    var items = [].slice.call(gallery.querySelectorAll('.screenshot-item'));
+    var shown = [];
+    function load(i) {
+        var item = items[i];
+        if (!item || !item.hasAttribute('data-deferred')) return;
+        item.removeAttribute('data-deferred');
+        [].forEach.call(item.querySelectorAll('[data-srcset]'), function (el) {
+            el.srcset = el.getAttribute('data-srcset');
+            el.removeAttribute('data-srcset');
+        });
+        var img = item.querySelector('img[data-src]');
+        if (img) {
+            img.src = img.getAttribute('data-src');
+            img.removeAttribute('data-src');
+        }
+    }
+    function prefetchNext() {
+        load((shown.length ? Math.max.apply(null, shown) : 0) + 1);
+    }
+    if (!('IntersectionObserver' in window)) {
+        items.forEach(function (_, i) { load(i); });
+        return;
+    }
+    var observer = new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            var i = items.indexOf(entry.target);
+            shown = shown.filter(function (j) { return j !== i; });
+            if (entry.isIntersecting) {
+                shown.push(i);
+                load(i);
+            }
+        });
+    });
+    items.forEach(function (item) { observer.observe(item); });
+    gallery.addEventListener('scroll', prefetchNext, { passive: true });
+    gallery.addEventListener('touchstart', prefetchNext, { passive: true });
+    [].forEach.call(document.querySelectorAll('.scroll-btn'), function (button) {
+        button.addEventListener('click', prefetchNext);
+    });
+})();
+</script>"""
+
+
+def folder_images(site_dir: Path, folder: str, names) -> dict:
+    """Describe `names` inside site-relative `folder`, keyed by name.
+
+    Uses the images.json of the folder holding each image when present (a
+    `../shared/<hash>.jpg` name is looked up in images/shared/) and otherwise
+    reads just the image headers for the dimensions. Missing files are left
+    out.
+    """
+    manifests = {}
+
+    def known(subdir):
+        if subdir not in manifests:
+            manifest = site_dir / folder / subdir / FOLDER_MANIFEST_NAME
+            manifests[subdir] = (json.loads(manifest.read_text(encoding='utf-8')).get('images', {})
+                                 if manifest.exists() else {})
+        return manifests[subdir]
+
+    images = {}
+    for name in names:
+        subdir, base = posixpath.split(name)
+        info = known('').get(name) or (known(subdir).get(base) if subdir else None)
+        if info:
+            images[name] = info
+            continue
+        path = site_dir / folder / name
+        try:
+            with Image.open(path) as img:
+                width, height = img.size
+        except OSError:
+            continue
+        images[name] = {'width': width, 'height': height, 'variants': []}
+    return images
+
+
+def _srcsets(folder_url: str, name: str, info: dict):
+    """(mime type, srcset) per variant format, best format first."""
+    base = posixpath.dirname(name)
+    out = []
+    for fmt in FORMAT_ORDER:
+        variants = [v for v in info.get('variants', []) if v['format'] == fmt]
+        if not variants:
+            continue
+        # The JPEG stays in <img src>; a typed <source> lists only its own format
+        entries = [f"{folder_url}{posixpath.join(base, v['src'])} {v['width']}w" for v in variants]
+        out.append((variants[0]['type'], ', '.join(entries)))
+    return out
+
+
+def picture(folder_url: str, name: str, info: dict, alt: str, sizes: str, attrs: str, defer: bool = False) -> str:
+    """`<img>` (wrapped in `<picture>` when variants exist) for one image.
+
+    With `defer` the URLs go into `data-src`/`data-srcset` for GALLERY_LOADER.
+    """
+    prefix = 'data-' if defer else ''
+    src = html.escape(folder_url + name)
+    style = ''
+    if info.get('placeholder'):
+        style = f' style="background: url({info["placeholder"]}) center / contain no-repeat"'
+    img = (f'<img {prefix}src="{src}" width="{info["width"]}" height="{info["height"]}" alt="{html.escape(alt)}" '
+           f'{attrs} decoding="async"{style}>')
+    sources = _srcsets(folder_url, name, info)
+    if not sources:
+        return img
+    lines = [f'<source type="{mime}" {prefix}srcset="{html.escape(srcset)}" sizes="{sizes}">' for mime, srcset in sources]
+    return '<picture>' + ''.join(lines) + img + '</picture>'
+
+
+def preload_link(folder_url: str, name: str, info: dict) -> str:
+    sources = _srcsets(folder_url, name, info)
+    if not sources:
+        return f'<link rel="preload" as="image" href="{html.escape(folder_url + name)}" fetchpriority="high">'
+    # Preload the best format; browsers skip preloads whose type they cannot decode
+    mime, srcset = sources[0]
+    return (f'<link rel="preload" as="image" type="{mime}" imagesrcset="{html.escape(srcset)}" '
+            f'imagesizes="{BANNER_SIZES}" fetchpriority="high">')
+
+
+def inject_images(text: str, site_dir: Path, t: dict = None) -> str:
+    """Render IMG_CONFIG's banner and screenshots into the page markup.
+
+    `t` is the page's TRANSLATIONS entry: its banner_alt and screenshot_alt
+    are the images' alt text (English without it). Idempotent: the
+    containers' previous images and the previous preload link are replaced,
+    not duplicated. Pages without IMG_CONFIG are returned as is.
+    """
+    text = site_assets.resolve_aliases(text, site_assets.load_aliases(site_dir))
+    config = site_assets.img_config(text)
+    if not config:
+        return text
+    folder_url = config['folder']
+    folder = site_assets.site_path(folder_url)
+    names = ([config['banner']] if config['banner'] else []) + config['screenshots']
+    images = folder_images(site_dir, folder, names)
+    for name in names:
+        if name not in images:
+            print(f"Warning: {posixpath.join(folder, name)} not found, left out of the page")
+
+    t = t or {}
+    banner_alt = t.get('banner_alt', 'Main Banner')
+    screenshot_alt = t.get('screenshot_alt', 'Screenshot')
+
+    out = re.sub(r'\s*' + re.escape(PRELOAD_MARK) + r'\n\s*<link rel="preload"[^>]*>', '', text)
+    banner = images.get(config['banner'])
+    if banner:
+        link = preload_link(folder_url, config['banner'], banner)
+        out = out.replace('</head>', f'    {PRELOAD_MARK}\n    {link}\n</head>', 1)
+
+        def sub_banner(m):
+            alt = ALT_TEXT_RE.search(m.group(2))
+            img = picture(folder_url, config['banner'], banner, banner_alt, BANNER_SIZES,
+                          'class="fill-img loaded" fetchpriority="high"')
+            return f'{m.group(1)}\n                {alt.group(0) if alt else ""}{img}\n            {m.group(3)}'
+
+        out = BANNER_AREA_RE.sub(sub_banner, out, count=1)
+
+    items = []
+    for index, name in enumerate(config['screenshots']):
+        info = images.get(name)
+        if not info:
+            continue
+        onload = 'onload="this.classList.add(\'loaded\')"'
+        if not items:
+            img = picture(folder_url, name, info, f'{screenshot_alt} {index + 1}', SCREENSHOT_SIZES,
+                          f'class="fill-img" fetchpriority="low" {onload}')
+            items.append(f'                <div class="screenshot-item">{img}</div>\n')
+        else:
+            img = picture(folder_url, name, info, f'{screenshot_alt} {index + 1}', SCREENSHOT_SIZES,
+                          f'class="fill-img" {onload}', defer=True)
+            items.append(f'                <div class="screenshot-item" data-deferred>{img}</div>\n')
+    out = LOADER_RE.sub('', out)
+    if items:
+        out = GALLERY_RE.sub(lambda m: m.group(1) + '\n' + ''.join(items) + '            ' + m.group(3),
+                              out, count=1)
+        if len(items) > 1:
+            out = out.replace('</body>', f'    {GALLERY_LOADER}\n</body>', 1)
+    return out
+
+
+def images_fingerprint(config: dict, site_dir: Path) -> str:
+    """Stat signature of every file `inject_images` reads for an IMG_CONFIG."""
+    folder = site_assets.site_path(config['folder'])
+    aliases = site_assets.load_aliases(site_dir)
+    paths = [posixpath.join(folder, FOLDER_MANIFEST_NAME), site_assets.ALIASES_PATH]
+    for name in [config['banner']] + config['screenshots']:
+        if name:
+            path = posixpath.normpath(posixpath.join(folder, name))
+            path = aliases.get(path, path)
+            paths += [path, posixpath.join(posixpath.dirname(path), FOLDER_MANIFEST_NAME)]
+    parts = []
+    for path in paths:
+        try:
+            st = (site_dir / path).stat()
+            parts.append(f'{path}:{st.st_size}:{st.st_mtime_ns}')
+        except OSError:
+            parts.append(f'{path}:-')
+    return '|'.join(parts)
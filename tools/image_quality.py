@@ -0,0 +1,107 @@
+"""
+Perceptual JPEG quality search used by `convert_images.py --target-ssim/--max-bytes`.
+
+`ssim` is a vectorized single-scale SSIM on the luma channel with a uniform
+7x7 window (the same defaults as scikit-image), computed with summed-area
+tables so a full-resolution screenshot takes well under a second.
+
+Note: Requires NumPy. Install with `pip install numpy`.
+"""
+
+import io
+
+import numpy as np
+from PIL import Image
+
+WINDOW = 7
+# Constants from Wang et al. 2004 for 8-bit data
+C1 = (0.01 * 255) ** 2
+C2 = (0.03 * 255) ** 2
+
+
+def _window_mean(x: np.ndarray, size: int) -> np.ndarray:
+    """Mean over every `size` x `size` window ("valid" positions only)."""
+    s = np.zeros((x.shape[0] + 1, x.shape[1] + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(x, axis=0), axis=1, out=s[1:, 1:])
+    total = s[size:, size:] - s[:-size, size:] - s[size:, :-size] + s[:-size, :-size]
+    return total / (size * size)
+
+
+def luma(img: Image.Image) -> np.ndarray:
+    return np.asarray(img.convert('L'), dtype=np.float64)
+
+
+def ssim(a: np.ndarray, b: np.ndarray, size: int = WINDOW) -> float:
+    """Mean structural similarity between two equally sized luma arrays."""
+    if a.shape != b.shape:
+        raise ValueError(f"shape mismatch: {a.shape} vs {b.shape}")
+    mu_a = _window_mean(a, size)
+    mu_b = _window_mean(b, size)
+    # Sample (co)variances, matching scikit-image's default normalisation
+    n = size * size
+    cov_norm = n / (n - 1)
+    var_a = cov_norm * (_window_mean(a * a, size) - mu_a * mu_a)
+    var_b = cov_norm * (_window_mean(b * b, size) - mu_b * mu_b)
+    cov_ab = cov_norm * (_window_mean(a * b, size) - mu_a * mu_b)
+
+    num = (2 * mu_a * mu_b + C1) * (2 * cov_ab + C2)
+    den = (mu_a * mu_a + mu_b * mu_b + C1) * (var_a + var_b + C2)
+    return float(np.mean(num / den))
+
+
+def encode_jpeg(rgb: Image.Image, quality: int) -> bytes:
+    buf = io.BytesIO()
+    rgb.save(buf, format='JPEG', quality=quality, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+def search_quality(rgb: Image.Image, max_quality: int, min_quality: int = 40,
+                   target_ssim: float = 0.0, max_bytes: int = 0):
+    """Find the lowest JPEG quality meeting `target_ssim` within `max_bytes`.
+
+    Both constraints are monotonic in quality, so each is a binary search over
+    [min_quality, max_quality]. When they conflict the byte budget wins.
+    Returns (quality, data, score, baseline_bytes) where score is the SSIM of
+    the chosen encoding (or None when no SSIM target was given) and
+    baseline_bytes the size at `max_quality`. The chosen encoding is larger
+    than `max_bytes` only when even `min_quality` is.
+    """
+    reference = luma(rgb) if target_ssim else None
+    encoded = {}
+    scores = {}
+
+    def encode(q):
+        if q not in encoded:
+            encoded[q] = encode_jpeg(rgb, q)
+        return encoded[q]
+
+    def score(q):
+        if q not in scores:
+            with Image.open(io.BytesIO(encode(q))) as decoded:
+                scores[q] = ssim(reference, luma(decoded))
+        return scores[q]
+
+    chosen = max_quality
+    if target_ssim:
+        lo, hi = min_quality, max_quality
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if score(mid) >= target_ssim:
+                hi = mid
+            else:
+                lo = mid + 1
+        chosen = lo
+    if max_bytes and len(encode(chosen)) > max_bytes:
+        lo, hi = min_quality, chosen
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if len(encode(mid)) <= max_bytes:
+                lo = mid
+            else:
+                hi = mid - 1
+        chosen = lo
+
+    # The byte search starts from max_quality, so this only encodes again
+    # after an SSIM-only search that stopped below it
+    baseline_bytes = len(encode(max_quality))
+    return chosen, encode(chosen), score(chosen) if target_ssim else None, baseline_bytes
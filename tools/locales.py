@@ -0,0 +1,190 @@
+"""
+The single list of Love Marble locales and the site files generated from it.
+
+LOCALES drives:
+  * `translate_pages.py` (FILE_LANG_MAP: page -> TRANSLATIONS key, image folder);
+  * the hreflang `<link rel="alternate">` block of every lovemarble page;
+  * `sitemap.xml`, whose `<lastmod>` is the date a page's content hash last
+    changed (kept in `.sitemap-state.json`, which is local state and not
+    committed), so unchanged pages keep a stable value and crawlers do not
+    re-fetch them. Pages without recorded state get no `<lastmod>`;
+  * the "Supported Languages" line and language counts of `llms.txt`.
+Adding a locale means adding one entry here (plus its TRANSLATIONS entry).
+
+Usage:
+  python tools/locales.py [--site-dir .] [--pages-dir DIR] [--out-dir DIR] [--date YYYY-MM-DD]
+
+Options:
+  --site-dir      Directory holding the pages, sitemap.xml and llms.txt (default: .)
+  --pages-dir     Directory holding the built lovemarble pages; their hreflang
+                  blocks are rewritten and their content is hashed for
+                  <lastmod> (default: --site-dir)
+  --out-dir       Where sitemap.xml and llms.txt are written (default: --site-dir)
+  --date          Date recorded for pages whose content changed (default: today)
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from xml.sax.saxutils import escape
+
+SITE_URL = 'https://terriongames.com/'
+STATE_NAME = '.sitemap-state.json'
+
+
+@dataclass(frozen=True)
+class Locale:
+    code: str                    # page suffix and images/<code>/ folder
+    hreflang: str
+    name: str                    # English name used in llms.txt
+    translation: Optional[str]   # TRANSLATIONS key; None for the English template
+
+    @property
+    def page(self) -> str:
+        return 'lovemarble.html' if self.translation is None else f'lovemarble_{self.code}.html'
+
+
+# Order is the order of the hreflang block, the sitemap and llms.txt
+LOCALES = [
+    Locale('en', 'en', 'English (Base Origin)', None),
+    Locale('ko', 'ko', 'Korean', 'ko'),
+    Locale('ja', 'ja', 'Japanese', 'ja'),
+    Locale('zh-TW', 'zh-TW', 'Traditional Chinese (TW/HK)', 'zh-TW'),
+    Locale('th', 'th', 'Thai', 'th'),
+    Locale('vi', 'vi', 'Vietnamese', 'vi'),
+    Locale('hi', 'hi', 'Hindi', 'hi'),
+    Locale('id', 'id', 'Indonesian', 'id'),
+    Locale('fr', 'fr', 'French', 'fr'),
+    Locale('de', 'de', 'German', 'de'),
+    Locale('es-ES', 'es-ES', 'Spanish (Spain)', 'es'),
+    Locale('es-MX', 'es-MX', 'Spanish (Latin America/Mexico)', 'es'),
+    Locale('pt-BR', 'pt-BR', 'Portuguese (Brazil)', 'pt-BR'),
+    Locale('it', 'it', 'Italian', 'it'),
+    Locale('ru', 'ru', 'Russian', 'ru'),
+    Locale('tr', 'tr', 'Turkish', 'tr'),
+]
+DEFAULT_LOCALE = LOCALES[0]
+
+# (path, priority) of the pages outside the locale set; '' is the home page
+SITE_PAGES = [('', '1.0', 'index.html'), ('lovemarble.html', '0.9', 'lovemarble.html'),
+              ('privacy.html', '0.5', 'privacy.html')]
+LOCALE_PRIORITY = '0.8'
+
+HREFLANG_BLOCK_RE = re.compile(r'(?P<indent>[ \t]*)<link rel="alternate" hreflang="[^"]+"[^>]*>'
+                               r'(?:\s*<link rel="alternate" hreflang="[^"]+"[^>]*>)*')
+LANGUAGES_LINE_RE = re.compile(r'^(\* \*\*Supported Languages \()\d+(\):\*\*) .*?\.(\s*)$', re.M)
+OTHER_LANGUAGES_RE = re.compile(r'\b\d+ other languages\b')
+N_LANGUAGE_RE = re.compile(r'\b\d+-language\b')
+
+
+def file_lang_map() -> dict:
+    """{page name: TRANSLATIONS key} for every translated page."""
+    return {loc.page: loc.translation for loc in LOCALES if loc.translation}
+
+
+def hreflang_links(indent: str = '    ') -> str:
+    links = [f'<link rel="alternate" hreflang="x-default" href="{SITE_URL}{DEFAULT_LOCALE.page}" />']
+    links += [f'<link rel="alternate" hreflang="{loc.hreflang}" href="{SITE_URL}{loc.page}" />' for loc in LOCALES]
+    return '\n'.join(indent + link for link in links)
+
+
+def apply_hreflang(text: str) -> str:
+    """Replace the page's hreflang block with the one generated from LOCALES."""
+    return HREFLANG_BLOCK_RE.sub(lambda m: hreflang_links(m.group('indent')), text, count=1)
+
+
+def apply_llms(text: str) -> str:
+    """Regenerate the languages line and the language counts of llms.txt."""
+    n = len(LOCALES)
+    names = ', '.join(loc.name for loc in LOCALES)
+    text = LANGUAGES_LINE_RE.sub(lambda m: f'{m.group(1)}{n}{m.group(2)} {names}.{m.group(3)}', text)
+    text = OTHER_LANGUAGES_RE.sub(f'{n - 1} other languages', text)
+    return N_LANGUAGE_RE.sub(f'{n}-language', text)
+
+
+def sitemap_pages():
+    """(url path, priority, file name) for every page in the sitemap, in order."""
+    pages = list(SITE_PAGES)
+    listed = {name for _, _, name in pages}
+    pages += [(loc.page, LOCALE_PRIORITY, loc.page) for loc in LOCALES if loc.page not in listed]
+    return pages
+
+
+def update_lastmod(state: dict, hashes: dict, today: str) -> dict:
+    """Carry each page's lastmod forward unless its content hash changed."""
+    out = {}
+    for name, digest in hashes.items():
+        old = state.get(name)
+        out[name] = old if old and old['sha256'] == digest else {'sha256': digest, 'lastmod': today}
+    return out
+
+
+def render_sitemap(state: dict) -> str:
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for path, priority, name in sitemap_pages():
+        lines.append('  <url>')
+        lines.append(f'    <loc>{escape(SITE_URL + path)}</loc>')
+        if name in state:
+            lines.append(f'    <lastmod>{state[name]["lastmod"]}</lastmod>')
+        lines.append(f'    <priority>{priority}</priority>')
+        lines.append('  </url>')
+    lines.append('</urlset>')
+    return '\n'.join(lines) + '\n'
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    path.write_text(text, encoding='utf-8')
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate hreflang blocks, sitemap.xml and llms.txt from LOCALES.')
+    parser.add_argument('--site-dir', default='.', help='Directory with the pages, sitemap.xml and llms.txt (default: .)')
+    parser.add_argument('--pages-dir', help='Directory with the built lovemarble pages (default: --site-dir)')
+    parser.add_argument('--out-dir', help='Where sitemap.xml and llms.txt are written (default: --site-dir)')
+    parser.add_argument('--date', default=datetime.date.today().isoformat(),
+                        help='lastmod for pages whose content changed (default: today)')
+    args = parser.parse_args()
+
+    site_dir = Path(args.site_dir)
+    pages_dir = Path(args.pages_dir) if args.pages_dir else site_dir
+    out_dir = Path(args.out_dir) if args.out_dir else site_dir
+
+    hashes = {}
+    for _, _, name in sitemap_pages():
+        path = pages_dir / name if (pages_dir / name).exists() else site_dir / name
+        if not path.exists():
+            print(f"Missing page: {name}")
+            continue
+        text = path.read_text(encoding='utf-8')
+        if name.startswith('lovemarble'):
+            new = apply_hreflang(text)
+            if new != text:
+                path.write_text(new, encoding='utf-8')
+                print(f"Rewrote hreflang block in {path}")
+                text = new
+        hashes[name] = hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    state_path = site_dir / STATE_NAME
+    state = json.loads(state_path.read_text(encoding='utf-8')) if state_path.exists() else {}
+    state = update_lastmod(state, hashes, args.date)
+    _write_if_changed(state_path, json.dumps(state, indent=2, sort_keys=True) + '\n')
+    if _write_if_changed(out_dir / 'sitemap.xml', render_sitemap(state)):
+        print(f"Wrote {out_dir / 'sitemap.xml'}")
+
+    llms = site_dir / 'llms.txt'
+    if llms.exists() and _write_if_changed(out_dir / 'llms.txt', apply_llms(llms.read_text(encoding='utf-8'))):
+        print(f"Wrote {out_dir / 'llms.txt'}")
+    print(f"Done. {len(LOCALES)} locales, {len(hashes)} pages in the sitemap.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+"""
+Serve the deploy bundle locally with the headers planned for production, so
+caching, compression and mobile load times can be checked without pushing.
+
+  * Precompressed siblings written by compress_site.py are negotiated from
+    `Accept-Encoding` (`br` before `gzip`, honouring q-values); the response
+    carries `Content-Encoding` and `Vary: Accept-Encoding`.
+  * Every response has a strong `ETag` (hash of the bytes sent, cached by
+    size and mtime); a matching `If-None-Match` gets `304 Not Modified`.
+  * Fingerprinted files (`name.<hash>.ext`, see fingerprint_assets.py) get
+    `Cache-Control: public, max-age=31536000, immutable`; everything else,
+    HTML included, `no-cache` so it is revalidated through the ETag.
+  * `--latency` delays the first byte of each response and `--bandwidth`
+    paces the body per connection; `--throttle` picks a preset from
+    THROTTLE_PRESETS (Lighthouse's slow 4G, a regular 3G link).
+Each request is logged with its status, encoding, bytes, cache policy and
+time to first byte / total time. GET and HEAD only; connections are kept
+alive.
+
+Usage:
+  python tools/serve.py [--dir dist] [--host 127.0.0.1] [--port 8000]
+                        [--throttle slow-4g|3g] [--latency MS] [--bandwidth KBPS]
+
+Options:
+  --dir           Directory to serve (default: dist)
+  --host          Interface to bind (default: 127.0.0.1)
+  --port          Port to listen on (default: 8000)
+  --throttle      Latency/bandwidth preset: slow-4g or 3g
+  --latency       Added delay before each response, in ms (overrides the preset)
+  --bandwidth     Per-connection throughput cap, in kbit/s (overrides the preset)
+"""
+
+import argparse
+import asyncio
+import hashlib
+import mimetypes
+import time
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from fingerprint_assets import HASHED_RE
+
+# name -> (latency ms, bandwidth kbit/s)
+THROTTLE_PRESETS = {
+    'slow-4g': (150, 1638.4),
+    '3g': (300, 700),
+}
+# (Accept-Encoding token, sibling suffix, Content-Encoding), preferred first
+ENCODINGS = (('br', '.br', 'br'), ('gzip', '.gz', 'gzip'))
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+CHUNK_SIZE = 16 * 1024
+MAX_HEADER_LINES = 100
+TYPES = {'.woff2': 'font/woff2', '.avif': 'image/avif', '.webp': 'image/webp', '.js': 'text/javascript',
+         '.json': 'application/json', '.txt': 'text/plain; charset=utf-8', '.xml': 'application/xml'}
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+_etags = {}
+
+
+def content_type(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in TYPES:
+        return TYPES[suffix]
+    guessed = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+    return guessed + '; charset=utf-8' if guessed.startswith('text/') else guessed
+
+
+def etag(path: Path) -> str:
+    st = path.stat()
+    key = (str(path), st.st_size, st.st_mtime_ns)
+    if key not in _etags:
+        _etags[key] = '"' + hashlib.sha256(path.read_bytes()).hexdigest()[:16] + '"'
+    return _etags[key]
+
+
+def accepted_encodings(header: str) -> dict:
+    """{token: q} from an Accept-Encoding header."""
+    out = {}
+    for part in header.split(','):
+        token, _, params = part.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            out[token.strip().lower()] = q
+    return out
+
+
+def negotiate(path: Path, accept_encoding: str):
+    """(file to send, Content-Encoding or None, whether siblings exist)."""
+    accepted = accepted_encodings(accept_encoding)
+    has_siblings = False
+    best = (path, None, 0.0)
+    for token, suffix, encoding in ENCODINGS:
+        sibling = path.with_name(path.name + suffix)
+        if not sibling.is_file():
+            continue
+        has_siblings = True
+        q = accepted.get(token, accepted.get('*', 0.0))
+        if q > best[2]:
+            best = (sibling, encoding, q)
+    return best[0], best[1], has_siblings
+
+
+def cache_control(path: Path) -> str:
+    return IMMUTABLE if HASHED_RE.search(path.name) else REVALIDATE
+
+
+def etag_matches(header: str, tag: str) -> bool:
+    if header.strip() == '*':
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return any(candidate.strip().removeprefix('W/') == tag for candidate in header.split(','))
+
+
+class Server:
+    def __init__(self, root: Path, latency: float = 0, bandwidth: float = 0):
+        self.root = root.resolve()
+        self.latency = latency / 1000
+        # kbit/s -> bytes/s
+        self.rate = bandwidth * 1000 / 8
+
+    def resolve(self, target: str):
+        """File for a request target, or None when missing or outside the root."""
+        path = unquote(urlsplit(target).path)
+        try:
+            candidate = (self.root / path.lstrip('/')).resolve()
+            if candidate != self.root and self.root not in candidate.parents:
+                return None
+            if candidate.is_dir():
+                candidate = candidate / 'index.html'
+            return candidate if candidate.is_file() else None
+        except (ValueError, OSError):
+            # An embedded NUL byte, a name too long for the filesystem, ...
+            return None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while await self.handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, reader, writer) -> bool:
+        """Serve one request; return whether the connection stays open."""
+        line = await reader.readline()
+        if not line:
+            return False
+        start = time.perf_counter()
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            header = await reader.readline()
+            if header in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = header.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3:
+            await self.respond(writer, 400, {}, b'', start, '-', '-')
+            return False
+        method, target, version = parts
+        length = headers.get('content-length', '').strip() or '0'
+        if not (length.isascii() and length.isdigit()):
+            # Malformed or negative: the body cannot be skipped, so close
+            await self.respond(writer, 400, {}, b'', start, method, target)
+            return False
+        if int(length):
+            await reader.readexactly(int(length))
+        keep_alive = (headers.get('connection', '').lower() != 'close'
+                      and (version == 'HTTP/1.1' or headers.get('connection', '').lower() == 'keep-alive'))
+
+        if method not in ('GET', 'HEAD'):
+            await self.respond(writer, 405, {'Allow': 'GET, HEAD'}, b'', start, method, target)
+            return keep_alive
+        path = self.resolve(target)
+        if path is None:
+            await self.respond(writer, 404, {'Content-Type': 'text/plain; charset=utf-8'},
+                               b'Not Found\n', start, method, target, head=method == 'HEAD')
+            return keep_alive
+
+        file, encoding, has_siblings = negotiate(path, headers.get('accept-encoding', ''))
+        # File reads (and hashing on an ETag cache miss) stay off the event loop
+        tag = await asyncio.to_thread(etag, file)
+        response = {'Content-Type': content_type(path), 'Cache-Control': cache_control(path), 'ETag': tag}
+        if has_siblings:
+            response['Vary'] = 'Accept-Encoding'
+        if encoding:
+            response['Content-Encoding'] = encoding
+        if 'if-none-match' in headers and etag_matches(headers['if-none-match'], tag):
+            await self.respond(writer, 304, response, b'', start, method, target)
+        else:
+            body = await asyncio.to_thread(file.read_bytes)
+            await self.respond(writer, 200, response, body, start, method, target, head=method == 'HEAD')
+        return keep_alive
+
+    async def respond(self, writer, status, headers, body, start, method, target, head=False):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        lines = [f'HTTP/1.1 {status} {REASONS[status]}', f'Date: {formatdate(usegmt=True)}']
+        if status != 304:
+            lines.append(f'Content-Length: {len(body)}')
+        lines += [f'{name}: {value}' for name, value in headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+        ttfb = time.perf_counter() - start
+        sent = 0
+        if not head and status != 304:
+            for pos in range(0, len(body), CHUNK_SIZE):
+                chunk = body[pos:pos + CHUNK_SIZE]
+                writer.write(chunk)
+                await writer.drain()
+                sent += len(chunk)
+                if self.rate:
+                    await asyncio.sleep(len(chunk) / self.rate)
+        total = time.perf_counter() - start
+        policy = 'immutable' if headers.get('Cache-Control') == IMMUTABLE else ''
+        print(f"{status} {method:<4} {target:<48} {headers.get('Content-Encoding', '-'):<5} {sent:>9} B  "
+              f"ttfb {ttfb * 1000:7.1f} ms  total {total * 1000:8.1f} ms  {policy}", flush=True)
+
+
+async def serve(root: Path, host: str, port: int, latency: float, bandwidth: float):
+    server = Server(root, latency, bandwidth)
+    listener = await asyncio.start_server(server.handle, host, port)
+    throttle = f", {latency:.0f} ms latency, {bandwidth:.0f} kbit/s" if latency or bandwidth else ''
+    print(f"Serving {server.root} at http://{host}:{port}/{throttle} (Ctrl+C to stop)", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the deploy bundle with production-like headers.')
+    parser.add_argument('--dir', default='dist', help='Directory to serve (default: dist)')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on (default: 8000)')
+    parser.add_argument('--throttle', choices=sorted(THROTTLE_PRESETS), help='Latency/bandwidth preset')
+    parser.add_argument('--latency', type=float, help='Delay before each response in ms (overrides the preset)')
+    parser.add_argument('--bandwidth', type=float, help='Per-connection cap in kbit/s (overrides the preset)')
+    args = parser.parse_args()
+
+    root = Path(args.dir)
+    if not root.is_dir():
+        print(f"Directory not found: {root}")
+        return
+    latency, bandwidth = THROTTLE_PRESETS.get(args.throttle, (0, 0))
+    if args.latency is not None:
+        latency = args.latency
+    if args.bandwidth is not None:
+        bandwidth = args.bandwidth
+    try:
+        asyncio.run(serve(root, args.host, args.port, latency, bandwidth))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Helpers shared by the tools that move or rename files under `images/` and
+need every page reference to keep resolving.
+
+Pages reference images in two ways:
+  * plain attribute URLs such as `images/icon.png` or the absolute
+    `https://terriongames.com/images/og-image.jpg` used by og:/twitter: tags;
+  * the inline `IMG_CONFIG` object, whose file names are resolved at runtime
+    relative to `IMG_CONFIG.folder`.
+
+`images/shared/aliases.json` (written by dedupe_images.py) maps the site
+path of every image collapsed into the shared store to its stored copy;
+`resolve_aliases` applies it to a rendered page. Absolute URLs are public:
+shared link previews and other sites keep using them, so the tools leave
+them as written (`absolute=False`) and keep the files they name in place.
+"""
+import json
+import posixpath
+import re
+from pathlib import Path
+
+SITE_URL = 'https://terriongames.com/'
+# Written by dedupe_images.py --apply
+ALIASES_PATH = 'images/shared/aliases.json'
+
+IMG_CONFIG_RE = re.compile(r'(const IMG_CONFIG\s*=\s*\{)(.*?)(\};)', re.S)
+FOLDER_RE = re.compile(r'folder:\s*"([^"]*)"')
+IMAGE_NAME_RE = re.compile(r'"([^"]+\.(?:jpe?g|png|webp|avif))"', re.I)
+ASSET_URL_RE = re.compile(r'(?P<prefix>' + re.escape(SITE_URL) + r'|\./|(?<=["\'(]))'
+                          r'(?P<path>(?:images|css)/[^"\'\s)?#]+)')
+
+
+def img_config(text: str):
+    """Return {'folder', 'banner', 'screenshots'} for the page's IMG_CONFIG, or None."""
+    m = IMG_CONFIG_RE.search(text)
+    if not m:
+        return None
+    body = m.group(2)
+    folder = FOLDER_RE.search(body)
+    banner = re.search(r'banner:\s*"([^"]*)"', body)
+    shots = re.search(r'screenshots:\s*\[(.*?)\]', body, re.S)
+    return {
+        'folder': folder.group(1) if folder else '',
+        'banner': banner.group(1) if banner else '',
+        'screenshots': re.findall(r'"([^"]+)"', shots.group(1)) if shots else [],
+    }
+
+
+def site_path(url: str) -> str:
+    """Normalize a page-relative reference to a path relative to the site root."""
+    if url.startswith(SITE_URL):
+        url = url[len(SITE_URL):]
+    return posixpath.normpath(url.lstrip('/')) if url else url
+
+
+def rewrite_img_config(text: str, fn):
+    """Rewrite IMG_CONFIG file names.
+
+    `fn(folder_path, site_path)` gets the folder relative to the site root and
+    the resolved image path; it returns a new site path or None to keep it.
+    Names stay relative to `IMG_CONFIG.folder` so the runtime lookup works.
+    """
+    def sub_block(m):
+        body = m.group(2)
+        folder = FOLDER_RE.search(body)
+        folder_url = folder.group(1) if folder else ''
+        base = site_path(folder_url)
+
+        def sub_name(n):
+            name = n.group(1)
+            new = fn(base, site_path(posixpath.join(folder_url, name)))
+            if not new:
+                return n.group(0)
+            return '"' + posixpath.relpath(new, base) + '"'
+
+        return m.group(1) + IMAGE_NAME_RE.sub(sub_name, body) + m.group(3)
+
+    return IMG_CONFIG_RE.sub(sub_block, text)
+
+
+def rewrite_asset_urls(text: str, fn, absolute: bool = True):
+    """Rewrite `images/...` and `css/...` URLs (IMG_CONFIG names are bare file
+    names and are handled by `rewrite_img_config`).
+
+    `fn(site_path)` returns the new site path or None to keep the reference.
+    The URL keeps its original form (absolute, `./` or bare); with
+    `absolute=False`, SITE_URL URLs are left alone.
+    """
+    def sub(m):
+        if not absolute and m.group('prefix') == SITE_URL:
+            return m.group(0)
+        new = fn(site_path(m.group('path')))
+        return m.group(0) if not new else m.group('prefix') + new
+
+    return ASSET_URL_RE.sub(sub, text)
+
+
+def absolute_asset_paths(text: str) -> set:
+    """Site paths the page references through absolute SITE_URL URLs."""
+    return {site_path(m.group('path')) for m in ASSET_URL_RE.finditer(text) if m.group('prefix') == SITE_URL}
+
+
+def load_aliases(site_dir: Path) -> dict:
+    """{site path: shared store path} from ALIASES_PATH; empty when there is none."""
+    path = site_dir / ALIASES_PATH
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def resolve_aliases(text: str, aliases: dict) -> str:
+    """Point the page's image URLs and IMG_CONFIG names at their shared copies."""
+    if not aliases:
+        return text
+    text = rewrite_asset_urls(text, aliases.get, absolute=False)
+    return rewrite_img_config(text, lambda base, p: aliases.get(p))
@@ -0,0 +1,321 @@
+"""
+Self-host Montserrat and Fira Code as per-page subsetted WOFF2 files instead
+of loading them from fonts.googleapis.com.
+
+For every page the visible text is split by the family it is set in: text
+inside an element whose class (or inline style) selects 'Fira Code' in the
+page's stylesheets goes to Fira Code, everything else to Montserrat. Each
+weight of a family is subset to exactly the code points its text uses that
+the font actually covers. Scripts the fonts do not cover (Devanagari, Thai,
+CJK, Hangul) are left out, so those pages keep their system fallback
+instead of downloading glyphs they never use.
+
+The subsets are written to `fonts/<family>-<weight>.<hash>.woff2` next to
+the pages (OUT_DIR for `translate_pages.py --render`, never the source tree's
+`fonts/`), where the hash covers the source font and the code point set, so
+identical subsets are shared between pages and existing files are never
+rebuilt. The page's Google
+Fonts link and preconnects are replaced by an inline `<style data-fonts>`
+block of `@font-face` rules with `unicode-range` and `font-display: swap`,
+and `<link rel="preload" as="font">` hints for the weights the hero uses.
+
+Sources are the static TTFs listed in FONT_SOURCES under `fonts/src/` (from
+the families' Google Fonts downloads). Pages are left untouched when
+fontTools or a source file is missing; the CLI and `build.py` then stop
+with the list of missing files, and `translate_pages.py --render` warns.
+
+`translate_pages.py --render` applies this to every page. The CLI reports
+the code points and font bytes per page; `--apply` rewrites pages in place.
+
+Usage:
+  python tools/subset_fonts.py [--pages-dir .] [--site-dir .] [--apply]
+
+Options:
+  --pages-dir     Directory holding the *.html pages (default: .)
+  --site-dir      Directory holding css/ and fonts/src/ (default: --pages-dir)
+  --apply         Rewrite the pages in place instead of only reporting
+
+Note: Requires fontTools and brotli (`pip install fonttools brotli`).
+"""
+
+import argparse
+import hashlib
+import html
+import io
+import logging
+import os
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+try:
+    from fontTools import subset as ft_subset
+    from fontTools.ttLib import TTFont
+except ImportError:  # pages keep Google Fonts
+    ft_subset = None
+
+import critical_css
+import tracing
+
+FONTS_DIR = 'fonts'
+SOURCE_DIR = 'fonts/src'
+# (family, weight) -> static TTF under fonts/src/, matching the weights the
+# pages requested from Google Fonts
+FONT_SOURCES = {
+    ('Montserrat', 400): 'Montserrat-Regular.ttf',
+    ('Montserrat', 700): 'Montserrat-Bold.ttf',
+    ('Montserrat', 900): 'Montserrat-Black.ttf',
+    ('Fira Code', 300): 'FiraCode-Light.ttf',
+    ('Fira Code', 500): 'FiraCode-Medium.ttf',
+}
+DEFAULT_FAMILY = 'Montserrat'
+# Weights painted in the hero: body copy and the game title
+PRELOAD = (('Montserrat', 400), ('Montserrat', 900))
+
+GOOGLE_FONTS_RE = re.compile(r'[ \t]*<link\b[^>]*\bhref="https://fonts\.googleapis\.com/css2?\?[^"]*"[^>]*>'
+                             r'(?:<noscript>.*?</noscript>)?\n?')
+PRECONNECT_RE = re.compile(r'[ \t]*<link rel="preconnect" href="https://fonts\.(?:googleapis|gstatic)\.com"[^>]*>\n?')
+FAMILY_RE = re.compile(r'font-family\s*:\s*[\'"]?([^\'",;]+)')
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'head'}
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+
+def missing_sources(site_dir: Path):
+    """FONT_SOURCES file names not present under `site_dir`/fonts/src."""
+    return [name for name in FONT_SOURCES.values() if not (site_dir / SOURCE_DIR / name).exists()]
+
+
+def available(site_dir: Path) -> bool:
+    return ft_subset is not None and not missing_sources(site_dir)
+
+
+def family_classes(css_texts):
+    """Classes whose rules set one of our non-default families: {class: family}."""
+    families = {family for family, _ in FONT_SOURCES}
+    out = {}
+    for css in css_texts:
+        for prelude, body in _flatten(critical_css.parse_css(css)):
+            m = FAMILY_RE.search(body)
+            if not m or m.group(1).strip() not in families - {DEFAULT_FAMILY}:
+                continue
+            for selector in prelude.split(','):
+                last = critical_css.COMBINATOR_RE.split(critical_css.PSEUDO_RE.sub('', selector).strip())[-1]
+                for cls in re.findall(r'\.([\w-]+)', last):
+                    out[cls] = m.group(1).strip()
+    return out
+
+
+def _flatten(blocks):
+    for prelude, body in blocks:
+        if body is None or prelude.startswith(('@font-face', '@keyframes')):
+            continue
+        if prelude.startswith('@'):
+            yield from _flatten(critical_css.parse_css(body))
+        else:
+            yield prelude, body
+
+
+class _TextByFamily(HTMLParser):
+    def __init__(self, classes):
+        super().__init__(convert_charrefs=True)
+        self.classes = classes
+        self.stack = []
+        self.text = {}
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        family = self.stack[-1][1] if self.stack else DEFAULT_FAMILY
+        skip = tag in SKIP_TAGS or bool(self.stack and self.stack[-1][2])
+        for cls in (attrs.get('class') or '').split():
+            family = self.classes.get(cls, family)
+        m = FAMILY_RE.search(attrs.get('style') or '')
+        if m and m.group(1).strip() in {f for f, _ in FONT_SOURCES}:
+            family = m.group(1).strip()
+        if tag == 'img' and attrs.get('alt'):
+            self.text.setdefault(family, set()).update(attrs['alt'])
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, family, skip))
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                del self.stack[i:]
+                break
+
+    def handle_data(self, data):
+        if self.stack and self.stack[-1][2]:
+            return
+        family = self.stack[-1][1] if self.stack else DEFAULT_FAMILY
+        self.text.setdefault(family, set()).update(data)
+
+
+def text_by_family(text: str, classes) -> dict:
+    """{family: set of characters} for the page's visible text."""
+    parser = _TextByFamily(classes)
+    parser.feed(text)
+    parser.close()
+    return {family: {c for c in chars if not c.isspace()} | {' '} for family, chars in parser.text.items()}
+
+
+def unicode_range(codepoints) -> str:
+    ranges = []
+    for cp in sorted(codepoints):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ','.join(f'U+{a:X}' if a == b else f'U+{a:X}-{b:X}' for a, b in ranges)
+
+
+_cmaps = {}
+_digests = {}
+
+
+def _cmap(path: Path):
+    key = (str(path), path.stat().st_mtime_ns)
+    if key not in _cmaps:
+        with TTFont(path, lazy=True) as font:
+            _cmaps[key] = set(font.getBestCmap())
+    return _cmaps[key]
+
+
+def _digest(path: Path):
+    """sha256 of a source font, read once per process and file version; copy before updating."""
+    key = (str(path), path.stat().st_mtime_ns)
+    if key not in _digests:
+        _digests[key] = hashlib.sha256(path.read_bytes())
+    return _digests[key]
+
+
+def subset_font(source: Path, codepoints, out_dir: Path, stem: str) -> Path:
+    """Write the WOFF2 subset of `source` for `codepoints` (skipped if it exists)."""
+    h = _digest(source).copy()
+    h.update(unicode_range(codepoints).encode())
+    target = out_dir / f"{stem}.{h.hexdigest()[:8]}.woff2"
+    if target.exists():
+        tracing.count('font_cache_hit')
+        return target
+    tracing.count('font_cache_miss')
+    # fontTools logs every table it drops (FFTM, DSIG, ...) as a warning
+    logging.getLogger('fontTools.subset').setLevel(logging.ERROR)
+    options = ft_subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.name_IDs = []
+    options.notdef_outline = True
+    font = ft_subset.load_font(str(source), options)
+    subsetter = ft_subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    buf = io.BytesIO()
+    ft_subset.save_font(font, buf, options)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Render workers may produce the same subset concurrently
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(buf.getvalue())
+    tmp.replace(target)
+    return target
+
+
+def page_fonts(text: str, site_dir: Path, out_dir: Path = None):
+    """[(family, weight, file, codepoints)] for the subsets a page needs.
+
+    Subsets are written under `out_dir` (default: `site_dir`), the directory
+    the page is served from.
+    """
+    css_texts = [p.read_text(encoding='utf-8') for p in _local_stylesheets(text, site_dir)]
+    css_texts += re.findall(r'<style\b[^>]*>(.*?)</style>', text, re.S)
+    chars = text_by_family(text, family_classes(css_texts))
+    out = []
+    for (family, weight), name in FONT_SOURCES.items():
+        source = site_dir / SOURCE_DIR / name
+        codepoints = {ord(c) for c in chars.get(family, ())} & _cmap(source)
+        if not codepoints:
+            continue
+        stem = f"{family.lower().replace(' ', '-')}-{weight}"
+        out.append((family, weight, subset_font(source, codepoints, (out_dir or site_dir) / FONTS_DIR, stem),
+                    codepoints))
+    return out
+
+
+def _local_stylesheets(text: str, site_dir: Path):
+    for m in critical_css.STYLESHEET_RE.finditer(text):
+        path = critical_css.local_path(m.group(1), site_dir)
+        if path is not None and path.exists():
+            yield path
+
+
+def apply_fonts(text: str, site_dir: Path, out_dir: Path = None) -> str:
+    """Replace Google Fonts with self-hosted subsets; no-op when unavailable.
+
+    The page is to be written to `out_dir` (default: `site_dir`), which gets
+    the subsets under its fonts/.
+    """
+    if not GOOGLE_FONTS_RE.search(text) or not available(site_dir):
+        return text
+    faces = []
+    preloads = []
+    out_dir = out_dir or site_dir
+    for family, weight, path, codepoints in page_fonts(text, site_dir, out_dir):
+        url = './' + path.relative_to(out_dir).as_posix()
+        faces.append(f"@font-face{{font-family:'{family}';font-style:normal;font-weight:{weight};"
+                     f"font-display:swap;src:url({url}) format('woff2');unicode-range:{unicode_range(codepoints)}}}")
+        if (family, weight) in PRELOAD:
+            preloads.append(f'<link rel="preload" as="font" type="font/woff2" href="{html.escape(url)}" crossorigin>')
+    block = ''.join(f'    {p}\n' for p in preloads) + f"    <style data-fonts>{''.join(faces)}</style>\n"
+    text = PRECONNECT_RE.sub('', text)
+    return GOOGLE_FONTS_RE.sub(lambda m: block, text, count=1)
+
+
+def sources_fingerprint(site_dir: Path) -> str:
+    """What apply_fonts depends on besides the page: fontTools and the source files."""
+    if ft_subset is None:
+        return 'no-fonttools'
+    parts = []
+    for name in sorted(FONT_SOURCES.values()):
+        try:
+            st = (site_dir / SOURCE_DIR / name).stat()
+            parts.append(f'{name}:{st.st_size}:{st.st_mtime_ns}')
+        except OSError:
+            parts.append(f'{name}:-')
+    return '|'.join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Self-host per-page subsetted WOFF2 fonts.')
+    parser.add_argument('--pages-dir', default='.', help='Directory with the *.html pages (default: .)')
+    parser.add_argument('--site-dir', help='Directory with css/ and fonts/src/ (default: --pages-dir)')
+    parser.add_argument('--apply', action='store_true', help='Rewrite the pages in place')
+    args = parser.parse_args()
+
+    pages_dir = Path(args.pages_dir)
+    site_dir = Path(args.site_dir) if args.site_dir else pages_dir
+    if ft_subset is None:
+        print('fontTools is not installed (pip install fonttools brotli).')
+        sys.exit(1)
+    missing = missing_sources(site_dir)
+    if missing:
+        print(f"Missing font sources in {site_dir / SOURCE_DIR}: {', '.join(missing)}")
+        sys.exit(1)
+
+    total = 0
+    for page in sorted(pages_dir.glob('*.html')):
+        text = page.read_text(encoding='utf-8')
+        if not GOOGLE_FONTS_RE.search(text):
+            print(f"{page.name}: no Google Fonts link, skipped")
+            continue
+        fonts = page_fonts(text, site_dir, pages_dir)
+        size = sum(path.stat().st_size for _, _, path, _ in fonts)
+        total += size
+        detail = ', '.join(f"{family} {weight}: {len(cps)} cp" for family, weight, _, cps in fonts)
+        print(f"{page.name}: {size / 1024:.1f} KB ({detail})")
+        if args.apply:
+            new = apply_fonts(text, site_dir, pages_dir)
+            if new != text:
+                page.write_text(new, encoding='utf-8')
+    print(f"Done. {total / 1024:.1f} KB of font subsets across pages.")
+
+
+if __name__ == '__main__':
+    main()
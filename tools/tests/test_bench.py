@@ -0,0 +1,18 @@
+from bench import measure_pages
+
+PAGE = '<html><body><img src="./images/banner.jpg" alt=""></body></html>'
+
+
+def test_images_resolve_against_pages_dir(tmp_path):
+    (tmp_path / 'images').mkdir()
+    (tmp_path / 'images' / 'banner.jpg').write_bytes(b'x' * 100)
+    (tmp_path / 'lovemarble.html').write_text(PAGE, encoding='utf-8')
+    pages, unresolved = measure_pages(tmp_path)
+    assert pages['lovemarble.html']['image_bytes'] == 100
+    assert unresolved == {}
+
+
+def test_missing_images_are_reported(tmp_path):
+    (tmp_path / 'lovemarble.html').write_text(PAGE, encoding='utf-8')
+    pages, unresolved = measure_pages(tmp_path)
+    assert unresolved == {'lovemarble.html': ['./images/banner.jpg']}
@@ -0,0 +1,11 @@
+from compress_site import minify_html
+
+
+def test_gt_inside_attribute_value_is_kept():
+    html = '<a title="a > b    c\n   d"   href="#">x</a>'
+    assert minify_html(html) == '<a title="a > b    c\n   d" href="#">x</a>\n'
+
+
+def test_gt_inside_style_attribute_is_kept():
+    html = '<style media="(min-width: 1px) , a > b">  p { color : red ; }  </style>'
+    assert minify_html(html) == '<style media="(min-width: 1px) , a > b">p{color : red}</style>\n'
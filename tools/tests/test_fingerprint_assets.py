@@ -0,0 +1,23 @@
+from fingerprint_assets import fingerprint_site
+
+PAGE = ('<meta property="og:image" content="https://terriongames.com/images/og.jpg">\n'
+        '<img src="./images/og.jpg" alt="">\n')
+
+
+def test_absolute_urls_keep_their_unhashed_file(tmp_path):
+    site, out = tmp_path / 'site', tmp_path / 'dist'
+    (site / 'images').mkdir(parents=True)
+    (site / 'images' / 'og.jpg').write_bytes(b'jpeg')
+    (site / 'index.html').write_text(PAGE, encoding='utf-8')
+    (out / 'images').mkdir(parents=True)
+    # Deployed by an earlier run, since removed from the site
+    (out / 'images' / 'old.jpg').write_bytes(b'old')
+
+    mapping, _, _, pruned = fingerprint_site(site, site, out, prune=True)
+    hashed = mapping['images/og.jpg']
+    page = (out / 'index.html').read_text(encoding='utf-8')
+    assert 'content="https://terriongames.com/images/og.jpg"' in page
+    assert f'src="./{hashed}"' in page
+    assert (out / 'images' / 'og.jpg').read_bytes() == b'jpeg'
+    assert (out / hashed).read_bytes() == b'jpeg'
+    assert pruned == ['images/old.jpg']
@@ -0,0 +1,40 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+from PIL import Image
+
+import image_quality
+
+
+@pytest.fixture
+def rgb():
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8), 'RGB')
+
+
+@pytest.fixture
+def encodes(monkeypatch):
+    qualities = []
+    encode = image_quality.encode_jpeg
+
+    def counting(rgb, quality):
+        qualities.append(quality)
+        return encode(rgb, quality)
+
+    monkeypatch.setattr(image_quality, 'encode_jpeg', counting)
+    return qualities
+
+
+def test_baseline_comes_from_the_search_cache(rgb, encodes):
+    max_bytes = len(image_quality.encode_jpeg(rgb, 60))
+    encodes.clear()
+    quality, data, score, baseline = image_quality.search_quality(rgb, 95, 40, max_bytes=max_bytes)
+    # Each quality is encoded once, the baseline's included
+    assert sorted(encodes) == sorted(set(encodes)) and 95 in encodes
+    assert baseline == len(image_quality.encode_jpeg(rgb, 95))
+    assert len(data) <= max_bytes and score is None
+
+
+def test_unreachable_budget_returns_min_quality(rgb):
+    quality, data, _, _ = image_quality.search_quality(rgb, 95, 40, max_bytes=100)
+    assert quality == 40 and len(data) > 100
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from serve import Server
+
+# An embedded NUL byte and a name longer than NAME_MAX
+BAD_TARGETS = ['/x%00y', '/' + 'a' * 5000]
+BAD_IDS = ['nul-byte', 'too-long']
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / 'index.html').write_text('hi\n', encoding='utf-8')
+    return tmp_path
+
+
+@pytest.mark.parametrize('target', BAD_TARGETS, ids=BAD_IDS)
+def test_resolve_rejects_unresolvable_paths(root, target):
+    assert Server(root).resolve(target) is None
+
+
+async def _get(root, target):
+    server = await asyncio.start_server(Server(root).handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(f'GET {target} HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n'.encode('latin-1'))
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.parametrize('target', BAD_TARGETS, ids=BAD_IDS)
+def test_unresolvable_paths_get_404(root, target, capsys):
+    response = asyncio.run(_get(root, target))
+    assert response.startswith(b'HTTP/1.1 404 Not Found\r\n')
+
+
+def test_index_is_served(root, capsys):
+    response = asyncio.run(_get(root, '/'))
+    assert response.startswith(b'HTTP/1.1 200 OK\r\n')
+    assert response.endswith(b'\r\n\r\nhi\n')
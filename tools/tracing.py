@@ -0,0 +1,150 @@
+"""
+Timeline tracing for the build tools' `--profile` option.
+
+Spans and counters are recorded as Chrome trace events and written as one
+JSON file that chrome://tracing and https://ui.perfetto.dev open directly:
+  * `span(name, cat, **args)` is a complete ('X') event on the current
+    process and thread; nest them for locale -> file -> stage;
+  * `count(name, n)` adds to a cumulative counter ('C' event), e.g. bytes
+    read/written and cache hits/misses.
+Recording is off until `enable()` (or `profiling()`) is called, and every
+call is a cheap no-op while it is off.
+
+Process pool workers record into their own list: start them with
+`init_worker(enabled())` as (part of) the pool initializer, return
+`collect()` with each result and `merge()` it in the parent. Timestamps come
+from the system-wide monotonic clock, so worker spans line up with the
+parent's.
+
+`profiling(trace_path, cprofile_path, name)` wraps an entry point: it
+enables tracing, optionally runs cProfile on the main process (dumped with
+`Profile.dump_stats`, readable by `python -m pstats` or snakeviz), and on
+exit writes the trace and prints the slowest span names and counter totals.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+_events = None
+_counters = defaultdict(int)
+
+
+def _now() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+def enable():
+    global _events
+    _events = []
+    _counters.clear()
+
+
+def enabled() -> bool:
+    return _events is not None
+
+
+def init_worker(trace: bool):
+    """Pool initializer part: start a worker with an empty (or no) event list."""
+    global _events
+    _events = [] if trace else None
+    _counters.clear()
+
+
+@contextmanager
+def span(name: str, cat: str = 'stage', **args):
+    if _events is None:
+        yield
+        return
+    start = _now()
+    try:
+        yield
+    finally:
+        _events.append({'name': name, 'cat': cat, 'ph': 'X', 'ts': start, 'dur': _now() - start,
+                        'pid': os.getpid(), 'tid': threading.get_ident(), 'args': args})
+
+
+def count(name: str, value: int = 1):
+    if _events is None or not value:
+        return
+    _counters[name] += value
+    _events.append({'name': name, 'ph': 'C', 'ts': _now(), 'pid': os.getpid(), 'args': {'value': _counters[name]}})
+
+
+def collect():
+    """Take the events recorded in this process so far (to send back from a worker)."""
+    if _events is None:
+        return []
+    events = list(_events)
+    _events.clear()
+    return events
+
+
+def merge(events):
+    if _events is not None and events:
+        _events.extend(events)
+
+
+def counter_totals() -> dict:
+    """{counter: total} summed over the main process and every worker."""
+    last = {}
+    for event in _events or ():
+        if event['ph'] == 'C':
+            last[(event['pid'], event['name'])] = event['args']['value']
+    totals = defaultdict(int)
+    for (_, name), value in last.items():
+        totals[name] += value
+    return dict(sorted(totals.items()))
+
+
+def span_totals() -> dict:
+    """{span name: total ms}, slowest first; the whole-run span is left out."""
+    totals = defaultdict(float)
+    for event in _events or ():
+        if event['ph'] == 'X' and event['cat'] != 'run':
+            totals[event['name']] += event['dur'] / 1000
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def save(path: Path, process_name: str):
+    main_pid = os.getpid()
+    pids = sorted({event['pid'] for event in _events})
+    names = [{'name': 'process_name', 'ph': 'M', 'pid': pid,
+              'args': {'name': process_name if pid == main_pid else f'{process_name} worker {pid}'}} for pid in pids]
+    data = {'traceEvents': names + sorted(_events, key=lambda e: e['ts']), 'displayTimeUnit': 'ms',
+            'otherData': {'command': ' '.join(sys.argv), 'counters': counter_totals()}}
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+@contextmanager
+def profiling(trace_path, cprofile_path=None, name: str = 'build'):
+    """Trace (and optionally cProfile) the enclosed block; no-op when both paths are empty."""
+    if not trace_path and not cprofile_path:
+        yield
+        return
+    if trace_path:
+        enable()
+    profiler = cProfile.Profile() if cprofile_path else None
+    if profiler:
+        profiler.enable()
+    try:
+        with span(name, 'run'):
+            yield
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+            print(f"cProfile stats written to {cprofile_path}")
+        if trace_path:
+            save(Path(trace_path), name)
+            slowest = ', '.join(f"{span_name} {ms:.1f} ms" for span_name, ms in list(span_totals().items())[:5])
+            print(f"Trace written to {trace_path} ({len(_events)} events). Slowest spans: {slowest}")
+            counters = ', '.join(f"{counter} {value}" for counter, value in counter_totals().items())
+            if counters:
+                print(f"Counters: {counters}")
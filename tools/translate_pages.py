@@ -5,12 +5,72 @@ common phrases (title, meta description, hero text, section titles, card labels,
 etc.) and updates `lang` attribute and image folder paths to `images/<lang>/`.
 
 Run from repository root:
-  python tools/translate_pages.py
+  python tools/translate_pages.py [--verbose] [--benchmark N]
+  python tools/translate_pages.py --render OUT_DIR [--template lovemarble.html] [--jobs N] [--force] [--watch]
+  Either form also takes [--profile trace.json] [--cprofile PATH].
 
-This script edits files in-place. It is safe to review changes via git.
+By default this script edits files in-place. It is safe to review changes via git.
+
+`--render` instead builds every page from `lovemarble.html` as the single
+source: the template is split once at every rule match and each locale is a
+join over those segments with its TRANSLATIONS entry, written to OUT_DIR
+(which cannot be the template's own directory: the English page would
+replace the template).
+The banner and gallery images listed in IMG_CONFIG are rendered as static
+`<img>`/`<picture>` markup (see image_markup.py) so the browser can discover
+them without running the page script. Google Fonts is replaced by
+self-hosted per-page font subsets when fontTools and the sources are
+available (see subset_fonts.py), and the CSS the nav and hero need is
+inlined with every stylesheet loaded without blocking render (see
+critical_css.py).
+The result depends only on the template and the tables, so rebuilding is
+idempotent; unchanged output files are left untouched.
+
+The render is incremental: OUT_DIR/.render-manifest.json records, per page,
+a fingerprint of the template, the rule tables (patterns and replacement
+code), that page's TRANSLATIONS entry, its images, the font sources and the
+stylesheet (plus image_markup.py, subset_fonts.py and critical_css.py
+themselves). Only pages whose inputs changed are rendered, `--jobs N` at a time (0 = one per CPU); `--force` ignores the
+manifest. `--watch` keeps running and rebuilds whenever a render input is
+saved: the template or anything under css/, images/ and fonts/ (filesystem
+notifications via watchdog when installed, otherwise polling). Saving this
+script or one of the render modules (WATCH_MODULES) restarts the watcher so
+edited tables and code take effect.
+
+All replacement rules (TEMPLATE_KEYS, CARD_REPLACEMENTS and the path/lang
+rewrites) are compiled once into a single alternation regex, so each file is
+scanned exactly once no matter how many keys there are. The per-file report
+lists how many rules matched; `--verbose` names them. `--benchmark N` times
+the single pass against the previous one-scan-per-key loop on every page.
+
+`--profile trace.json` writes a Chrome trace (chrome://tracing,
+ui.perfetto.dev; see tracing.py) with a span per locale page and its stages
+(translate, hreflang, images, fonts, critical css), worker processes on
+their own tracks, and counters for bytes read/written and render-manifest
+and font-subset cache hits/misses. `--cprofile PATH` also dumps cProfile
+stats of the main process.
 """
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import argparse
+import hashlib
+import html
+import json
+import os
 import re
+import sys
+import threading
+import time
+
+import locales
+import tracing
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # --watch falls back to polling
+    Observer = None
 
 # Minimal translation table for visible phrases.
 TRANSLATIONS = {
@@ -18,12 +78,15 @@ TRANSLATIONS = {
         'lang': 'de',
         'title': 'Love Marble - Das ultimative Spiel für Paare',
         'meta_desc': 'Offline-Brettspiel für Paare (2 Spieler). Würfle, erledige Missionen und stärke eure Nähe. Verfügbar für iOS & Android.',
+        'ld_desc': 'Ein lokales Offline-Paar-Brettspiel, das von zwei Personen auf einem Gerät gespielt wird. Würfeln, auf Karten landen und romantische Missionen und Fragen erfüllen. Keine Serververbindung erforderlich.',
+        'offer_desc': 'Das Basisspiel (Sweet Pack) ist 100 % kostenlos. Premium-Erweiterungspakete und ein lebenslanger Gratis-Pass (9,9 $) sind über In-App-Käufe erhältlich.',
         'og_title': 'Love Marble - Das Paar-Brettspiel',
         'og_desc': 'Entfache eure Romantik mit dem ultimativen Brettspiel für Paare!',
         'twitter_title': 'Love Marble - Entfache die Romantik',
         'twitter_desc': 'Das beste Brettspiel für Paare. Würfle und starte eure gemeinsame Reise!',
         'hero_sub': 'Würfle. Entfache die Romantik.',
         'banner_alt': 'Hauptbanner',
+        'screenshot_alt': 'Screenshot',
         'play_now': 'Jetzt spielen',
         'preview_title': 'In-Game Vorschau',
         'pc_msg': '< Pfeile klicken zum Scrollen >',
@@ -32,6 +95,33 @@ TRANSLATIONS = {
         'card_1_title': 'SÜSS',
         'card_1_sub': 'Romantischer Funke',
         'card_1_desc': 'Erinnere dich an das erste Date! Taucht ein in süße Gespräche und Berührungen.',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Die Hitze steigt',
+        'card_2_desc': 'Wird es hier drinnen etwas warm? Mach dich bereit für herzklopfende Fragen.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'Fantasie für heute Nacht',
+        'card_3_desc': 'Heute Nacht wird nicht geschlafen! Entfessle deine tiefsten Sehnsüchte.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'Das ultimative Erlebnis',
+        'card_4_desc': 'Kannst du dich nicht entscheiden? Warum nicht alles haben! Die komplette Love Marble Reise.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Gefährliche Geheimnisse',
+        'card_5_desc': 'Manche Wahrheiten sind verlockend... Wagst du es, die Kiste mit den Tabuthemen zu öffnen?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Bereit für die Ewigkeit',
+        'card_6_desc': 'Von Finanzen über Kinder bis hin zu Werten – mach diesen realistischen Kompatibilitätstest!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'Den Funken neu entfachen',
+        'card_7_desc': 'Brich aus dem Alltag aus und entdecke die Romantik neu!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Unvergessliche Nächte',
+        'card_8_desc': 'Peppe deine Reisenächte mit romantischen Missionen auf.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'Weniger reden, mehr anfassen!',
+        'card_9_desc': '100% Mutproben und körperliche Missionen. Lass den Smalltalk weg!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'Option A oder Option B?',
+        'card_10_desc': 'Eine Sammlung von Dilemma-Karten. Entfache endlose Gespräche.',
         'ready_title': 'Bereit zu spielen?',
         'available': 'Verfügbar für iOS & Android',
         'appstore_alt': 'Im App Store herunterladen',
@@ -43,12 +133,15 @@ TRANSLATIONS = {
         'lang': 'fr',
         'title': 'Love Marble - Le jeu de couple ultime',
         'meta_desc': "Jeu de plateau hors-ligne pour couples (2 joueurs). Lancez les dés, réalisez des missions et renforcez votre complicité. Disponible sur iOS & Android.",
+        'ld_desc': 'Un jeu de société pour couples, local et hors ligne, joué à deux sur un seul appareil. Lancez les dés, atterrissez sur des cartes et complétez des missions et des questions romantiques. Aucune connexion serveur requise.',
+        'offer_desc': "Le jeu de base (Pack Sweet) est 100 % gratuit. Des packs d'extension premium et un pass gratuit à vie (9,9 $) sont disponibles via des achats intégrés.",
         'og_title': 'Love Marble - Le jeu de couple',
         'og_desc': 'Ravivez votre romance avec le jeu de plateau ultime pour couples!',
         'twitter_title': 'Love Marble - Ravivez la romance',
         'twitter_desc': "Le meilleur jeu de plateau pour couples. Lancez les dés et commencez votre aventure!",
         'hero_sub': 'Lancez les dés. Ravivez la romance.',
         'banner_alt': 'Bannière principale',
+        'screenshot_alt': "Capture d'écran",
         'play_now': 'Jouez maintenant',
         'preview_title': 'Aperçu en jeu',
         'pc_msg': '< Cliquez sur les flèches pour défiler >',
@@ -57,6 +150,33 @@ TRANSLATIONS = {
         'card_1_title': 'Doux',
         'card_1_sub': 'Étincelle romantique',
         'card_1_desc': "Rappelez-vous les papillons du premier rendez-vous! Plongez dans des conversations tendres.",
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Température en Hausse',
+        'card_2_desc': 'Il commence à faire chaud ici, non ? Préparez-vous à des questions palpitantes.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'Fantasme de ce Soir',
+        'card_3_desc': 'On ne dort pas ce soir ! Libérez vos désirs les plus profonds.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': "L'Expérience Ultime",
+        'card_4_desc': 'Impossible de choisir ? Prenez tout ! Le voyage complet de Love Marble.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Secrets Dangereux',
+        'card_5_desc': 'Certaines vérités sont tentantes... Oserez-vous ouvrir la boîte des sujets tabous ?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Prêts pour Toujours',
+        'card_6_desc': 'Finances, enfants, valeurs... Passez ce test de compatibilité ultra-réaliste !',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': "Rallumer l'Étincelle",
+        'card_7_desc': 'Cassez la routine et redécouvrez la romance !',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Nuits Inoubliables',
+        'card_8_desc': 'Pimentez vos nuits de voyage avec des missions romantiques.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': "Moins de Mots, Plus d'Action !",
+        'card_9_desc': '100 % de défis et missions physiques. Zappez la conversation !',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'Option A ou Option B ?',
+        'card_10_desc': 'Une collection de cartes dilemmes. Déclenchez des conversations sans fin.',
         'ready_title': 'Prêt à jouer?',
         'available': 'Disponible sur iOS & Android',
         'appstore_alt': 'Télécharger sur l\'App Store',
@@ -68,12 +188,15 @@ TRANSLATIONS = {
         'lang': 'es',
         'title': 'Love Marble - El juego de pareja definitivo',
         'meta_desc': 'Juego de mesa offline para parejas (2 jugadores). Lanza los dados, completa misiones y fortalece la intimidad. Disponible en iOS y Android.',
+        'ld_desc': 'Un juego de mesa local y sin conexión para parejas, jugado por dos personas en un dispositivo. Tira los dados, cae en las cartas y completa misiones y preguntas románticas. No requiere conexión a servidores.',
+        'offer_desc': 'El juego base (Sweet Pack) es 100% gratis. Paquetes de expansión premium y Pase Gratis de por Vida ($9.9) disponibles mediante compras dentro de la aplicación.',
         'og_title': 'Love Marble - El juego para parejas',
         'og_desc': 'Enciende tu romance con el juego de mesa definitivo para parejas!',
         'twitter_title': 'Love Marble - Enciende el romance',
         'twitter_desc': 'El mejor juego de mesa para parejas. Lanza los dados y comienza tu viaje ahora!',
         'hero_sub': 'Lanza los dados. Enciende el romance.',
         'banner_alt': 'Banner principal',
+        'screenshot_alt': 'Captura de pantalla',
         'play_now': 'Jugar ahora',
         'preview_title': 'Vista previa en el juego',
         'pc_msg': '< Clica flechas para desplazarte >',
@@ -82,6 +205,33 @@ TRANSLATIONS = {
         'card_1_title': 'DULCE',
         'card_1_sub': 'Chispa romántica',
         'card_1_desc': '¿Recuerdas la emoción del primer encuentro? Sumérgete en conversaciones dulces y toques románticos.',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Subiendo la Temperatura',
+        'card_2_desc': '¿Hace un poco de calor aquí? Prepárate para preguntas que te harán palpitar el corazón.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'Fantasía de Esta Noche',
+        'card_3_desc': '¡Esta noche no se duerme! Libera tus deseos más profundos.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'La Experiencia Definitiva',
+        'card_4_desc': '¿No te decides? ¡Por qué no tenerlo todo! El viaje completo de Love Marble.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Secretos Peligrosos',
+        'card_5_desc': 'Algunas verdades son tentadoras... ¿Te atreves a abrir la caja de temas tabú?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Listos para Siempre',
+        'card_6_desc': 'Desde finanzas hasta hijos y valores: ¡haz este test de compatibilidad realista!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'Reavivando la Chispa',
+        'card_7_desc': '¡Rompe la rutina y redescubre el romance!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Noches Inolvidables',
+        'card_8_desc': 'Ponle sabor a tus noches de viaje con misiones románticas.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': '¡Menos plática, más acción!',
+        'card_9_desc': '100% retos y misiones físicas. ¡Sáltate las pláticas!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': '¿Opción A u Opción B?',
+        'card_10_desc': 'Una colección de cartas de dilemas. Provoca conversaciones interminables.',
         'ready_title': '¿Listo para jugar?',
         'available': 'Disponible en iOS y Android',
         'appstore_alt': 'Descargar en App Store',
@@ -93,12 +243,15 @@ TRANSLATIONS = {
         'lang': 'it',
         'title': 'Love Marble - Il gioco di coppia definitivo',
         'meta_desc': 'Gioco da tavolo offline per coppie (2 giocatori). Lancia il dado, completa missioni e costruisci intimità. Disponibile su iOS e Android.',
+        'ld_desc': 'Un gioco da tavolo locale e offline per coppie, giocato da due persone su un solo dispositivo. Lancia i dadi, atterra sulle carte e completa missioni e domande romantiche. Nessuna connessione server richiesta.',
+        'offer_desc': 'Il gioco base (Pacchetto Sweet) è gratuito al 100%. Pacchetti di espansione premium e Pass Gratuito a Vita (9,9 $) disponibili tramite acquisti in-app.',
         'og_title': 'Love Marble - Il gioco per coppie',
         'og_desc': 'Accendi la tua storia d\'amore con il gioco da tavolo definitivo per coppie!',
         'twitter_title': 'Love Marble - Accendi la passione',
         'twitter_desc': 'Il miglior gioco da tavolo per coppie. Lancia il dado e inizia il tuo viaggio ora!',
         'hero_sub': 'Lancia il dado. Accendi la passione.',
         'banner_alt': 'Banner principale',
+        'screenshot_alt': 'Screenshot',
         'play_now': 'Gioca ora',
         'preview_title': 'Anteprima di gioco',
         'pc_msg': '< Clicca le frecce per scorrere >',
@@ -107,6 +260,33 @@ TRANSLATIONS = {
         'card_1_title': 'DOLCE',
         'card_1_sub': 'Scintilla romantica',
         'card_1_desc': 'Ti ricordi le farfalle del primo appuntamento? Immergiti in dolci conversazioni e carezze romantiche.',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Si alza la temperatura',
+        'card_2_desc': 'Inizia a fare caldo qui? Preparati a domande da batticuore.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'La fantasia di stanotte',
+        'card_3_desc': 'Stanotte non si dorme! Libera i tuoi desideri più profondi.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': "L'esperienza definitiva",
+        'card_4_desc': 'Non sai decidere? Perché non avere tutto! Il viaggio completo di Love Marble.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Segreti pericolosi',
+        'card_5_desc': 'Certe verità sono tentatrici... Osi aprire la scatola degli argomenti tabù?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Pronti per sempre',
+        'card_6_desc': 'Dalle finanze ai figli fino ai valori: fai questo test di compatibilità realistico!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'Riaccendere la scintilla',
+        'card_7_desc': 'Rompi la routine e riscopri il romanticismo!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Notti indimenticabili',
+        'card_8_desc': 'Rendi più piccanti le notti in viaggio con missioni romantiche.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'Meno parole, più contatto!',
+        'card_9_desc': '100% sfide e missioni fisiche. Niente chiacchiere!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'Opzione A o opzione B?',
+        'card_10_desc': 'Una raccolta di carte dilemma. Accendi conversazioni infinite.',
         'ready_title': 'Pronto a giocare?',
         'available': 'Disponibile su iOS e Android',
         'appstore_alt': 'Scarica dall\'App Store',
@@ -118,12 +298,15 @@ TRANSLATIONS = {
         'lang': 'ja',
         'title': 'ラブマーブル - カップルのための究極のゲーム',
         'meta_desc': 'オフラインカップルボードゲーム（2人用）。サイコロを振ってミッションをクリアし、親密さを築きましょう。iOSとAndroidで利用可能。',
+        'ld_desc': '1つのデバイスで2人で遊べるオフラインのカップル向けボードゲームです。サイコロを振ってカードに止まり、ロマンチックなミッションや質問に答えましょう。サーバー接続は不要です。',
+        'offer_desc': '基本ゲーム（スイートパック）は100%無料です。プレミアム拡張パックと生涯無料パス（$9.9）はアプリ内課金でご利用いただけます。',
         'og_title': 'ラブマーブル - カップル向けボードゲーム',
         'og_desc': 'カップルのための究極のボードゲームでロマンスを呼び起こそう！',
         'twitter_title': 'ラブマーブル - ロマンスを呼び起こそう',
         'twitter_desc': 'カップル向け最高のボードゲーム。サイコロを振って今すぐ旅を始めよう！',
         'hero_sub': 'サイコロを振って、ロマンスを呼び起こそう。',
         'banner_alt': 'メインバナー',
+        'screenshot_alt': 'スクリーンショット',
         'play_now': '今すぐプレイ',
         'preview_title': 'ゲーム内プレビュー',
         'pc_msg': '< 矢印をクリックしてスクロール >',
@@ -132,6 +315,33 @@ TRANSLATIONS = {
         'card_1_title': 'スイート',
         'card_1_sub': 'ロマンチックなきらめき',
         'card_1_desc': '初デートのときめきを覚えていますか？甘い会話とロマンチックなタッチを楽しんでください。',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'ヒートアップ',
+        'card_2_desc': 'ちょっと暑くなってきた？ドキドキする質問に答える準備をして。',
+        'card_3_title': 'SPICY',
+        'card_3_sub': '今夜のファンタジー',
+        'card_3_desc': '今夜は眠らせない！心の奥底にある欲望を解き放とう。',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': '究極の体験',
+        'card_4_desc': '決められない？全部楽しんじゃえば！LoveMarbleの完璧な旅のすべて。',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': '危険な秘密',
+        'card_5_desc': '時には真実の方が魅惑的…タブーな話題が詰まった箱を開ける勇気はある？',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': '永遠の誓いへ',
+        'card_6_desc': 'お金、子供、価値観まで！リアルな相性テストを受けてみよう！',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': '再び火をつける',
+        'card_7_desc': '退屈な日常を抜け出して、忘れていたロマンスを再び見つけよう！',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': '忘れられない夜',
+        'card_8_desc': '旅行の夜をロマンチックなミッションでさらに刺激的に。',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': '言葉より行動！',
+        'card_9_desc': '100%スキンシップとアクションミッション。軽いおしゃべりは抜き！',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': '究極の2択',
+        'card_10_desc': '究極のジレンマカード集。終わらない会話の火種に火をつけよう。',
         'ready_title': 'プレイの準備はできていますか？',
         'available': 'iOS と Android で利用可能',
         'appstore_alt': 'App Store でダウンロード',
@@ -143,12 +353,15 @@ TRANSLATIONS = {
         'lang': 'ko',
         'title': '러브 마블 - 커플을 위한 보드게임',
         'meta_desc': '오프라인 커플 보드게임(2인용). 주사위를 굴리고 미션을 수행하며 둘만의 친밀함을 쌓아보세요. iOS와 Android에서 이용 가능.',
+        'ld_desc': '기기 한 대로 두 명이 함께 즐기는 오프라인 커플 보드게임. 주사위를 굴리고, 카드에 도착해 로맨틱한 미션과 질문을 완성하세요. 서버 연결이 필요 없습니다.',
+        'offer_desc': '기본 게임(스위트 팩)은 100% 무료입니다. 프리미엄 확장팩과 평생 무료 패스($9.9)는 앱 내 구매로 이용 가능합니다.',
         'og_title': '러브 마블 - 커플 보드게임',
         'og_desc': '커플을 위한 궁극의 보드게임으로 로맨스를 불러오세요!',
         'twitter_title': '러브 마블 - 로맨스를 불러오세요',
         'twitter_desc': '커플을 위한 최고의 보드게임. 주사위를 굴리고 지금 여정을 시작하세요!',
         'hero_sub': '주사위를 굴려 로맨스를 불러오세요.',
         'banner_alt': '메인 배너',
+        'screenshot_alt': '스크린샷',
         'play_now': '지금 플레이',
         'preview_title': '게임 화면 미리보기',
         'pc_msg': '< 화살표 클릭하여 스크롤 >',
@@ -157,6 +370,33 @@ TRANSLATIONS = {
         'card_1_title': '달콤',
         'card_1_sub': '로맨틱 스파크',
         'card_1_desc': '첫 데이트의 설렘을 기억하세요? 달콤한 대화와 터치로 사랑을 키워보세요.',
+        'card_2_title': '핫',
+        'card_2_sub': '분위기 후끈!',
+        'card_2_desc': '분위기가 좀 달아오르나요? 심장을 요동치게 만들 아찔한 질문들을 준비하세요.',
+        'card_3_title': '스파이시',
+        'card_3_sub': '오늘 밤의 판타지',
+        'card_3_desc': '오늘 밤 잠들 생각 마세요! 깊숙이 숨겨둔 서로의 욕망을 봉인 해제할 시간입니다.',
+        'card_4_title': '풀 코스',
+        'card_4_sub': '궁극의 경험',
+        'card_4_desc': '무엇을 고를지 고민되나요? 전부 다 즐겨보세요! 러브마블이 선사하는 완벽한 여정.',
+        'card_5_title': '판도라의 상자',
+        'card_5_sub': '위험한 비밀',
+        'card_5_desc': '때로는 진실이 더 매혹적인 법... 금기된 주제들이 담긴 상자를 열어볼 용기가 있나요?',
+        'card_6_title': '웨딩 퀴즈',
+        'card_6_sub': '영원을 위한 준비',
+        'card_6_desc': '재정, 자녀, 가치관까지! 현실 고증 100% 모의고사로 서로의 궁합을 테스트해 보세요.',
+        'card_7_title': '매리드 팩',
+        'card_7_sub': '불꽃의 재점화',
+        'card_7_desc': '지루한 일상에서 벗어나 잊고 있던 로맨스를 다시 발견하세요!',
+        'card_8_title': '로맨틱 여행',
+        'card_8_sub': '잊지 못할 밤',
+        'card_8_desc': '여행지의 밤을 로맨틱한 미션들로 더욱 특별하고 뜨겁게 만들어보세요.',
+        'card_9_title': '올 액션 팩',
+        'card_9_sub': '말보단 행동으로!',
+        'card_9_desc': '100% 스킨십과 행동 미션으로 꽉 채웠습니다. 가벼운 수다는 생략하세요!',
+        'card_10_title': '밸런스 게임',
+        'card_10_sub': 'A 할래 vs B 할래?',
+        'card_10_desc': '극강의 딜레마 카드 모음! 끊이지 않는 대화의 불씨를 지펴보세요.',
         'ready_title': '지금 플레이할 준비 되셨나요?',
         'available': 'iOS 및 Android에서 이용 가능',
         'appstore_alt': 'App Store에서 다운로드',
@@ -168,12 +408,15 @@ TRANSLATIONS = {
         'lang': 'zh-TW',
         'title': 'Love Marble - 情侶專屬桌遊',
         'meta_desc': '離線情侶桌遊（2 人）。擲骰子、完成任務，增進親密關係。支援 iOS 與 Android。',
+        'ld_desc': '一台裝置兩人同樂的離線情侶桌遊。擲骰子、停在卡牌上，完成浪漫的任務與問答。無需連接伺服器。',
+        'offer_desc': '基礎遊戲（甜蜜包）100% 免費。可透過應用程式內購買取得高級擴充包與終身免費通行證（$9.9）。',
         'og_title': 'Love Marble - 情侶桌遊',
         'og_desc': '用這款情侶專屬桌遊點燃你們的浪漫！',
         'twitter_title': 'Love Marble - 點燃浪漫',
         'twitter_desc': '最佳情侶桌遊。擲骰子，立即開始你們的旅程！',
         'hero_sub': '擲骰子。點燃浪漫。',
         'banner_alt': '主橫幅',
+        'screenshot_alt': '截圖',
         'play_now': '立即遊玩',
         'preview_title': '遊戲畫面預覽',
         'pc_msg': '< 點擊箭頭以滾動 >',
@@ -182,6 +425,33 @@ TRANSLATIONS = {
         'card_1_title': '甜蜜',
         'card_1_sub': '浪漫火花',
         'card_1_desc': '還記得第一次約會的悸動嗎？沉浸在甜蜜對話與浪漫互動中吧。',
+        'card_2_title': 'HOT',
+        'card_2_sub': '熱度飆升',
+        'card_2_desc': '這裡是不是變熱了？準備好迎接令人心跳加速的提問吧。',
+        'card_3_title': 'SPICY',
+        'card_3_sub': '今夜幻想',
+        'card_3_desc': '今晚別想睡了！解鎖你內心最深處的渴望吧。',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': '終極體驗',
+        'card_4_desc': '無法決定嗎？那就全都要吧！LoveMarble 的完整旅程。',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': '危險的秘密',
+        'card_5_desc': '有些真相充滿誘惑……你敢打開裝滿禁忌話題的盒子嗎？',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': '準備好永遠',
+        'card_6_desc': '從財務、孩子到價值觀——來做個最真實的契合度測驗吧！',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': '重燃火花',
+        'card_7_desc': '打破常規，重新找回曾經的浪漫！',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': '難忘的夜晚',
+        'card_8_desc': '用浪漫的任務讓旅行的夜晚變得更加熱情刺激吧！',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': '少說話，多行動！',
+        'card_9_desc': '100% 的大膽行動與肢體接觸任務。省略那些無關緊要的閒聊吧！',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': '選A還是選B？',
+        'card_10_desc': '充滿兩難的卡牌收集。激發無盡的話題與討論。',
         'ready_title': '準備好遊玩了嗎？',
         'available': '支援 iOS 與 Android',
         'appstore_alt': '在 App Store 下載',
@@ -193,12 +463,15 @@ TRANSLATIONS = {
         'lang': 'th',
         'title': 'Love Marble - เกมบอร์ดคู่รักที่ดีที่สุด',
         'meta_desc': 'เกมบอร์ดออฟไลน์สำหรับคู่รัก (2 ผู้เล่น) ทอยลูกเต๋า ทำภารกิจ และสร้างความใกล้ชิด มีให้บน iOS และ Android',
+        'ld_desc': 'บอร์ดเกมสำหรับคู่รักแบบออฟไลน์ที่เล่นได้สองคนในเครื่องเดียว ทอยลูกเต๋า ตกบนการ์ด และทำภารกิจและตอบคำถามสุดโรแมนติก ไม่จำเป็นต้องเชื่อมต่อเซิร์ฟเวอร์',
+        'offer_desc': 'เกมหลัก (Sweet Pack) เล่นฟรี 100% สามารถซื้อแพ็กเสริมพรีเมียมและพาสเล่นฟรีตลอดชีพ ($9.9) ได้ภายในแอป',
         'og_title': 'Love Marble - เกมคู่รัก',
         'og_desc': 'จุดประกายความโรแมนติกของคุณด้วยเกมบอร์ดคู่รัก!',
         'twitter_title': 'Love Marble - จุดประกายความรัก',
         'twitter_desc': 'เกมบอร์ดที่ดีที่สุดสำหรับคู่รัก ทอยลูกเต๋าและเริ่มการผจญภัยของคุณ!',
         'hero_sub': 'ทอยลูกเต๋า จุดประกายความรัก',
         'banner_alt': 'แบนเนอร์หลัก',
+        'screenshot_alt': 'ภาพหน้าจอ',
         'play_now': 'เล่นเลย',
         'preview_title': 'ตัวอย่างในเกม',
         'pc_msg': '< คลิกลูกศรเพื่อเลื่อน >',
@@ -207,6 +480,33 @@ TRANSLATIONS = {
         'card_1_title': 'หวาน',
         'card_1_sub': 'ประกายโรแมนติก',
         'card_1_desc': 'จำความตื่นเต้นของเดทแรกได้ไหม? ดื่มด่ำกับบทสนทนาหวาน ๆ และสัมผัสอบอุ่น',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'เพิ่มความเร่าร้อน',
+        'card_2_desc': 'เริ่มรู้สึกร้อนขึ้นมาบ้างไหม? เตรียมตัวพบกับคำถามที่จะทำให้หัวใจเต้นแรง',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'แฟนตาซีคืนนี้',
+        'card_3_desc': 'คืนนี้ไม่ได้นอนแน่! ปลดล็อกความปรารถนาที่ซ่อนอยู่ลึกที่สุดของคุณ',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'ประสบการณ์ขั้นสุด',
+        'card_4_desc': 'ตัดสินใจไม่ได้ใช่ไหม? ทำไมไม่เอาทั้งหมดเลยล่ะ! การเดินทางที่สมบูรณ์แบบของ Love Marble',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'ความลับที่อันตราย',
+        'card_5_desc': 'ความจริงบางอย่างก็เย้ายวนใจ... กล้าพอไหมที่จะเปิดกล่องคำถามต้องห้าม?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'พร้อมสำหรับตลอดไป',
+        'card_6_desc': 'ตั้งแต่เรื่องเงิน ลูก และค่านิยม—มาทำแบบทดสอบความเข้ากันได้แบบสมจริงกันเถอะ!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'จุดประกายอีกครั้ง',
+        'card_7_desc': 'หลีกหนีความจำเจแล้วกลับมาค้นพบความโรแมนติกอีกครั้ง!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'ค่ำคืนที่ยากจะลืมเลือน',
+        'card_8_desc': 'เพิ่มสีสันให้ค่ำคืนแห่งการท่องเที่ยวด้วยภารกิจสุดโรแมนติก',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'คุยให้น้อย สัมผัสให้มาก!',
+        'card_9_desc': 'ภารกิจท้าทายและสกินชิพ 100% ข้ามการพูดคุยเล็กๆ น้อยๆ ไปได้เลย!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'ตัวเลือก A หรือ ตัวเลือก B?',
+        'card_10_desc': 'รวมการ์ดคำถามชวนปวดหัว จุดประกายบทสนทนาแบบไม่มีที่สิ้นสุด',
         'ready_title': 'พร้อมเล่นหรือยัง?',
         'available': 'ใช้ได้บน iOS และ Android',
         'appstore_alt': 'ดาวน์โหลดจาก App Store',
@@ -218,12 +518,15 @@ TRANSLATIONS = {
         'lang': 'vi',
         'title': 'Love Marble - Trò chơi cặp đôi tối thượng',
         'meta_desc': 'Trò chơi bàn offline cho cặp đôi (2 người). Lắc xúc xắc, hoàn thành nhiệm vụ và xây dựng sự thân mật. Có trên iOS & Android.',
+        'ld_desc': 'Board game cặp đôi chơi ngoại tuyến trên cùng một thiết bị. Đổ xúc xắc, dừng ở các thẻ bài và hoàn thành những nhiệm vụ cũng như câu hỏi lãng mạn. Không cần kết nối máy chủ.',
+        'offer_desc': 'Trò chơi cơ bản (Gói Ngọt ngào) miễn phí 100%. Các gói mở rộng cao cấp và Thẻ miễn phí trọn đời ($9.9) có thể mua trong ứng dụng.',
         'og_title': 'Love Marble - Trò chơi cho cặp đôi',
         'og_desc': 'Khơi dậy lãng mạn với trò chơi bàn tối thượng cho cặp đôi!',
         'twitter_title': 'Love Marble - Khơi dậy lãng mạn',
         'twitter_desc': 'Trò chơi bàn tốt nhất cho cặp đôi. Lắc xúc xắc và bắt đầu hành trình ngay!',
         'hero_sub': 'Lắc xúc xắc. Khơi dậy lãng mạn.',
         'banner_alt': 'Biểu ngữ chính',
+        'screenshot_alt': 'Ảnh chụp màn hình',
         'play_now': 'Chơi ngay',
         'preview_title': 'Xem trước trong game',
         'pc_msg': '< Nhấn mũi tên để cuộn >',
@@ -232,6 +535,33 @@ TRANSLATIONS = {
         'card_1_title': 'NGỌT',
         'card_1_sub': 'Tia lửa lãng mạn',
         'card_1_desc': 'Bạn còn nhớ cảm giác rung động lần đầu gặp gỡ không? Đắm chìm trong những cuộc trò chuyện ngọt ngào và những cử chỉ lãng mạn.',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Tăng nhiệt',
+        'card_2_desc': 'Ở đây có vẻ nóng lên rồi nhỉ? Chuẩn bị cho những câu hỏi khiến tim đập thình thịch nhé.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'Ảo mộng đêm nay',
+        'card_3_desc': 'Đêm nay sẽ không ngủ đâu! Hãy giải phóng những khát khao thầm kín nhất của bạn.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'Trải nghiệm tối thượng',
+        'card_4_desc': 'Không thể quyết định? Tại sao không lấy tất cả! Hành trình trọn vẹn cùng Love Marble.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Bí mật nguy hiểm',
+        'card_5_desc': 'Vài sự thật lại rất cám dỗ... Bạn có dám mở chiếc hộp chứa những chủ đề cấm kỵ không?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Sẵn sàng cho mãi mãi',
+        'card_6_desc': 'Từ tài chính, con cái đến giá trị sống—hãy làm bài kiểm tra mức độ hợp nhau thực tế này!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'Thắp lại ngọn lửa',
+        'card_7_desc': 'Phá vỡ thói quen và khám phá lại sự lãng mạn đã bỏ quên!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Những đêm khó quên',
+        'card_8_desc': 'Làm cho những đêm du lịch của bạn thêm gia vị bằng các nhiệm vụ lãng mạn.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'Bớt lời lại, hành động đi!',
+        'card_9_desc': '100% thử thách và nhiệm vụ đụng chạm. Bỏ qua mấy màn trò chuyện đi!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'Tùy chọn A hay Tùy chọn B?',
+        'card_10_desc': 'Bộ sưu tập những thẻ bài hóc búa. Châm ngòi cho những cuộc trò chuyện bất tận.',
         'ready_title': 'Sẵn sàng chơi?',
         'available': 'Có trên iOS & Android',
         'appstore_alt': 'Tải trên App Store',
@@ -243,12 +573,15 @@ TRANSLATIONS = {
         'lang': 'id',
         'title': 'Love Marble - Game pasangan terbaik',
         'meta_desc': 'Game papan offline untuk pasangan (2 pemain). Gulir dadu, selesaikan misi, dan bangun keintiman. Tersedia di iOS & Android.',
+        'ld_desc': 'Permainan papan pasangan luring lokal yang dimainkan oleh dua orang pada satu perangkat. Lempar dadu, mendarat di kartu, dan selesaikan misi serta pertanyaan romantis. Tidak memerlukan koneksi server.',
+        'offer_desc': 'Permainan dasar (Paket Manis) 100% gratis. Paket ekspansi premium dan Tiket Gratis Seumur Hidup ($9.9) tersedia melalui pembelian dalam aplikasi.',
         'og_title': 'Love Marble - Game untuk pasangan',
         'og_desc': 'Nyalakan romansa Anda dengan game papan terbaik untuk pasangan!',
         'twitter_title': 'Love Marble - Nyalakan romansa',
         'twitter_desc': 'Game papan terbaik untuk pasangan. Gulir dadu dan mulai perjalanan Anda sekarang!',
         'hero_sub': 'Gulir dadu. Nyalakan romansa.',
         'banner_alt': 'Banner utama',
+        'screenshot_alt': 'Tangkapan layar',
         'play_now': 'Main sekarang',
         'preview_title': 'Pratinjau dalam game',
         'pc_msg': '< Klik panah untuk menggulir >',
@@ -257,6 +590,33 @@ TRANSLATIONS = {
         'card_1_title': 'MANIS',
         'card_1_sub': 'Percikan Romantis',
         'card_1_desc': 'Ingat detak jantung pada kencan pertama? Selami percakapan manis dan sentuhan romantis.',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Makin Memanas',
+        'card_2_desc': 'Mulai terasa panas di sini? Bersiaplah untuk pertanyaan yang bikin jantung berdebar.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'Fantasi Malam Ini',
+        'card_3_desc': 'Tidak ada tidur malam ini! Lepaskan hasrat terdalam Anda.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'Pengalaman Terlengkap',
+        'card_4_desc': 'Tidak bisa memilih? Kenapa tidak semuanya! Perjalanan Love Marble yang lengkap.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Rahasia Berbahaya',
+        'card_5_desc': 'Beberapa kebenaran memang menggoda... Berani membuka kotak topik tabu?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Siap Selamanya',
+        'card_6_desc': 'Dari keuangan hingga anak dan nilai hidup: ikuti tes kecocokan yang realistis ini!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'Menyalakan Kembali Percikan',
+        'card_7_desc': 'Keluar dari rutinitas dan temukan kembali romansa!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Malam Tak Terlupakan',
+        'card_8_desc': 'Bumbui malam perjalanan Anda dengan misi romantis.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'Kurangi Bicara, Perbanyak Sentuhan!',
+        'card_9_desc': '100% tantangan dan misi fisik. Lewati basa-basinya!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'Pilihan A atau Pilihan B?',
+        'card_10_desc': 'Kumpulan kartu dilema. Picu percakapan tanpa akhir.',
         'ready_title': 'Siap bermain?',
         'available': 'Tersedia di iOS & Android',
         'appstore_alt': 'Unduh di App Store',
@@ -268,12 +628,15 @@ TRANSLATIONS = {
         'lang': 'hi',
         'title': 'लव मार्बल - जोड़ों के लिए अल्टीमेट गेम',
         'meta_desc': 'ऑफलाइन कपल बोर्ड गेम (2 खिलाड़ियों के लिए)। पासा फेंकें, मिशन पूरा करें और निकटता बनाएं। iOS और Android पर उपलब्ध।',
+        'ld_desc': 'एक डिवाइस पर दो लोगों द्वारा खेला जाने वाला एक स्थानीय, ऑफ़लाइन कपल बोर्ड गेम। पासा रोल करें, कार्ड पर आएं, और रोमांटिक मिशन और सवालों को पूरा करें। किसी सर्वर कनेक्शन की आवश्यकता नहीं है।',
+        'offer_desc': 'बेस गेम (स्वीट पैक) 100% मुफ़्त है। प्रीमियम एक्सपेंशन पैक और लाइफटाइम फ्री पास ($9.9) इन-ऐप खरीदारी के माध्यम से उपलब्ध हैं।',
         'og_title': 'लव मार्बल - कपल बोर्ड गेम',
         'og_desc': 'जोड़ों के लिए अल्टीमेट बोर्ड गेम से अपने रोमांस को जगाइए!',
         'twitter_title': 'लव मार्बल - रोमांस जगाइए',
         'twitter_desc': 'जोड़ों के लिए सर्वश्रेष्ठ बोर्ड गेम। पासा फेंकें और अपनी यात्रा शुरू करें!',
         'hero_sub': 'पासा फेंकें। रोमांस जगाइए।',
         'banner_alt': 'मुख्य बैनर',
+        'screenshot_alt': 'स्क्रीनशॉट',
         'play_now': 'अब खेलें',
         'preview_title': 'इन-गेम पूर्वावलोकन',
         'pc_msg': '< स्क्रॉल करने के लिए तीर पर क्लिक करें >',
@@ -282,6 +645,33 @@ TRANSLATIONS = {
         'card_1_title': 'मीठा',
         'card_1_sub': 'रोमांटिक चिंगारी',
         'card_1_desc': 'क्या आपको पहले डेट की धड़कन याद है? मीठी बातचीत और रोमांटिक टच में डूब जाएं।',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'गर्मी बढ़ाना',
+        'card_2_desc': 'क्या यहाँ थोड़ी गर्मी बढ़ रही है? दिल धड़काने वाले सवालों के लिए तैयार रहें।',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'आज रात की फैंटेसी',
+        'card_3_desc': 'आज रात कोई सोएगा नहीं! अपनी सबसे गहरी इच्छाओं को खोलें।',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'परम अनुभव',
+        'card_4_desc': 'तय नहीं कर पा रहे? तो सब कुछ क्यों न लें! Love Marble का पूरा सफर।',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'खतरनाक रहस्य',
+        'card_5_desc': 'कुछ सच लुभावने होते हैं... क्या आप वर्जित विषयों का बॉक्स खोलने की हिम्मत करेंगे?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'हमेशा के लिए तैयार',
+        'card_6_desc': 'वित्त से लेकर बच्चों और मूल्यों तक—यह यथार्थवादी अनुकूलता परीक्षण लें!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'चिंगारी फिर जलाएं',
+        'card_7_desc': 'दिनचर्या को तोड़ें और रोमांस को फिर से खोजें!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'अविस्मरणीय रातें',
+        'card_8_desc': 'रोमांटिक मिशनों के साथ अपनी यात्रा की रातों को और भी खास बनाएं।',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'बातें कम, काम ज्यादा!',
+        'card_9_desc': '100% डेयर और शारीरिक मिशन। छोटी बातों को छोड़ें!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'विकल्प A या विकल्प B?',
+        'card_10_desc': 'दुविधा कार्ड का संग्रह। अंतहीन बातचीत शुरू करें।',
         'ready_title': 'खेलने के लिए तैयार?',
         'available': 'iOS और Android पर उपलब्ध',
         'appstore_alt': 'App Store पर डाउनलोड करें',
@@ -293,12 +683,15 @@ TRANSLATIONS = {
         'lang': 'pt-BR',
         'title': 'Love Marble - O jogo de casal definitivo',
         'meta_desc': 'Jogo de tabuleiro offline para casais (2 jogadores). Role o dado, complete missões e construa intimidade. Disponível no iOS e Android.',
+        'ld_desc': 'Um jogo de tabuleiro local e offline para casais, jogado por duas pessoas em um dispositivo. Jogue os dados, caia nas cartas e complete missões e perguntas românticas. Não requer conexão com servidor.',
+        'offer_desc': 'O jogo base (Pacote Sweet) é 100% gratuito. Pacotes de expansão premium e Passe Livre Vitalício (US$ 9,9) disponíveis para compra no aplicativo.',
         'og_title': 'Love Marble - Jogo para casais',
         'og_desc': 'Acenda seu romance com o jogo de tabuleiro definitivo para casais!',
         'twitter_title': 'Love Marble - Acenda o romance',
         'twitter_desc': 'O melhor jogo de tabuleiro para casais. Role o dado e comece sua jornada agora!',
         'hero_sub': 'Role o dado. Acenda o romance.',
         'banner_alt': 'Banner principal',
+        'screenshot_alt': 'Captura de tela',
         'play_now': 'Jogar agora',
         'preview_title': 'Prévia no jogo',
         'pc_msg': '< Clique nas setas para rolar >',
@@ -307,6 +700,33 @@ TRANSLATIONS = {
         'card_1_title': 'DOCE',
         'card_1_sub': 'Faísca romântica',
         'card_1_desc': 'Lembra a emoção do primeiro encontro? Mergulhe em conversas doces e toques românticos.',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Aumentando o Calor',
+        'card_2_desc': 'Está ficando um pouco quente aqui? Prepare-se para perguntas de tirar o fôlego.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'Fantasia de Hoje à Noite',
+        'card_3_desc': 'Não tem como dormir hoje! Liberte seus desejos mais profundos.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'A Experiência Definitiva',
+        'card_4_desc': 'Não consegue decidir? Por que não ter tudo! A jornada completa do Love Marble.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Segredos Perigosos',
+        'card_5_desc': 'Algumas verdades são tentadoras... Tem coragem de abrir a caixa dos tópicos tabu?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Prontos para Sempre',
+        'card_6_desc': 'De finanças a filhos e valores - faça este teste realista de compatibilidade!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'Reacendendo a Faísca',
+        'card_7_desc': 'Quebre a rotina e redescubra o romance!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Noites Inesquecíveis',
+        'card_8_desc': 'Apimente suas noites de viagem com missões românticas.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'Menos conversa, mais toque!',
+        'card_9_desc': '100% de desafios e missões físicas. Pule a conversa fiada!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'Opção A ou Opção B?',
+        'card_10_desc': 'Uma coleção de cartas de dilema. Desperte conversas intermináveis.',
         'ready_title': 'Pronto para jogar?',
         'available': 'Disponível no iOS e Android',
         'appstore_alt': 'Baixar na App Store',
@@ -318,12 +738,15 @@ TRANSLATIONS = {
         'lang': 'ru',
         'title': 'Love Marble - Игра для пар',
         'meta_desc': 'Оффлайн настольная игра для пар (2 игрока). Бросайте кости, выполняйте задания и укрепляйте близость. Доступно на iOS и Android.',
+        'ld_desc': 'Локальная офлайн-настольная игра для пар, в которую играют два человека на одном устройстве. Бросайте кубики, попадайте на карточки и выполняйте романтические задания и отвечайте на вопросы. Подключение к серверу не требуется.',
+        'offer_desc': 'Базовая игра (Sweet Pack) на 100% бесплатна. Премиум-дополнения и пожизненный бесплатный пропуск ($9.9) доступны через встроенные покупки.',
         'og_title': 'Love Marble - Настольная игра для пар',
         'og_desc': 'Зажгите романтику с лучшей настольной игрой для пар!',
         'twitter_title': 'Love Marble - Зажгите романтику',
         'twitter_desc': 'Лучшая настольная игра для пар. Бросайте кости и начните путешествие сейчас!',
         'hero_sub': 'Бросайте кости. Зажгите романтику.',
         'banner_alt': 'Главный баннер',
+        'screenshot_alt': 'Скриншот',
         'play_now': 'Играть сейчас',
         'preview_title': 'Превью в игре',
         'pc_msg': '< Нажмите стрелки для прокрутки >',
@@ -332,6 +755,33 @@ TRANSLATIONS = {
         'card_1_title': 'СЛАДКОЕ',
         'card_1_sub': 'Романтическая искра',
         'card_1_desc': 'Помните трепет первого свидания? Погрузитесь в сладкие разговоры и романтические прикосновения.',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Становится жарко',
+        'card_2_desc': 'Здесь становится жарковато? Приготовьтесь к вопросам, от которых замирает сердце.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'Фантазия этой ночи',
+        'card_3_desc': 'Этой ночью не до сна! Раскройте свои самые сокровенные желания.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'Полный опыт',
+        'card_4_desc': 'Не можете выбрать? Почему бы не взять всё! Полное путешествие Love Marble.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Опасные секреты',
+        'card_5_desc': 'Некоторые истины так соблазнительны... Осмелитесь открыть ящик запретных тем?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Готовы навсегда',
+        'card_6_desc': 'От финансов до детей и ценностей — пройдите реалистичный тест на совместимость!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'Разжечь искру заново',
+        'card_7_desc': 'Вырвитесь из рутины и заново откройте романтику!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Незабываемые ночи',
+        'card_8_desc': 'Добавьте огня в ночи путешествий с романтическими заданиями.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'Меньше слов, больше прикосновений!',
+        'card_9_desc': '100% заданий на смелость и физических миссий. Без пустой болтовни!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'Вариант А или вариант Б?',
+        'card_10_desc': 'Коллекция карт-дилемм. Разожгите бесконечный разговор.',
         'ready_title': 'Готовы играть?',
         'available': 'Доступно на iOS и Android',
         'appstore_alt': 'Скачать в App Store',
@@ -344,12 +794,15 @@ TRANSLATIONS = {
         'lang': 'tr',
         'title': 'Love Marble - Çiftler için nihai oyun',
         'meta_desc': 'Çevrimdışı çiftler için masa oyunu (2 oyuncu). Zar atın, görevleri tamamlayın ve samimiyeti artırın. iOS ve Android üzerinde mevcut.',
+        'ld_desc': 'Tek cihazda iki kişi tarafından oynanan yerel, çevrimdışı bir çift kutu oyunu. Zarları atın, kartlara gelin ve romantik görevleri ve soruları tamamlayın. Sunucu bağlantısı gerekmez.',
+        'offer_desc': 'Temel oyun (Sweet Pack) %100 ücretsizdir. Premium genişletme paketleri ve Ömür Boyu Ücretsiz Bilet (9,9 $) uygulama içi satın alımla mevcuttur.',
         'og_title': 'Love Marble - Çiftler için masa oyunu',
         'og_desc': 'Çiftler için en iyi masa oyunu ile romantizmi yakın!',
         'twitter_title': 'Love Marble - Romantizmi yakın',
         'twitter_desc': 'Çiftler için en iyi masa oyunu. Zar atın ve yolculuğunuza hemen başlayın!',
         'hero_sub': 'Zarı atın. Romantizmi yakın.',
         'banner_alt': 'Ana afiş',
+        'screenshot_alt': 'Ekran görüntüsü',
         'play_now': 'Şimdi oyna',
         'preview_title': 'Oyun İçi Önizleme',
         'pc_msg': '< Kaydırmak için okları tıklayın >',
@@ -358,6 +811,33 @@ TRANSLATIONS = {
         'card_1_title': 'TATLI',
         'card_1_sub': 'Romantik kıvılcım',
         'card_1_desc': 'İlk buluşmanın heyecanını hatırlıyor musunuz? Tatlı sohbetlere ve romantik dokunuşlara dalın.',
+        'card_2_title': 'HOT',
+        'card_2_sub': 'Ateşi Yükseltmek',
+        'card_2_desc': 'Burası biraz ısındı mı? Kalp atışlarını hızlandıran sorulara hazır olun.',
+        'card_3_title': 'SPICY',
+        'card_3_sub': 'Bu Geceki Fantezi',
+        'card_3_desc': 'Bu gece uyumak yok! En derin arzularınızı serbest bırakın.',
+        'card_4_title': 'FULL COURSE',
+        'card_4_sub': 'Nihai Deneyim',
+        'card_4_desc': 'Karar veremiyor musunuz? Neden hepsini almayasınız! Tam bir Love Marble yolculuğu.',
+        'card_5_title': "PANDORA'S BOX",
+        'card_5_sub': 'Tehlikeli Sırlar',
+        'card_5_desc': 'Bazı gerçekler cezbedicidir... Tabu konularının kutusunu açmaya cesaretiniz var mı?',
+        'card_6_title': 'WEDDING QUIZ',
+        'card_6_sub': 'Sonsuza Dek Hazır',
+        'card_6_desc': 'Finanstan çocuklara ve değerlere kadar—bu gerçekçi uyum testini çözün!',
+        'card_7_title': 'MARRIED PACK',
+        'card_7_sub': 'Kıvılcımı Yeniden Yakmak',
+        'card_7_desc': 'Rutini kırın ve romantizmi yeniden keşfedin!',
+        'card_8_title': 'ROMANTIC GETAWAY',
+        'card_8_sub': 'Unutulmaz Geceler',
+        'card_8_desc': 'Romantik görevlerle seyahat gecelerinize renk katın.',
+        'card_9_title': 'ALL-ACTION PACK',
+        'card_9_sub': 'Az laf, çok iş!',
+        'card_9_desc': '%100 cesaret ve fiziksel görevler. Boş lafları atlayın!',
+        'card_10_title': 'WOULD YOU RATHER',
+        'card_10_sub': 'Seçenek A mı Seçenek B mi?',
+        'card_10_desc': 'Dilemma kartları koleksiyonu. Sonsuz sohbeti ateşleyin.',
         'ready_title': 'Oynamaya hazır mısınız?',
         'available': 'iOS ve Android üzerinde mevcut',
         'appstore_alt': 'App Store\'dan indir',
@@ -367,44 +847,37 @@ TRANSLATIONS = {
     }
 }
 
-# Map file suffix to language key in TRANSLATIONS
-FILE_LANG_MAP = {
-    'lovemarble_de.html': 'de',
-    'lovemarble_fr.html': 'fr',
-    'lovemarble_es-ES.html': 'es',
-    'lovemarble_es-MX.html': 'es',
-    'lovemarble_it.html': 'it',
-    'lovemarble_ja.html': 'ja',
-    'lovemarble_zh-TW.html': 'zh-TW',
-    'lovemarble_th.html': 'th',
-    'lovemarble_vi.html': 'vi',
-    'lovemarble_id.html': 'id',
-    'lovemarble_hi.html': 'hi',
-    'lovemarble_pt-BR.html': 'pt-BR',
-    'lovemarble_ru.html': 'ru',
-    'lovemarble_tr.html': 'tr',
-    'lovemarble_ko.html': 'ko'
-}
+# Page name -> TRANSLATIONS key, from the locale registry
+FILE_LANG_MAP = locales.file_lang_map()
 
 ROOT = Path('.').resolve()
 
 TEMPLATE_KEYS = [
     ('<html lang="en">', lambda t: f'<html lang="{t["lang"]}">'),
-    ('<title>Love Marble - The Ultimate Couple Game</title>', lambda t: f'<title>{t["title"]}</title>'),
-    ('<meta name="description" content="An offline couple board game for 2 players on 1 device. Roll the dice, complete sweet missions, and build intimacy. Available on App Store and Google Play.">',
+    ('<title>Love Marble - The Ultimate Couples Game</title>', lambda t: f'<title>{t["title"]}</title>'),
+    ('<meta name="description" content="An offline couples board game for 2 players on 1 device. Roll the dice, complete sweet missions, and build intimacy. Available on App Store and Google Play.">',
      lambda t: f'<meta name="description" content="{t["meta_desc"]}">'),
-    ('<meta property="og:title" content="Love Marble - The Ultimate Couple Board Game">', lambda t: f'<meta property="og:title" content="{t["og_title"]}">'),
+    ('"description": "A local, offline couples board game played by two people on one device. Roll the dice, land on cards, and complete romantic missions and questions. No server connection required."',
+     lambda t: f'"description": {json.dumps(t["ld_desc"], ensure_ascii=False)}'),
+    ('"description": "Base game (Sweet Pack) is 100% free. Premium expansion packs and Lifetime Free Pass ($9.9) available via in-app purchase."',
+     lambda t: f'"description": {json.dumps(t["offer_desc"], ensure_ascii=False)}'),
+    ('<meta property="og:title" content="Love Marble - The Ultimate couplesBoard Game">', lambda t: f'<meta property="og:title" content="{t["og_title"]}">'),
     ('<meta property="og:description" content="Spark your romance with the ultimate board game for couples! 16 languages supported. 100% private & no server required.">',
      lambda t: f'<meta property="og:description" content="{t["og_desc"]}">'),
     ('<meta name="twitter:title" content="Love Marble - Spark the Romance">', lambda t: f'<meta name="twitter:title" content="{t["twitter_title"]}">'),
     ('<meta name="twitter:description" content="The best board game for couples. Roll the dice and start your journey now!">', lambda t: f'<meta name="twitter:description" content="{t["twitter_desc"]}">'),
     ('<p style="font-size: 1.2rem; color: var(--text-secondary);">Roll the dice. Spark the romance.</p>', lambda t: f'<p style="font-size: 1.2rem; color: var(--text-secondary);">{t["hero_sub"]}</p>'),
     ('<span class="alt-text">Main Banner Loading...</span>', lambda t: f'<span class="alt-text">{t["banner_alt"]} 로딩 중...</span>' if t.get('lang','').startswith('ko') else f'<span class="alt-text">{t["banner_alt"]} Loading...</span>' ),
+    # The inline script's fallback for pages rendered without image_markup
+    ('img.alt = "Main Banner";', lambda t: f'img.alt = {json.dumps(t["banner_alt"], ensure_ascii=False)};'),
+    ('img.alt = `Screenshot ${index + 1}`;', lambda t: f'img.alt = `{t["screenshot_alt"]} ${{index + 1}}`;'),
     ('<a href="#download" id="hero-down-btn" class="btn">Play Now</a>', lambda t: f'<a href="#download" id="hero-down-btn" class="btn">{t["play_now"]}</a>'),
     ('<h2 class="section-title"><span>In-Game Preview</span></h2>', lambda t: f'<h2 class="section-title"><span>{t["preview_title"]}</span></h2>'),
     ('<span class="pc-msg">&lt; Click Arrows to Scroll &gt;</span>', lambda t: f'<span class="pc-msg">{t["pc_msg"]}</span>'),
     ('<span class="mobile-msg">Swipe left to explore -></span>', lambda t: f'<span class="mobile-msg">{t["mobile_msg"]}</span>'),
     ('<h2 class="section-title"><span>Card Packs Collection</span></h2>', lambda t: f'<h2 class="section-title"><span>{t["packs_title"]}</span></h2>'),
+    ('<a href="./index.html" class="back-link">&lt; TERRION Home</a>',
+     lambda t: f'<a href="./index.html" class="back-link">{html.escape(t["back"], quote=False)}</a>'),
     ('Ready to Play?', lambda t: t['ready_title']),
     ('Available on iOS & Android', lambda t: t['available']),
     ('alt="Download on the App Store"', lambda t: f'alt="{t["appstore_alt"]}"'),
@@ -412,53 +885,596 @@ TEMPLATE_KEYS = [
     ('&copy; 2026 TERRION Games. <br>\n        Developed by Ian & Zonk.', lambda t: f'&copy; 2026 TERRION Games. <br>\n        {t["footer_dev"]}')
 ]
 
-# Card pack replacements (a subset)
-CARD_REPLACEMENTS = [
-    (r'>🍭 SWEET</h3>', lambda t: f'>🍭 {t.get("card_1_title", "SWEET")}</h3>'),
-    (r'>Romantic Spark</span>', lambda t: f'>{t.get("card_1_sub","Romantic Spark")}</span>'),
-    (r'>Remember that first-date flutter\? Dive into sweet talk and romantic touches!</p>',
-     lambda t: f'>{t.get("card_1_desc","Remember that first-date flutter? Dive into sweet talk and romantic touches!")}</p>')
+# Card packs in template order: (emoji, title, subtitle, description). Card N
+# reads card_N_title/_sub/_desc and keeps the English text when a key is missing.
+CARD_PACKS = [
+    ('🍭', 'SWEET', 'Romantic Spark',
+     'Remember that first-date flutter? Dive into sweet talk and romantic touches!'),
+    ('🔥', 'HOT', 'Turning up the Heat',
+     'Is it getting a bit warm in here? Prepare for heart-pounding questions.'),
+    ('🌶️', 'SPICY', "Tonight's Fantasy",
+     'There’s no sleeping tonight! Unlock your deepest desires.'),
+    ('🍽️', 'FULL COURSE', 'The Ultimate Experience',
+     "Can't decide? Why not have it all! The complete Love Marble journey."),
+    ('📦', "Pandora's Box", 'Dangerous Secrets',
+     'Some truths are tempting... Dare to open the box of taboo topics?'),
+    ('💍', 'Wedding Quiz', 'Ready for Forever',
+     'From finances to kids and values—take this realistic compatibility test!'),
+    ('🏡', 'Married Pack', 'Reigniting the Spark',
+     'Break the routine and rediscover the romance!'),
+    ('✈️', 'Romantic Getaway', 'Unforgettable Nights',
+     'Spice up your travel nights with romantic missions.'),
+    ('⚡', 'All-Action Pack', 'Less talk, more touch!',
+     '100% dares and physical missions. Skip the small talk!'),
+    ('⚖️', 'Would You Rather', 'Option A vs Option B?',
+     'A collection of dilemma cards. Spark endless conversation.'),
+]
+
+
+def _card_rules(packs):
+    rules = []
+    for number, (emoji, title, sub, desc) in enumerate(packs, 1):
+        prefix = f'card_{number}_'
+        rules += [
+            (re.escape(f'>{emoji} {title}</h3>'),
+             lambda t, k=prefix + 'title', e=emoji, d=title: f'>{e} {t.get(k, d)}</h3>'),
+            (re.escape(f'>{sub}</span>'),
+             lambda t, k=prefix + 'sub', d=sub: f'>{t.get(k, d)}</span>'),
+            (re.escape(f'<p>{desc}</p>'),
+             lambda t, k=prefix + 'desc', d=desc: f'<p>{t.get(k, d)}</p>'),
+        ]
+    return rules
+
+
+CARD_REPLACEMENTS = _card_rules(CARD_PACKS)
+
+# Per-page URLs; `t["page"]` is the output file name (see page_context)
+PAGE_KEYS = [
+    ('<link rel="canonical" href="https://terriongames.com/lovemarble.html">',
+     lambda t: f'<link rel="canonical" href="https://terriongames.com/{t["page"]}">'),
+    ('<meta property="og:url" content="https://terriongames.com/lovemarble.html">',
+     lambda t: f'<meta property="og:url" content="https://terriongames.com/{t["page"]}">'),
+    ('"url": "https://terriongames.com/lovemarble.html"', lambda t: f'"url": "https://terriongames.com/{t["page"]}"'),
 ]
 
+# Path and lang rewrites applied together with the text rules. Image folders
+# follow the page code (es-ES, es-MX), not the shared translation key.
+PATH_REPLACEMENTS = [
+    (r'folder:\s*"\./images/.{0,10}",', lambda t: f'folder: "./images/{t["folder"]}/",'),
+    (r'<html lang="[^"]+">', lambda t: f'<html lang="{t["lang"]}">'),
+]
+
+
+def _label(pattern: str, limit: int = 48) -> str:
+    text = ' '.join(pattern.split())
+    return text if len(text) <= limit else text[:limit - 3] + '...'
+
+
+def _trie_branches(literals):
+    """Return regex alternatives matching any of `literals` ((text, group_name) pairs).
+
+    The alternatives are nested by shared prefix, so the regex engine only
+    descends into branches that match the next character instead of trying
+    every key in turn. An empty named group marks where each key ends; longer
+    keys are tried before a key that is their prefix. The top level is returned
+    as a list so callers can splice it into a flat alternation.
+    """
+    trie = {}
+    for text, name in literals:
+        node = trie
+        for ch in text:
+            node = node.setdefault(ch, {})
+        node.setdefault('', name)
+
+    def branches(node):
+        alternatives = []
+        for ch in sorted(k for k in node if k):
+            child = node[ch]
+            run = ch
+            # Collapse single-child chains into one literal run
+            while len(child) == 1 and '' not in child:
+                (nxt, child), = child.items()
+                run += nxt
+            alternatives.append(re.escape(run) + build(child))
+        if '' in node:
+            alternatives.append(f'(?P<{node[""]}>)')
+        return alternatives
+
+    def build(node):
+        alternatives = branches(node)
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+
+    return branches(trie)
+
+
+class MultiReplacer:
+    """Apply many (pattern, fn) rules in one left-to-right scan.
+
+    Literal keys are compiled into a prefix trie and regex rules are appended
+    as further alternatives of the same compiled pattern; an empty named group
+    `(?P<rN>)` at the end of each alternative tells which rule matched. Cost
+    per position grows with key length, not with the number of keys.
+
+    Every top-level alternative starts with a plain character, which lets the
+    regex engine skip straight to positions holding one of those characters.
+    Rule regexes must not define named groups of their own.
+    """
+
+    def __init__(self, literal_rules, regex_rules):
+        rules = [(re.escape(orig), _label(orig), fn) for orig, fn in literal_rules]
+        rules += [(pattern, _label(pattern), fn) for pattern, fn in regex_rules]
+        self.rules = rules
+        literals = [(orig, f'r{i}') for i, (orig, _) in enumerate(literal_rules)]
+        alternatives = _trie_branches(literals)
+        for i, (pattern, _, _) in enumerate(rules[len(literal_rules):], len(literal_rules)):
+            alternatives.append(f'(?:{pattern})(?P<r{i}>)' if '|' in pattern else f'{pattern}(?P<r{i}>)')
+        self.regex = re.compile('|'.join(alternatives))
+
+    def apply(self, text: str, t: dict):
+        """Return (new_text, Counter of matched rule labels)."""
+        matched = Counter()
+        replacements = {}
+
+        def sub(m):
+            i = int(m.lastgroup[1:])
+            matched[self.rules[i][1]] += 1
+            if i not in replacements:
+                replacements[i] = self.rules[i][2](t)
+            return replacements[i]
+
+        return self.regex.sub(sub, text), matched
+
+
+REPLACER = MultiReplacer(TEMPLATE_KEYS + PAGE_KEYS, CARD_REPLACEMENTS + PATH_REPLACEMENTS)
+
+TEMPLATE = 'lovemarble.html'
+
+
+def page_context(name: str, lang_key: str) -> dict:
+    """Translation entry for `lang_key` plus the page's own name and image folder."""
+    code = name[len('lovemarble_'):-len('.html')]
+    return dict(TRANSLATIONS[lang_key], page=name, folder=code)
+
+
+class PageTemplate:
+    """The English page pre-split at every rule match.
+
+    Parsing happens once; rendering a locale only evaluates each matched rule
+    once and joins the segments, so a full 16-page render takes milliseconds
+    and always starts from the same source.
+    """
+
+    def __init__(self, text: str, replacer: MultiReplacer = REPLACER):
+        self.replacer = replacer
+        self.segments = []
+        self.slots = []
+        pos = 0
+        for m in replacer.regex.finditer(text):
+            self.segments.append(text[pos:m.start()])
+            self.slots.append(len(self.segments))
+            self.segments.append(int(m.lastgroup[1:]))
+            pos = m.end()
+        self.segments.append(text[pos:])
+        self.source = text
+
+    def render(self, t: dict) -> str:
+        parts = list(self.segments)
+        values = {}
+        for i in self.slots:
+            rule = parts[i]
+            if rule not in values:
+                values[rule] = self.replacer.rules[rule][2](t)
+            parts[i] = values[rule]
+        return ''.join(parts)
+
+
+def site_pages():
+    """(page name, translation key) for every rendered page; English is the template itself."""
+    return [(loc.page, loc.translation) for loc in locales.LOCALES]
+
+
+RENDER_MANIFEST = '.render-manifest.json'
+WATCH_INTERVAL = 0.2
+# Watched besides the template: modules whose code shapes the output (saving
+# one restarts the watcher) and the folders the pages' assets come from
+WATCH_MODULES = ('locales', 'site_assets', 'image_markup', 'subset_fonts', 'critical_css')
+WATCH_DIRS = ('css', 'images', 'fonts')
+
+
+def _sha256(*parts) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def rules_fingerprint(replacer: MultiReplacer = REPLACER) -> str:
+    """Hash of every rule's pattern and the code and defaults of its replacement function."""
+    parts = []
+    for pattern, _, fn in replacer.rules:
+        code = fn.__code__
+        parts += [pattern, code.co_code.hex(), repr(code.co_consts), repr(code.co_names),
+                  repr(fn.__defaults__)]
+    return _sha256(*parts)
+
+
+def page_fingerprint(name: str, lang_key) -> str:
+    """Hash of the translation entry a page is rendered with."""
+    if lang_key is None:
+        return _sha256(name)
+    return _sha256(json.dumps(page_context(name, lang_key), sort_keys=True, ensure_ascii=False))
 
-def translate_file(path: Path, lang_key: str):
+
+_worker_template = None
+_worker_site_dir = None
+_worker_out_dir = None
+
+
+def _init_worker(source: str, site_dir: Path, out_dir: Path, trace: bool = None):
+    global _worker_template, _worker_site_dir, _worker_out_dir
+    if trace is not None:
+        tracing.init_worker(trace)
+    _worker_template = PageTemplate(source)
+    _worker_site_dir = site_dir
+    _worker_out_dir = out_dir
+
+
+def _render_page(task):
+    import critical_css
+    import image_markup
+    import subset_fonts
+
+    name, key = task[:2]
+    if len(task) > 2 and (_worker_template is None
+                          or (_worker_template.source, _worker_site_dir, _worker_out_dir) != tuple(task[2:])):
+        # A pool shared with other work has no _init_worker: the task carries the template
+        _init_worker(*task[2:])
+    with tracing.span(name, 'locale'):
+        with tracing.span('translate'):
+            text = _worker_template.source if key is None else _worker_template.render(page_context(name, key))
+        with tracing.span('hreflang'):
+            text = locales.apply_hreflang(text)
+        with tracing.span('images'):
+            text = image_markup.inject_images(text, _worker_site_dir,
+                                              None if key is None else TRANSLATIONS[key])
+        with tracing.span('fonts'):
+            text = subset_fonts.apply_fonts(text, _worker_site_dir, _worker_out_dir)
+        with tracing.span('critical css'):
+            text = critical_css.inline_critical(text, _worker_site_dir)
+    return name, text, tracing.collect()
+
+
+def _render_pages(source: str, site_dir: Path, out_dir: Path, tasks, jobs: int, pool_map=None):
+    """Yield (name, text) for each task, in task order."""
+    pool = None
+    if pool_map is not None:
+        results = pool_map(_render_page, [(name, key, source, site_dir, out_dir) for name, key in tasks])
+    elif jobs <= 1 or len(tasks) <= 1:
+        _init_worker(source, site_dir, out_dir)
+        results = map(_render_page, tasks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=_init_worker,
+                                   initargs=(source, site_dir, out_dir, tracing.enabled()))
+        results = pool.map(_render_page, tasks)
+    try:
+        for name, text, events in results:
+            tracing.merge(events)
+            yield name, text
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def render_site(out_dir: Path, template_path: Path = Path(TEMPLATE), jobs: int = 1, force: bool = False,
+                pool_map=None):
+    """Render every locale page from `template_path` into `out_dir`.
+
+    Each page depends on the template, the replacement tables, its own
+    TRANSLATIONS entry, the images its IMG_CONFIG names (rendered as static
+    markup by image_markup.py), the font sources it is subset from
+    (subset_fonts.py) and the stylesheets whose above-the-fold rules are
+    inlined (critical_css.py), all relative to the template's directory (font
+    subsets are written to `out_dir/fonts/`); their
+    fingerprints are kept in `out_dir/.render-manifest.json`
+    and only pages with a changed input (or a missing/edited output) are
+    rendered, `jobs` at a time, or through `pool_map` (a map(fn, iterable)
+    over an existing process pool, as build.py passes) when given. Files
+    whose content is unchanged are not rewritten. Returns the list of (page
+    name, status) pairs where status is 'rendered', 'unchanged' (rendered,
+    same bytes) or 'fresh' (skipped).
+    """
+    import compress_site
+    import critical_css
+    import image_markup
+    import site_assets
+    import subset_fonts
+
+    site_dir = template_path.parent
+    if out_dir.resolve() == site_dir.resolve():
+        raise ValueError(f'{out_dir} holds the template: rendering there would overwrite {template_path.name}')
+    source = template_path.read_text(encoding='utf-8')
+    tracing.count('bytes_read', len(source.encode('utf-8')))
+    missing = subset_fonts.missing_sources(site_dir)
+    if subset_fonts.ft_subset is not None and missing:
+        print(f"Warning: missing font sources in {site_dir / subset_fonts.SOURCE_DIR} "
+              f"({', '.join(missing)}), pages keep Google Fonts")
+    with tracing.span('fingerprint inputs'):
+        template_hash = _sha256(source, critical_css.stylesheets_fingerprint(source, site_dir),
+                                subset_fonts.sources_fingerprint(site_dir))
+        config_block = site_assets.IMG_CONFIG_RE.search(source)
+        # Every tools/ module the render runs, critical_css's minify_css included
+        rules_hash = _sha256(rules_fingerprint(), *(Path(m.__file__).read_text(encoding='utf-8')
+                                                      for m in (locales, image_markup, subset_fonts, critical_css,
+                                                                compress_site, site_assets)))
+        manifest_path = out_dir / RENDER_MANIFEST
+        try:
+            entries = json.loads(manifest_path.read_text(encoding='utf-8')).get('pages', {})
+        except (OSError, ValueError):
+            entries = {}
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        status = {}
+        tasks = []
+        inputs = {}
+        for name, key in site_pages():
+            images = ''
+            if config_block:
+                block = config_block.group(0)
+                if key is not None:
+                    block = translate_text(block, page_context(name, key))[0]
+                images = image_markup.images_fingerprint(site_assets.img_config(block), site_dir)
+            inputs[name] = _sha256(template_hash, rules_hash, page_fingerprint(name, key), images)
+            entry = entries.get(name)
+            target = out_dir / name
+            if not force and entry and entry['inputs'] == inputs[name] and target.exists():
+                st = target.stat()
+                if st.st_size == entry['bytes'] and st.st_mtime_ns == entry['mtime_ns']:
+                    status[name] = 'fresh'
+                    tracing.count('render_cache_hit')
+                    continue
+            tasks.append((name, key))
+            tracing.count('render_cache_miss')
+
+    for name, text in _render_pages(source, site_dir, out_dir, tasks, jobs, pool_map):
+        target = out_dir / name
+        data = text.encode('utf-8')
+        written = not target.exists() or target.read_bytes() != data
+        if written:
+            target.write_bytes(data)
+            tracing.count('bytes_written', len(data))
+        st = target.stat()
+        entries[name] = {'inputs': inputs[name], 'bytes': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        status[name] = 'rendered' if written else 'unchanged'
+
+    if tasks:
+        pages = {name: entries[name] for name, _ in site_pages() if name in entries}
+        tmp = manifest_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'pages': pages}, indent=2, sort_keys=True), encoding='utf-8')
+        tmp.replace(manifest_path)
+    return [(name, status[name]) for name, _ in site_pages()]
+
+
+def _wait_for_change(paths, dirs=()):
+    """Block until one of `paths` or a file under `dirs` changes; return its path.
+
+    Uses filesystem notifications when watchdog is installed and falls back
+    to polling the files' stat every WATCH_INTERVAL seconds.
+    """
+    paths = [p.resolve() for p in paths]
+    dirs = [d.resolve() for d in dirs if d.is_dir()]
+
+    def watched(path):
+        return path in paths or any(path.is_relative_to(d) for d in dirs)
+
+    if Observer is not None:
+        changed = []
+        event = threading.Event()
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, ev):
+                # Reads (the dev server, a browser) are not changes
+                if ev.event_type in ('opened', 'closed_no_write'):
+                    return
+                # Editors often save via a temp file renamed over the original
+                for candidate in (getattr(ev, 'dest_path', ''), ev.src_path):
+                    if candidate and watched(Path(candidate).resolve()):
+                        changed.append(Path(candidate).resolve())
+                        event.set()
+
+        observer = Observer()
+        for folder in {p.parent for p in paths} - set(dirs):
+            observer.schedule(Handler(), str(folder), recursive=False)
+        for folder in dirs:
+            observer.schedule(Handler(), str(folder), recursive=True)
+        observer.start()
+        try:
+            event.wait()
+            time.sleep(0.05)  # let the editor finish writing
+        finally:
+            observer.stop()
+            observer.join()
+        return changed[0]
+
+    def stamp(p):
+        try:
+            st = p.stat()
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def snapshot():
+        files = list(paths) + [f for d in dirs for f in d.rglob('*') if f.is_file()]
+        return {f: stamp(f) for f in files}
+
+    before = snapshot()
+    while True:
+        time.sleep(WATCH_INTERVAL)
+        after = snapshot()
+        for p in before.keys() | after.keys():
+            if before.get(p) != after.get(p):
+                return p
+
+
+def report_render(out_dir: Path, results, elapsed: float):
+    for name, status in results:
+        if status != 'fresh':
+            print('Rendered' if status == 'rendered' else 'Unchanged', out_dir / name)
+    fresh = sum(status == 'fresh' for _, status in results)
+    print(f'Done rendering {len(results)} pages ({len(results) - fresh} rebuilt, {fresh} up to date) '
+          f'in {elapsed * 1e3:.1f} ms.')
+
+
+def watch(out_dir: Path, template_path: Path, jobs: int):
+    """Rebuild whenever a render input changes; restart when this file or a render module changes."""
+    script = Path(__file__)
+    modules = [script] + [script.with_name(f'{name}.py') for name in WATCH_MODULES]
+    dirs = [template_path.parent / name for name in WATCH_DIRS]
+    backend = 'watchdog' if Observer is not None else f'polling every {WATCH_INTERVAL}s'
+    print(f'Watching {template_path}, {", ".join(f"{d}/" for d in WATCH_DIRS)} and the render modules '
+          f'({backend}). Press Ctrl+C to stop.')
+    while True:
+        changed = _wait_for_change([template_path] + modules, dirs)
+        if changed in {m.resolve() for m in modules}:
+            # TRANSLATIONS, the rule tables and the render stages are code: reload them
+            print(f'{changed.name} changed, restarting.')
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        start = time.perf_counter()
+        try:
+            results = render_site(out_dir, template_path, jobs)
+        except OSError as e:
+            print(f'Render failed: {e}')
+            continue
+        report_render(out_dir, results, time.perf_counter() - start)
+
+
+def translate_text(text: str, t: dict):
+    """Translate one page's text; returns (new_text, matched rule labels)."""
+    return REPLACER.apply(text, t)
+
+
+def translate_text_sequential(text: str, t: dict, template_keys=TEMPLATE_KEYS + PAGE_KEYS,
+                              regex_rules=CARD_REPLACEMENTS + PATH_REPLACEMENTS) -> str:
+    """The original one-scan-per-rule loop, kept as the benchmark baseline."""
+    for orig, fn in template_keys:
+        if isinstance(orig, str) and orig in text:
+            text = text.replace(orig, fn(t))
+    for pattern, fn in regex_rules:
+        text = re.sub(pattern, fn(t), text)
+    return text
+
+
+def translate_file(path: Path, lang_key: str, verbose: bool = False):
     print('Translating', path.name, '->', lang_key)
     if lang_key not in TRANSLATIONS:
         print('No translations for', lang_key)
         return
-    t = TRANSLATIONS[lang_key]
-    text = path.read_text(encoding='utf-8')
+    t = page_context(path.name, lang_key)
+    with tracing.span(path.name, 'locale'):
+        with tracing.span('read'):
+            source = path.read_text(encoding='utf-8')
+        tracing.count('bytes_read', len(source.encode('utf-8')))
+        with tracing.span('translate'):
+            text, matched = translate_text(source, t)
+        print(f'  matched {len(matched)}/{len(REPLACER.rules)} rules, {sum(matched.values())} replacements')
+        if verbose:
+            for label, count in sorted(matched.items()):
+                print(f'    {count}x {label}')
 
-    # Replace image/icon paths
-    text = text.replace('images/icon.png', f'images/{t["lang"]}/icon.png')
-    text = text.replace('IMG_CONFIG = {\n            folder: "./images/', 'IMG_CONFIG = {\n            folder: "./images/')
-    # Update IMG_CONFIG.folder pattern more directly
-    text = re.sub(r"folder:\s*\"\.\/images\/.{0,10}\",", f'folder: "./images/{t["lang"]}/",', text)
+        with tracing.span('write'):
+            path.write_text(text, encoding='utf-8')
+        tracing.count('bytes_written', len(text.encode('utf-8')))
 
-    # Apply template key replacements
-    for orig, fn in TEMPLATE_KEYS:
-        if isinstance(orig, str) and orig in text:
-            new = fn(t)
-            text = text.replace(orig, new)
 
-    # Simple card replacements
-    for pattern, fn in CARD_REPLACEMENTS:
-        text = re.sub(pattern, fn(t), text)
+def benchmark(iterations: int):
+    """Time the single-pass replacer against the sequential loop on every page.
 
-    # Update html lang attribute if present
-    text = re.sub(r'<html lang="[^"]+">', f'<html lang="{t["lang"]}">', text)
+    A second round adds 20 synthetic (non-matching) card-pack keys per real
+    rule to show how both approaches scale as the tables grow.
+    """
+    pages = []
+    for f in sorted(Path('.').glob('lovemarble*.html')):
+        key = FILE_LANG_MAP.get(f.name, 'de')
+        pages.append((f.read_text(encoding='utf-8'), page_context(f.name, key)))
+    if not pages:
+        print('No lovemarble*.html pages found')
+        return
+
+    def best_of(fn):
+        best = float('inf')
+        for _ in range(iterations):
+            start = time.perf_counter()
+            for text, t in pages:
+                fn(text, t)
+            best = min(best, time.perf_counter() - start)
+        return best
 
-    path.write_text(text, encoding='utf-8')
+    extra = [(f'<span class="subtitle">Pack {i} subtitle</span>', lambda t: '') for i in range(20 * len(REPLACER.rules))]
+    rounds = [
+        ('current tables', TEMPLATE_KEYS + PAGE_KEYS, REPLACER),
+        ('+synthetic keys', TEMPLATE_KEYS + PAGE_KEYS + extra,
+         MultiReplacer(TEMPLATE_KEYS + PAGE_KEYS + extra, CARD_REPLACEMENTS + PATH_REPLACEMENTS)),
+    ]
+    print(f'{len(pages)} pages, best of {iterations}:')
+    for name, keys, replacer in rounds:
+        sequential = best_of(lambda text, t: translate_text_sequential(text, t, keys))
+        single = best_of(replacer.apply)
+        differing = sum(translate_text_sequential(text, t, keys) != replacer.apply(text, t)[0] for text, t in pages)
+        print(f'  {name} ({len(replacer.rules)} rules):')
+        print(f'    sequential loop: {sequential * 1e3:8.3f} ms')
+        print(f'    single pass:     {single * 1e3:8.3f} ms  ({sequential / single:.1f}x)')
+        print(f'    outputs differing: {differing}')
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Translate lovemarble_*.html pages in place.')
+    parser.add_argument('--verbose', action='store_true', help='List the rules matched in each file')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Benchmark the replacer (N iterations) and exit')
+    parser.add_argument('--render', metavar='OUT_DIR', help='Render all pages from the English template into OUT_DIR')
+    parser.add_argument('--template', default=TEMPLATE, help=f'Template page for --render (default: {TEMPLATE})')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes for --render (default: 1, 0 = one per CPU)')
+    parser.add_argument('--force', action='store_true', help='Re-render every page, ignoring the render manifest')
+    parser.add_argument('--watch', action='store_true', help='With --render, rebuild whenever the template, tables or assets change')
+    parser.add_argument('--profile', metavar='TRACE_JSON', help='Write a Chrome trace of the run to this path')
+    parser.add_argument('--cprofile', metavar='PATH', help='Also dump cProfile stats of the main process')
+    args = parser.parse_args()
+    if args.watch and not args.render:
+        parser.error('--watch requires --render OUT_DIR')
+    if args.render and Path(args.render).resolve() == Path(args.template).resolve().parent:
+        parser.error(f'--render OUT_DIR must not be the directory of {args.template}: '
+                     'the English page would overwrite the template')
+    with tracing.profiling(args.profile, args.cprofile, 'translate_pages'):
+        _main(args)
+
+
+def _main(args):
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+
+    if args.render:
+        out_dir, template_path = Path(args.render), Path(args.template)
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        start = time.perf_counter()
+        results = render_site(out_dir, template_path, jobs, args.force)
+        report_render(out_dir, results, time.perf_counter() - start)
+        if args.watch:
+            try:
+                watch(out_dir, template_path, jobs)
+            except KeyboardInterrupt:
+                pass
+        return
+
     files = [p for p in Path('.').glob('lovemarble_*.html')]
     for f in files:
         key = FILE_LANG_MAP.get(f.name)
         if not key:
             print('Skipping', f.name)
             continue
-        translate_file(f, key)
+        translate_file(f, key, args.verbose)
 
     print('Done translating files.')
 
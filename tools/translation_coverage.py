@@ -0,0 +1,281 @@
+"""
+Report how much of each locale page is actually translated, fast enough to
+run as a pre-commit hook.
+
+Every page is parsed once into a text-node index: its visible text nodes
+(script, style, noscript and template content excluded) plus the
+translatable attributes (`alt`, `title`, `aria-label`, `placeholder`), the
+description/title `<meta>` contents and the `description` fields of the
+JSON-LD blocks, whitespace-normalized. The index is cached in `--cache`
+keyed by each file's sha256 (and INDEX_VERSION), so only pages edited since
+the last run are parsed again. Then, per locale page (see locales.py):
+  * untranslated: strings of the English page (lovemarble.html) that the
+    locale page still shows verbatim, except brand names (UNTRANSLATED_OK),
+    the language switcher and strings the locale's TRANSLATIONS entry
+    itself uses;
+  * orphaned: TRANSLATIONS keys whose text never reaches the page, either
+    because no rule uses the key or because the rule's English original is
+    not in the page (`translate_file` silently skips those);
+  * duplicated: keys written twice in the locale's TRANSLATIONS literal
+    (Python keeps the last one without a word);
+  * missing: keys the rules read that the locale does not define.
+Literal rules whose English original no longer occurs in lovemarble.html
+are listed once, since they orphan their keys in every locale.
+
+Pre-commit hook (`.git/hooks/pre-commit`):
+  python tools/translation_coverage.py --check --quiet
+
+Usage:
+  python tools/translation_coverage.py [--pages-dir .] [--cache PATH] [--verbose] [--quiet] [--check]
+
+Options:
+  --pages-dir     Directory holding lovemarble.html and the locale pages (default: .)
+  --cache         Text-node index file (default: <pages-dir>/.translation-index.json)
+  --verbose       List every untranslated string and orphaned key
+  --quiet         Only print pages with issues and the summary
+  --check         Exit with status 1 when any page has issues
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import re
+import sys
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+
+import locales
+import translate_pages
+
+INDEX_NAME = '.translation-index.json'
+# Bump when text_nodes changes what it collects, so cached entries are re-parsed
+INDEX_VERSION = '2'
+SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+# The language switcher lists every locale by its own name
+SKIP_CLASSES = {'lang-links'}
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+TEXT_ATTRS = ('alt', 'title', 'aria-label', 'placeholder')
+LD_DESCRIPTION_RE = re.compile(r'"description"\s*:\s*("(?:[^"\\]|\\.)*")')
+META_NAMES = {'description', 'og:title', 'og:description', 'twitter:title', 'twitter:description'}
+# Shown verbatim on every page by design
+UNTRANSLATED_OK = {'TERRION', 'Love', 'Marble', 'Love Marble', '© 2026 TERRION Games.'}
+
+
+def normalize(text: str) -> str:
+    return ' '.join(text.split())
+
+
+class _TextNodes(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.nodes = []
+        self.ld_json = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'script' and attrs.get('type') == 'application/ld+json':
+            self.ld_json = []
+        skip = (tag in SKIP_TAGS or bool(SKIP_CLASSES & set((attrs.get('class') or '').split()))
+                or bool(self.stack and self.stack[-1][1]))
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, skip))
+        if skip:
+            return
+        for name in TEXT_ATTRS:
+            if attrs.get(name):
+                self._add(name, attrs[name])
+        if tag == 'meta' and (attrs.get('name') or attrs.get('property')) in META_NAMES and attrs.get('content'):
+            self._add('meta:' + (attrs.get('name') or attrs.get('property')), attrs['content'])
+
+    def handle_endtag(self, tag):
+        if tag == 'script' and self.ld_json is not None:
+            # Matched, not parsed: the pages' JSON-LD carries // comments
+            for m in LD_DESCRIPTION_RE.finditer(''.join(self.ld_json)):
+                self._add('ld:description', json.loads(m.group(1)))
+            self.ld_json = None
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                del self.stack[i:]
+                break
+
+    def handle_data(self, data):
+        if self.ld_json is not None:
+            self.ld_json.append(data)
+        elif not (self.stack and self.stack[-1][1]):
+            self._add('text', data)
+
+    def _add(self, kind, text):
+        text = normalize(text)
+        if any(c.isalpha() for c in text):
+            self.nodes.append([kind, text])
+
+
+def text_nodes(text: str):
+    """[[kind, string]] for the page's visible strings, in document order."""
+    parser = _TextNodes()
+    parser.feed(text)
+    parser.close()
+    return parser.nodes
+
+
+def duplicate_keys(source: str) -> dict:
+    """{locale: [keys written more than once]} in the TRANSLATIONS literal of `source`."""
+    out = {}
+    for node in ast.parse(source).body:
+        if not (isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'TRANSLATIONS' for t in node.targets)):
+            continue
+        seen_locales = set()
+        for key, value in zip(node.value.keys, node.value.values):
+            locale = getattr(key, 'value', None)
+            if locale in seen_locales:
+                out.setdefault(locale, []).append('(whole entry)')
+            seen_locales.add(locale)
+            if not isinstance(value, ast.Dict):
+                continue
+            seen = set()
+            for k in value.keys:
+                name = getattr(k, 'value', None)
+                if name in seen:
+                    out.setdefault(locale, []).append(name)
+                seen.add(name)
+    return out
+
+
+class TextIndex:
+    """Per-file results cached by content hash in a JSON file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        self.parsed = 0
+        try:
+            self.entries = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            pass
+
+    def get(self, file: Path, build):
+        data = file.read_bytes()
+        digest = hashlib.sha256(INDEX_VERSION.encode() + data).hexdigest()
+        key = file.name
+        entry = self.entries.get(key)
+        if entry and entry['sha256'] == digest:
+            return entry['value']
+        value = build(data.decode('utf-8'))
+        self.entries[key] = {'sha256': digest, 'value': value}
+        self.dirty = True
+        self.parsed += 1
+        return value
+
+    def save(self):
+        if self.dirty:
+            tmp = self.path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(self.entries, ensure_ascii=False, sort_keys=True), encoding='utf-8')
+            tmp.replace(self.path)
+
+
+def rule_keys(rule) -> set:
+    """TRANSLATIONS keys a replacement rule reads (string constants and defaults of its function)."""
+    fn = rule[2]
+    return {c for c in fn.__code__.co_consts + (fn.__defaults__ or ()) if isinstance(c, str)}
+
+
+def analyze(pages_dir: Path, index: TextIndex):
+    """Return (stale rule labels, {page name: issues dict}) for every locale page present."""
+    template_path = pages_dir / translate_pages.TEMPLATE
+    english = index.get(template_path, text_nodes)
+    english_strings = {text for _, text in english}
+    template = translate_pages.PageTemplate(template_path.read_text(encoding='utf-8'))
+    rules = translate_pages.REPLACER.rules
+    matched = {template.segments[i] for i in template.slots}
+    # Only literal rules must match the template; the regex rules also serve
+    # in-place runs over pages that are already translated
+    literal_rules = len(translate_pages.TEMPLATE_KEYS) + len(translate_pages.PAGE_KEYS)
+    stale = [rules[i][1] for i in range(literal_rules) if i not in matched]
+
+    table = translate_pages.TRANSLATIONS
+    all_keys = set().union(*table.values())
+    used = {i: rule_keys(rule) & all_keys for i, rule in enumerate(rules)}
+    live_keys = set().union(*(keys for i, keys in used.items() if i in matched))
+    read_keys = set().union(*used.values())
+    duplicates = index.get(Path(translate_pages.__file__), duplicate_keys)
+
+    report = {}
+    for loc in locales.LOCALES:
+        path = pages_dir / loc.page
+        if loc.translation is None or not path.exists():
+            continue
+        t = translate_pages.page_context(loc.page, loc.translation)
+        nodes = index.get(path, text_nodes)
+        shown = [text for _, text in nodes]
+        own = {normalize(str(v)) for v in t.values()}
+        untranslated = sorted({s for s in shown if s in english_strings} - UNTRANSLATED_OK - own)
+        orphaned = []
+        for key, value in sorted(table[loc.translation].items()):
+            if key == 'lang':
+                continue
+            if key not in read_keys:
+                orphaned.append((key, 'no rule uses it'))
+            elif key not in live_keys:
+                orphaned.append((key, 'its rule does not match lovemarble.html'))
+            elif not any(normalize(value) in s for s in shown):
+                orphaned.append((key, 'not on the page'))
+        report[loc.page] = {
+            'untranslated': untranslated,
+            'orphaned': orphaned,
+            'duplicated': duplicates.get(loc.translation, []),
+            'missing': sorted(read_keys - set(table[loc.translation]) - {'page', 'folder'}),
+            'strings': len(shown),
+        }
+    return stale, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report untranslated, orphaned and duplicated translation keys.')
+    parser.add_argument('--pages-dir', default='.', help='Directory with lovemarble.html and the locale pages (default: .)')
+    parser.add_argument('--cache', help=f'Text-node index file (default: <pages-dir>/{INDEX_NAME})')
+    parser.add_argument('--verbose', action='store_true', help='List every untranslated string and orphaned key')
+    parser.add_argument('--quiet', action='store_true', help='Only print pages with issues and the summary')
+    parser.add_argument('--check', action='store_true', help='Exit with status 1 when any page has issues')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pages_dir = Path(args.pages_dir)
+    if not (pages_dir / translate_pages.TEMPLATE).exists():
+        print(f"English page not found: {pages_dir / translate_pages.TEMPLATE}")
+        sys.exit(1)
+    index = TextIndex(Path(args.cache) if args.cache else pages_dir / INDEX_NAME)
+    stale, report = analyze(pages_dir, index)
+    index.save()
+
+    if stale:
+        print(f"Rules not matching {translate_pages.TEMPLATE}: {', '.join(stale)}")
+    failing = 0
+    for name, issues in report.items():
+        counts = [len(issues[k]) for k in ('untranslated', 'orphaned', 'duplicated', 'missing')]
+        failing += any(counts)
+        if args.quiet and not any(counts):
+            continue
+        translated = 1 - counts[0] / issues['strings'] if issues['strings'] else 1
+        print(f"{name:<24} {translated:6.1%} translated  {counts[0]:>3} untranslated  {counts[1]:>2} orphaned  "
+              f"{counts[2]:>2} duplicated  {counts[3]:>2} missing")
+        if args.verbose:
+            for text in issues['untranslated']:
+                print(f"    untranslated: {text}")
+            for key, reason in issues['orphaned']:
+                print(f"    orphaned: {key} ({reason})")
+        for key in issues['duplicated']:
+            print(f"    duplicated: {key}")
+        for key in issues['missing']:
+            print(f"    missing: {key}")
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Done. {len(report)} pages, {failing} with issues, {index.parsed} parsed in {elapsed:.1f} ms.")
+    if args.check and (failing or stale):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()